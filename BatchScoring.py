@@ -0,0 +1,107 @@
+# Date: 10/18/26
+# Description: This file scores many games at once with NumPy. Games are
+#   given as rows of the 21 roll layout used by ScoreSheet.getRollList,
+#   two rolls for each standard frame and three for the tenth, where -1
+#   marks a ball that was not bowled. The main function checks the batch
+#   scores against ScoreSheet.calculateScore.
+import numpy as np
+
+import ScoreSheetClass
+
+FRAME_UPPER_BOUND = 10
+MARK_SCORE = 10
+ROLL_LIST_LENGTH = 21
+TENTH_FRAME_ROLL_INDEX = 18
+UNBOWLED_VALUE = -1
+
+# games scored per step, keeps the temporary arrays a few MB in size
+DEFAULT_CHUNK_SIZE = 65536
+
+def scoreGames(rolls, chunkSize=DEFAULT_CHUNK_SIZE):
+    """
+    Scores a batch of games laid out as 21 rolls each
+    :param rolls (array): An (N x 21) integer array of rolls,
+        -1 marks a ball that was not bowled
+    :param chunkSize (int): The amount of games scored in each step
+    :return (tuple): An (N x 10) int16 array of the cumulative score
+        after each frame and an N length int16 array of total scores
+    """
+    rolls = np.asarray(rolls)
+    if rolls.ndim != 2 or rolls.shape[1] != ROLL_LIST_LENGTH:
+        raise ValueError(f"rolls must have shape (N, {ROLL_LIST_LENGTH}), got {rolls.shape}")
+
+    cumulativeScores = np.empty((rolls.shape[0], FRAME_UPPER_BOUND), dtype=np.int16)
+
+    for start in range(0, rolls.shape[0], chunkSize):
+        stop = start + chunkSize
+        frameScores = scoreFrames(rolls[start:stop])
+        np.cumsum(frameScores, axis=1, out=cumulativeScores[start:stop])
+
+    totals = cumulativeScores[:, FRAME_UPPER_BOUND - 1].copy()
+
+    return cumulativeScores, totals
+
+def scoreFrames(rolls):
+    """
+    Computes the score earned in each frame for a batch of games
+    :param rolls (array): An (N x 21) integer array of rolls
+    :return (array): An (N x 10) int16 array of frame scores
+    """
+    rolls = rolls.astype(np.int16, copy=False)
+    pins = np.maximum(rolls, 0)
+
+    # first and second slots for all ten frames, the tenth's third
+    # ball only ever counts toward the tenth frame itself
+    firstBowls = pins[:, 0:TENTH_FRAME_ROLL_INDEX + 1:2]
+    secondBowls = pins[:, 1:TENTH_FRAME_ROLL_INDEX + 2:2]
+    secondUnbowled = rolls[:, 1:TENTH_FRAME_ROLL_INDEX + 2:2] == UNBOWLED_VALUE
+
+    first = firstBowls[:, :-1]
+    second = secondBowls[:, :-1]
+    strike = first == MARK_SCORE
+    spare = ~strike & ~secondUnbowled[:, :-1] & (first + second == MARK_SCORE)
+
+    # the ball after this frame is the next frame's first ball, the one
+    # after that is the next frame's second ball unless that slot was
+    # skipped by a strike in frames 1-9, then it is the following first ball
+    nextBall = firstBowls[:, 1:]
+    followingFirst = np.zeros_like(nextBall)
+    followingFirst[:, :-1] = firstBowls[:, 2:]
+    skipsSecond = secondUnbowled[:, 1:].copy()
+    skipsSecond[:, -1] = False
+    followingBall = np.where(skipsSecond, followingFirst, secondBowls[:, 1:])
+
+    frameScores = np.empty((rolls.shape[0], FRAME_UPPER_BOUND), dtype=np.int16)
+    frameScores[:, :-1] = np.where(strike, MARK_SCORE + nextBall + followingBall,
+                                   np.where(spare, MARK_SCORE + nextBall, first + second))
+    frameScores[:, -1] = pins[:, TENTH_FRAME_ROLL_INDEX:].sum(axis=1)
+
+    return frameScores
+
+def main():
+    """
+    Main Function: Scores a few games in a batch and
+        compares them to ScoreSheet.calculateScore
+    """
+    games = np.array([
+        [10, -1, 9, 0, 5, 5, 10, -1, 0, 0, 2, 4, 10, -1, 9, 1, 10, -1, 10, 9, 1],
+        [10, -1] * 9 + [10, 10, 10],
+        [5, 5] * 9 + [5, 5, 5],
+        [0, 0] * 9 + [0, 0, -1],
+    ])
+
+    cumulativeScores, totals = scoreGames(games)
+
+    for i in range(len(games)):
+        scoreSheet = ScoreSheetClass.ScoreSheet()
+        for roll in games[i]:
+            if roll != UNBOWLED_VALUE:
+                scoreSheet.addBowl(int(roll))
+
+        print(f"Game {i + 1}: batch {totals[i]}, score sheet {scoreSheet.calculateScore()}")
+        print("\tFrames: " + " ".join(str(score) for score in cumulativeScores[i]))
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ WELCOME_MESSAGE = "Bowling Score Sheet Simulation, \n\tPRESS ENTER TO CONTINUE"
 
 # menu text
 FIRST_MENU_OPTION = "Score Bowling Game"
+SECOND_MENU_OPTION = "Score Bowling Game (live display)"
 EXIT_MENU_OPTION = "Exit Simulation"
 PROMPT_MENU_CHOICE = "Please enter an option (1, 2, etc.) or enter X to exit: "
 ERROR_INVALID_CHOICE = "Error: Invalid menu choice"
@@ -21,11 +22,12 @@ SHOT_SCORE_PROMPT_LINE_TWO = "(use pin #'s and X for pin 10, do not include spac
 
 # menu values
 VALUE_FIRST_MENU = "1"
+VALUE_SECOND_MENU = "2"
 VALUE_EXIT_MENU = "X"
 
 # choice values align with the min and max numbers displayed in the menu
 LOW_CHOICE_VALUE = 1
-HIGH_CHOICE_VALUE = 1
+HIGH_CHOICE_VALUE = 2
 
 # bowling values
 PIN_LOWER_BOUND = 1
@@ -46,9 +48,14 @@ for x in range(PIN_LOWER_BOUND, PIN_UPPER_BOUND):
     PIN_RACK_LABELS.append(str(x))
 PIN_RACK_LABELS.append("X")
 
-from FrameClass import Frame, TenthFrame
-from ScoreSheetClass import ScoreSheet
-from PinRackClass import PinRack
+import sys
+
+from PinRackClass import getRackRender
+from GameEngineClass import GameEngine
+from LiveDisplayClass import LiveDisplay, renderLaneScreen, inputWaiting
+from PinStringParser import parsePinString, PinStringError
+import GameIngest
+import Instrumentation
 
 def displayMenu():
     """
@@ -56,163 +63,92 @@ def displayMenu():
     Takes no parameters and returns no values
     """
     print("1. " + FIRST_MENU_OPTION)
+    print("2. " + SECOND_MENU_OPTION)
     print("X. " + EXIT_MENU_OPTION)
 
     return
 
-def getPinsInput(pinRack, firstBowl, thirdBowl=False):
+@Instrumentation.timed("pin_inputs")
+def getPinsInput(ball):
     """
     Function prompts for pins that were knocked down in a shot
-        and updates the pin dictionary accordingly
-    :param pinRack (PinRack): A PinRack object to keep track of which pins are downed
-    :param firstBowl (booelan): True if collecting input for the first bowl
-    :return: None
+    :param ball (int): The index of the ball in the frame, 0-2
+    :return (int): A mask with bit (pin - 1) set for each pin knocked down
     """
-
-    # create a list for user input string
-    pinsDownList = []
-
     pinError = True
 
     while pinError:
-        if firstBowl:
+        if ball == FIRST_SHOT_INDEX:
             pinsDownedInput = input(SHOT_SCORE_PROMPT_LINE_ONE_B1 +
                                     "\n\t" + SHOT_SCORE_PROMPT_LINE_TWO)
-        elif (not firstBowl) and (not thirdBowl):
+        elif ball == SECOND_SHOT_INDEX:
             pinsDownedInput = input(SHOT_SCORE_PROMPT_LINE_ONE_B2 +
                                     "\n\t" + SHOT_SCORE_PROMPT_LINE_TWO)
-        elif thirdBowl:
+        else:
             pinsDownedInput = input(SHOT_SCORE_PROMPT_LINE_ONE_B3 +
                                     "\n\t" + SHOT_SCORE_PROMPT_LINE_TWO)
 
-        if pinsDownedInput == "":
+        # convert the string into a mask of pins (account for pin 10 as 'X')
+        try:
+            pinsDownedMask = parsePinString(pinsDownedInput)
+        except PinStringError as error:
+            print(ERROR_INVALID_ENTRY)
+            print(error)
+        else:
             pinError = False
 
-        # loop through the string and convert into a list (account for pin 10 as 'X')
-        for char in pinsDownedInput:
-            if char in PIN_RACK_LABELS:
-                if char == 'X':
-                    pinsDownList.append(int(PIN_UPPER_BOUND))
-                    pinRack.setPin(PIN_UPPER_BOUND, PIN_DOWN_VALUE)
-                    pinError = False
-                else:
-                    try:
-                        pinsDownList.append(int(char))
-                    except ValueError:
-                        print(ERROR_INVALID_ENTRY)
-                        print(char)
-                    else:
-                        for pin in pinsDownList:
-                            if pin not in PIN_LABELS:
-                                print(ERROR_INVALID_ENTRY)
-                            else:
-                                pinRack.setPin(pin, PIN_DOWN_VALUE)
-                                pinError = False
-
-            else:
-                print(ERROR_INVALID_ENTRY)
-
-    return
+    return pinsDownedMask
 
+@Instrumentation.profiled
+@Instrumentation.timed("games")
 def simulateGame():
     """
     Function carries out a game of bowling with user
         prompts and displays of pins
     :return: None
     """
-    # create score sheet for frames
-    frameScores = ScoreSheet()
+    # the engine keeps the score sheet and pin rack for the game
+    engine = GameEngine()
 
-    pinRack = PinRack()
+    while not engine.getCompleteGame():
+        frame = engine.getFrame()
+        state = engine.bowlMask(getPinsInput(engine.getBall()))
 
-    # simulate the nine standard frames
-    for frame in range(STANDARD_FRAME_COUNT):
-        standardFrame(pinRack, frameScores, frame)
+        # show the pins this ball left before the rack is reset
+        if frame == TENTH_FRAME_INDEX:
+            engine.getScoreSheet().displayScoreSheet()
+        print(getRackRender(state.leave))
 
-        frameScores.displayScoreSheet()
-        print()
+        # the standard frames show the score sheet once they are finished
+        if frame < TENTH_FRAME_INDEX and state.frame != frame:
+            engine.getScoreSheet().displayScoreSheet()
+            print(f"Score: {state.score}, Max possible: {engine.getScoreSheet().getMaxPossibleScore()}")
+            print()
 
-        pinRack.resetPins()
-
-    # simulate unique tenth frame
-    tenthFrame(pinRack, frameScores)
-
-    frameScores.displayScoreSheet()
+    engine.getScoreSheet().displayScoreSheet()
 
     return
 
-def standardFrame(pinRack, frameScores, frame):
+@Instrumentation.profiled
+@Instrumentation.timed("games")
+def simulateLiveGame():
     """
-    Function simulates a standard frame (frames 1-9) in a bowling game
-    :param pinRack (PinRack): A pinRack object
-    :param frameScores (ScoreSheet): The current ScoreSheet
-        object for the game of bowling
-    :param frame: The index value for the current frame
-    :return:
+    Function carries out a game of bowling with user prompts, keeping
+        one score sheet and pin rack on screen that is updated in place
+    :return: None
     """
-    # first shot
-    firstBowl = True
-    getPinsInput(pinRack, firstBowl)
-    firstShotScore = pinRack.getPinScore()
-    frameScores.getNthFrame(frame).setFirstBowl(firstShotScore)
-    print(str(pinRack))
-
-    if not frameScores.getNthFrame(frame).getStrike():
-        firstBowl = False
-        # second shot
-        getPinsInput(pinRack, firstBowl)
-        secondShotScore = pinRack.getPinScore()
-        frameScores.getNthFrame(frame).setSecondBowl(secondShotScore - firstShotScore)
-        print(str(pinRack))
+    engine = GameEngine()
+    display = LiveDisplay()
 
-    return
-
-def tenthFrame(pinRack, frameScores):
-    """
-    Function simulates a standard frame (frames 1-9) in a bowling game
-    :param pinRack (PinRack): A pinRack object
-    :param frameScores (ScoreSheet): The current ScoreSheet
-        object for the game of bowling
-    :return:
-    """
-    firstBowl = True
-
-    # first shot
-    getPinsInput(pinRack, firstBowl)
-    firstShotScore = pinRack.getPinScore()
-    frameScores.getNthFrame(TENTH_FRAME_INDEX).setFirstBowl(firstShotScore)
-    frameScores.displayScoreSheet()
-    print(str(pinRack))
-    print()
-
-    # second shot
-    firstBowl = False
-    if frameScores.getNthFrame(TENTH_FRAME_INDEX).getFirstStrike():
-        pinRack.resetPins()
-        getPinsInput(pinRack, firstBowl)
-        secondShotScore = pinRack.getPinScore()
-        frameScores.getNthFrame(TENTH_FRAME_INDEX).setSecondBowl(secondShotScore)
+    display.update(renderLaneScreen(engine.getScoreSheet(), engine.getState().leave))
+    while not engine.getCompleteGame():
+        state = engine.bowlMask(getPinsInput(engine.getBall()))
+        display.update(renderLaneScreen(engine.getScoreSheet(), state.leave))
 
-    else:
-        getPinsInput(pinRack, firstBowl)
-        secondShotScore = pinRack.getPinScore()
-        frameScores.getNthFrame(TENTH_FRAME_INDEX).setSecondBowl(secondShotScore - firstShotScore)
-
-    frameScores.displayScoreSheet()
-    print(str(pinRack))
-    print()
-
-    # third bowl
-    thirdBowl = True
-    if (frameScores.getNthFrame(TENTH_FRAME_INDEX).getSecondStrike()
-            or frameScores.getNthFrame(TENTH_FRAME_INDEX).getSpare()):
-        pinRack.resetPins()
-        getPinsInput(pinRack, firstBowl, thirdBowl)
-        thirdShotScore = pinRack.getPinScore()
-        frameScores.getNthFrame(TENTH_FRAME_INDEX).setThirdBowl(thirdShotScore)
-
-    frameScores.setCompleteGame(True)
-    print(str(pinRack))
+        # a screen held back during a burst is drawn once the input stops
+        if not inputWaiting(sys.stdin):
+            display.flush()
+    display.flush()
 
     return
 
@@ -253,8 +189,25 @@ def main():
         # execute the code for each menu option
         if menuChoice == VALUE_FIRST_MENU:
             simulateGame()
+        elif menuChoice == VALUE_SECOND_MENU:
+            simulateLiveGame()
+
+    return
+
+def ingestMain(argv):
+    """
+    Non-interactive entry point: scores the games in the files
+        given on the command line instead of prompting for pins
+    :param argv (list): The command line arguments after the program name
+    :return: None
+    """
+    GameIngest.main(argv)
 
     return
 
 if __name__ == "__main__":
-    main()
+    # score game files when given any, otherwise run the interactive menu
+    if len(sys.argv) > 1:
+        ingestMain(sys.argv[1:])
+    else:
+        main()
@@ -8,6 +8,9 @@ PIN_LOWER_BOUND = 0
 PIN_UPPER_BOUND = 10
 
 class Frame:
+    # fixed attributes instead of a per-instance __dict__
+    __slots__ = ("bowled", "firstBowl", "secondBowl", "frameScore", "strike", "spare")
+
     def __init__(self, firstBowl=-1, secondBowl=-1):
         """
         Constructor:
@@ -182,6 +185,8 @@ class Frame:
         return result
 
 class TenthFrame(Frame):
+    __slots__ = ("thirdBowl", "firstStrike", "secondStrike", "thirdStrike")
+
     def __init__(self, firstBowl=-1, secondBowl=-1, thirdBowl=-1):
         """
         Constructor
@@ -0,0 +1,183 @@
+# Date: 10/18/26
+# Description: This file contains a class that runs one game of bowling
+#   without any input or output. Each ball is pushed into the engine as a
+#   pin count or a mask of pins knocked down, and the new state of the
+#   game is returned. The main function gives a demonstration of the class.
+from collections import namedtuple
+
+from PinRackClass import CompactPinRack, PIN_MASK_COUNT, PIN_SCORE_TABLE, FULL_RACK_MASK, EMPTY_RACK_MASK
+from ScoreSheetClass import ScoreSheet, MARK_SCORE
+
+# state returned after every ball: frame and ball are the indexes of the
+# next ball, pinsStanding is the rack for the next ball and leave is the
+# rack this ball left before it was reset
+GameState = namedtuple("GameState",
+                       ["frame", "ball", "complete", "pinsStanding", "leave", "score"])
+
+class GameEngine:
+    def __init__(self, bowler=None, leaderboard=None, leaveStats=None):
+        """
+        Constructor:
+        Creates an empty score sheet and a full rack of pins
+        :param bowler (str): The name of the bowler, used on the
+            leaderboard and in the leave statistics
+        :param leaderboard (Leaderboard): The leaderboard updated after
+            every ball, or None
+        :param leaveStats (LeaveStats): The leave statistics every ball
+            is recorded in, or None
+        """
+        self.scoreSheet = ScoreSheet()
+        self.pinRack = CompactPinRack()
+        self.leave = FULL_RACK_MASK
+        self.bowler = bowler
+        self.leaderboard = leaderboard
+        self.gameKey = leaderboard.startGame(bowler) if leaderboard is not None else None
+        self.leaveStats = leaveStats
+        self.freshRack = True
+
+    def getScoreSheet(self):
+        """
+        Getter for the score sheet of the game
+        :return (ScoreSheet): The score sheet
+        """
+        return self.scoreSheet
+
+    def getBowler(self):
+        """
+        Getter for the name of the bowler
+        :return (str): The name, None if it was not given
+        """
+        return self.bowler
+
+    def getGameKey(self):
+        """
+        Getter for the key of this game on the leaderboard
+        :return (tuple): The key, None without a leaderboard
+        """
+        return self.gameKey
+
+    def getPinRack(self):
+        """
+        Getter for the rack the next ball is bowled at
+        :return (CompactPinRack): The pin rack
+        """
+        return self.pinRack
+
+    def getFrame(self):
+        """
+        Getter for the index of the frame the next ball belongs to
+        :return (int): The frame index from 0-9
+        """
+        return self.scoreSheet.getCurrentFrame()
+
+    def getBall(self):
+        """
+        Getter for the index of the next ball inside the current frame
+        :return (int): 0 for the first ball, 1 for the second, 2 for the third
+        """
+        return self.scoreSheet.getCurrentBall()
+
+    def getCompleteGame(self):
+        """
+        Getter for whether the game has been fully bowled
+        :return (boolean): True if the game is finished, False otherwise
+        """
+        return self.scoreSheet.getCompleteGame()
+
+    def getPinsStanding(self):
+        """
+        Getter for the pins standing for the next ball
+        :return (int): A mask with bit (pin - 1) set for each standing pin
+        """
+        return self.pinRack.getPinMask()
+
+    def getScore(self):
+        """
+        Getter for the running score of the game
+        :return (int): The score including every bonus earned so far
+        """
+        return self.scoreSheet.getRunningScore()
+
+    def getState(self):
+        """
+        Returns the current state of the game
+        :return (GameState): The state of the game
+        """
+        return GameState(self.scoreSheet.getCurrentFrame(), self.scoreSheet.getCurrentBall(),
+                         self.scoreSheet.getCompleteGame(), self.pinRack.getPinMask(),
+                         self.leave, self.scoreSheet.getRunningScore())
+
+    def bowl(self, pinsDowned):
+        """
+        Records a ball from the amount of pins knocked down,
+            the lowest numbered standing pins are the ones knocked down
+        :param pinsDowned (int): The pins knocked down by the ball
+        :return (GameState): The state of the game after the ball
+        """
+        standing = self.pinRack.getPinMask()
+        if not isinstance(pinsDowned, int) or not 0 <= pinsDowned <= MARK_SCORE - PIN_SCORE_TABLE[standing]:
+            raise ValueError(f"cannot knock down {pinsDowned!r} pins with "
+                             f"{MARK_SCORE - PIN_SCORE_TABLE[standing]} standing")
+
+        # take the lowest set bits of the standing mask
+        downedMask = 0
+        for i in range(pinsDowned):
+            lowestPin = standing & -standing
+            downedMask |= lowestPin
+            standing ^= lowestPin
+
+        return self.bowlMask(downedMask)
+
+    def bowlMask(self, mask):
+        """
+        Records a ball from a mask of the pins knocked down,
+            pins in the mask that were already down are ignored
+        :param mask (int): A mask with bit (pin - 1) set for each pin knocked down
+        :return (GameState): The state of the game after the ball
+        """
+        if not isinstance(mask, int) or not 0 <= mask < PIN_MASK_COUNT:
+            raise ValueError(f"{mask!r} is not a 10-pin mask")
+        if self.scoreSheet.getCompleteGame():
+            raise ValueError("the game is already complete")
+
+        standing = self.pinRack.getPinMask()
+        self.leave = standing & ~mask
+        self.scoreSheet.addBowl(PIN_SCORE_TABLE[self.leave] - PIN_SCORE_TABLE[standing])
+
+        if self.leaveStats is not None:
+            self.leaveStats.recordBall(self.bowler, standing, self.leave, self.freshRack)
+        # a new rack is set for a new frame or after a mark in the tenth
+        self.freshRack = self.scoreSheet.getCurrentBall() == 0 or self.leave == EMPTY_RACK_MASK
+
+        # the score sheet knows when a new rack is set
+        if self.scoreSheet.getCompleteGame():
+            self.pinRack.setPinMask(self.leave)
+        elif self.scoreSheet.getPinsStanding() == MARK_SCORE:
+            self.pinRack.resetPins()
+        else:
+            self.pinRack.setPinMask(self.leave)
+
+        if self.leaderboard is not None:
+            self.leaderboard.recordScoreSheet(self.gameKey, self.scoreSheet)
+
+        return self.getState()
+
+def main():
+    engine = GameEngine()
+
+    # a strike, an open frame, a converted 7-10 split, then gutter balls
+    print(engine.bowl(10))
+    print(engine.bowl(7))
+    print(engine.bowl(2))
+    print(engine.bowlMask(0b0110111111))
+    print(engine.bowlMask(0b1001000000))
+    while not engine.getCompleteGame():
+        state = engine.bowl(0)
+
+    print(state)
+    engine.getScoreSheet().displayScoreSheet()
+
+    return
+
+if __name__ == "__main__":
+    main()
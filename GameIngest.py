@@ -0,0 +1,194 @@
+# Date: 10/18/26
+# Description: This file reads games from text or CSV files with one game
+#   per line and scores them as it goes. Only one line is held in memory
+#   at a time so files of any size can be scored. The main function is
+#   the command line entry point for scoring a file.
+import argparse
+import re
+import sys
+from collections import namedtuple
+
+import ScoreSheetClass
+
+MARK_SCORE = 10
+TENTH_FRAME_INDEX = 9
+UNBOWLED_VALUE = -1
+STRIKE_SYMBOL = "X"
+SPARE_SYMBOL = "/"
+GUTTER_SYMBOL = "-"
+COMMENT_PREFIX = "#"
+STDIN_PATH = "-"
+
+# rolls can be separated by commas, semicolons or whitespace
+TOKEN_SEPARATOR = re.compile(r"[,;\s]+")
+
+# result yielded for every game read from a file
+ScoredGame = namedtuple("ScoredGame",
+                        ["lineNumber", "totalScore", "cumulativeScores", "complete"])
+
+def parseGameLine(line):
+    """
+    Converts one line of a game file into the balls bowled. Rolls may be
+        numbers, X for a strike, / for a spare and - for a gutter ball.
+        A -1 is skipped so the 21 roll layout of ScoreSheet.getRollList
+        can be read as well
+    :param line (str): The text of the line
+    :return (list): The pins knocked down by each ball in order
+    """
+    balls = []
+
+    # the frame and ball are followed so a spare can only close an open rack
+    frame = 0
+    ball = 0
+    standing = MARK_SCORE
+
+    for token in TOKEN_SEPARATOR.split(line.strip()):
+        if token == "":
+            continue
+        token = token.upper()
+        if token == STRIKE_SYMBOL:
+            pins = MARK_SCORE
+        elif token == SPARE_SYMBOL:
+            if ball == 0 or standing == MARK_SCORE:
+                raise ValueError(f"spare symbol on ball {len(balls) + 1} does not follow "
+                                 "the first ball of an open rack")
+            pins = standing
+        elif token == GUTTER_SYMBOL:
+            pins = 0
+        else:
+            try:
+                pins = int(token)
+            except ValueError:
+                raise ValueError(f"invalid roll {token!r}") from None
+            if pins == UNBOWLED_VALUE:
+                continue
+        balls.append(pins)
+
+        standing -= pins
+        if frame < TENTH_FRAME_INDEX:
+            if ball == 0 and standing > 0:
+                ball = 1
+            else:
+                frame += 1
+                ball = 0
+                standing = MARK_SCORE
+        else:
+            # the tenth frame sets a new rack after every strike or spare
+            ball += 1
+            if standing <= 0:
+                standing = MARK_SCORE
+
+    return balls
+
+def scoreBalls(balls):
+    """
+    Scores a sequence of balls with the ScoreSheet scoring rules
+    :param balls (list): The pins knocked down by each ball in order
+    :return (ScoreSheet): The score sheet after every ball is recorded
+    """
+    scoreSheet = ScoreSheetClass.ScoreSheet()
+
+    for i in range(len(balls)):
+        if not scoreSheet.addBowl(balls[i]):
+            raise ValueError(f"ball {i + 1} ({balls[i]}) is not a valid roll")
+
+    return scoreSheet
+
+def readGames(lines, skipInvalid=False):
+    """
+    Generator that scores each game as it is read. Blank lines and
+        lines starting with # are ignored
+    :param lines (iterable): An open file or any other iterable of lines
+    :param skipInvalid (boolean): True to skip lines that are not valid
+        games instead of raising an error
+    :return (generator): A ScoredGame for every game in the input
+    """
+    lineNumber = 0
+
+    for line in lines:
+        lineNumber += 1
+        line = line.strip()
+        if line == "" or line.startswith(COMMENT_PREFIX):
+            continue
+
+        try:
+            scoreSheet = scoreBalls(parseGameLine(line))
+        except ValueError as error:
+            if skipInvalid:
+                continue
+            raise ValueError(f"Line {lineNumber}: {error}") from None
+
+        cumulativeScores = tuple(scoreSheet.getCumulativeScore(i)
+                                 for i in range(ScoreSheetClass.FRAME_UPPER_BOUND))
+
+        yield ScoredGame(lineNumber, scoreSheet.getRunningScore(),
+                         cumulativeScores, scoreSheet.getCompleteGame())
+
+def readGameFile(path, skipInvalid=False):
+    """
+    Generator that opens a game file and scores it line by line
+    :param path (str): The path of the file, or - for standard input
+    :param skipInvalid (boolean): True to skip lines that are not valid games
+    :return (generator): A ScoredGame for every game in the file
+    """
+    if path == STDIN_PATH:
+        yield from readGames(sys.stdin, skipInvalid)
+    else:
+        with open(path, newline="") as gameFile:
+            yield from readGames(gameFile, skipInvalid)
+
+def formatScoredGame(game):
+    """
+    Formats a scored game as a line of CSV output
+    :param game (ScoredGame): The scored game
+    :return (str): The line number, total, completion and frame scores
+    """
+    fields = [str(game.lineNumber), str(game.totalScore), str(int(game.complete))]
+    fields.extend(str(score) for score in game.cumulativeScores)
+
+    return ",".join(fields) + "\n"
+
+def main(argv=None):
+    """
+    Command line entry point: scores every game in the given files and
+        writes one CSV line per game. An invalid line, without
+        --skip-invalid, is reported on standard error with exit status 1
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Score bowling games from files, one game per line")
+    parser.add_argument("paths", nargs="+", help="game files to score, - for standard input")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="skip lines that are not valid games")
+    parser.add_argument("--summary", action="store_true",
+                        help="only print the complete game count, average score and incomplete game count")
+    args = parser.parse_args(argv)
+
+    gameCount = 0
+    incompleteCount = 0
+    scoreTotal = 0
+
+    try:
+        for path in args.paths:
+            for game in readGameFile(path, args.skip_invalid):
+                # games that are not finished are listed but left out of the average
+                if game.complete:
+                    gameCount += 1
+                    scoreTotal += game.totalScore
+                else:
+                    incompleteCount += 1
+                if not args.summary:
+                    sys.stdout.write(formatScoredGame(game))
+    except ValueError as error:
+        # readGames puts the line number in the message
+        print(error, file=sys.stderr)
+        sys.exit(1)
+
+    if args.summary:
+        average = scoreTotal / gameCount if gameCount else 0
+        print(f"Games: {gameCount}, Average: {average:.2f}, Incomplete: {incompleteCount}")
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+# Date: 10/18/26
+# Description: This file reads and writes a fixed width binary format for
+#   archived games. A 16 byte header is followed by one record per game:
+#   the 21 rolls of the ScoreSheet.getRollList layout as signed bytes, and
+#   optionally a pad byte and the 21 pin leaves as 16-bit masks. The reader
+#   memory maps the file so records are read without copying them. The
+#   main function gives a demonstration.
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+import numpy as np
+
+import BatchScoring
+import ScoreSheetClass
+from GameEngineClass import GameEngine
+
+MAGIC = b"BWLG"
+FORMAT_VERSION = 1
+HEADER_FORMAT = "<4sHHHH4x"  # magic, version, flags, record size, rolls per record
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+LEAVES_FLAG = 1
+
+ROLL_LIST_LENGTH = ScoreSheetClass.ROLL_LIST_LENGTH
+UNBOWLED_VALUE = ScoreSheetClass.UNBOWLED_VALUE
+UNBOWLED_LEAVE = 0xFFFF
+ROLLS_SIZE = ROLL_LIST_LENGTH
+LEAVES_OFFSET = ROLLS_SIZE + 1  # one pad byte keeps the leaves 2-byte aligned
+RECORD_SIZE = ROLLS_SIZE
+RECORD_SIZE_WITH_LEAVES = LEAVES_OFFSET + 2 * ROLL_LIST_LENGTH
+
+class GameRecordWriter:
+    def __init__(self, path, includeLeaves=False):
+        """
+        Constructor:
+        Creates the file and writes its header
+        :param path (str): The path of the file to write
+        :param includeLeaves (boolean): True to store the pin leave of every ball
+        """
+        self.includeLeaves = includeLeaves
+        self.recordSize = RECORD_SIZE_WITH_LEAVES if includeLeaves else RECORD_SIZE
+        self.recordCount = 0
+        self.file = open(path, "wb")
+        self.file.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION,
+                                    LEAVES_FLAG if includeLeaves else 0,
+                                    self.recordSize, ROLL_LIST_LENGTH))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+        return False
+
+    def writeGame(self, rolls, leaves=None):
+        """
+        Appends one game
+        :param rolls (list): The 21 rolls of the game, -1 is not bowled
+        :param leaves (list): The 21 pin masks left standing after each
+            roll, only used when the file includes leaves
+        :return: None
+        """
+        if len(rolls) != ROLL_LIST_LENGTH:
+            raise ValueError(f"a game needs {ROLL_LIST_LENGTH} rolls, got {len(rolls)}")
+
+        self.file.write(array("b", rolls).tobytes())
+
+        if self.includeLeaves:
+            if leaves is None:
+                leaves = [UNBOWLED_LEAVE] * ROLL_LIST_LENGTH
+            elif len(leaves) != ROLL_LIST_LENGTH:
+                raise ValueError(f"a game needs {ROLL_LIST_LENGTH} leaves, got {len(leaves)}")
+            self.file.write(b"\0" + struct.pack(f"<{ROLL_LIST_LENGTH}H", *leaves))
+
+        self.recordCount += 1
+
+        return
+
+    def writeScoreSheet(self, scoreSheet):
+        """
+        Appends the game of a ScoreSheet, without pin leaves
+        :param scoreSheet (ScoreSheet): The score sheet to write
+        :return: None
+        """
+        self.writeGame(scoreSheet.getRollList())
+
+        return
+
+    def writeRollArray(self, rolls):
+        """
+        Appends a batch of games from an (N x 21) NumPy array of rolls,
+            only for files without pin leaves
+        :param rolls (array): An (N x 21) integer array of rolls
+        :return: None
+        """
+        if self.includeLeaves:
+            raise ValueError("writeRollArray cannot write pin leaves")
+
+        rolls = np.ascontiguousarray(rolls, dtype=np.int8)
+        self.file.write(rolls.tobytes())
+        self.recordCount += rolls.shape[0]
+
+        return
+
+    def getRecordCount(self):
+        """
+        Getter for the amount of games written
+        :return (int): The amount of games
+        """
+        return self.recordCount
+
+    def close(self):
+        """
+        Flushes and closes the file
+        :return: None
+        """
+        self.file.close()
+
+        return
+
+class GameRecordReader:
+    def __init__(self, path):
+        """
+        Constructor:
+        Memory maps a game record file and checks its header
+        :param path (str): The path of the file to read
+        """
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"{path} is empty") from None
+        self.view = memoryview(self.map)
+
+        if len(self.map) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{path} is too short to be a game record file")
+        magic, version, flags, self.recordSize, rollCount = struct.unpack_from(HEADER_FORMAT, self.map)
+        self.includeLeaves = bool(flags & LEAVES_FLAG)
+        expectedSize = RECORD_SIZE_WITH_LEAVES if self.includeLeaves else RECORD_SIZE
+        if magic != MAGIC or version != FORMAT_VERSION or rollCount != ROLL_LIST_LENGTH \
+                or self.recordSize != expectedSize:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} game record file")
+
+        self.recordCount = (len(self.map) - HEADER_SIZE) // self.recordSize
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+        return False
+
+    def __len__(self):
+        """
+        Returns the amount of games in the file
+        :return (int): The amount of games
+        """
+        return self.recordCount
+
+    def getIncludeLeaves(self):
+        """
+        Getter for whether the file stores the pin leave of every ball
+        :return (boolean): True if the file has pin leaves
+        """
+        return self.includeLeaves
+
+    def getRolls(self, index):
+        """
+        Returns the rolls of one game without copying them
+        :param index (int): The index of the game
+        :return (memoryview): The 21 rolls as signed bytes, -1 is not bowled
+        """
+        if not 0 <= index < self.recordCount:
+            raise IndexError("record index out of range")
+
+        start = HEADER_SIZE + index * self.recordSize
+
+        return self.view[start:start + ROLLS_SIZE].cast("b")
+
+    def getLeaves(self, index):
+        """
+        Returns the pin leaves of one game without copying them
+        :param index (int): The index of the game
+        :return (memoryview): The 21 pin masks left standing after each
+            roll as unsigned 16-bit values, 0xFFFF is not bowled
+        """
+        if not self.includeLeaves:
+            raise ValueError("this file does not store pin leaves")
+        if not 0 <= index < self.recordCount:
+            raise IndexError("record index out of range")
+
+        start = HEADER_SIZE + index * self.recordSize + LEAVES_OFFSET
+
+        return self.view[start:start + 2 * ROLL_LIST_LENGTH].cast("H")
+
+    def getScoreSheet(self, index):
+        """
+        Returns a ScoreSheet wrapping the rolls of one game, its frames
+            are only created if getNthFrame is called
+        :param index (int): The index of the game
+        :return (ScoreSheet): The score sheet of the game
+        """
+        return ScoreSheetClass.ScoreSheet(self.getRolls(index))
+
+    def iterRolls(self):
+        """
+        Generator for the rolls of every game in file order
+        :return (generator): A memoryview of 21 rolls for each game
+        """
+        for index in range(self.recordCount):
+            yield self.getRolls(index)
+
+    def asNumpy(self):
+        """
+        Returns the records as NumPy arrays that share the mapped memory
+        :return (tuple): The (N x 21) int8 rolls, and the (N x 21) uint16
+            leaves or None when the file has no leaves
+        """
+        if self.includeLeaves:
+            recordType = np.dtype([("rolls", np.int8, (ROLL_LIST_LENGTH,)), ("pad", np.uint8),
+                                   ("leaves", "<u2", (ROLL_LIST_LENGTH,))])
+        else:
+            recordType = np.dtype([("rolls", np.int8, (ROLL_LIST_LENGTH,))])
+
+        records = np.frombuffer(self.map, dtype=recordType, count=self.recordCount, offset=HEADER_SIZE)
+
+        return records["rolls"], records["leaves"] if self.includeLeaves else None
+
+    def scoreAll(self):
+        """
+        Scores every game in the file with BatchScoring
+        :return (tuple): The (N x 10) cumulative frame scores and N totals
+        """
+        return BatchScoring.scoreGames(self.asNumpy()[0])
+
+    def close(self):
+        """
+        Unmaps and closes the file. While memoryviews or arrays taken
+            from the reader are still alive the mapping is left for the
+            garbage collector to unmap once the last of them is released
+        :return: None
+        """
+        try:
+            self.view.release()
+            self.map.close()
+        except BufferError:
+            pass
+        finally:
+            self.file.close()
+
+        return
+
+def recordGame(balls):
+    """
+    Bowls a game on a GameEngine and collects its rolls and pin leaves
+    :param balls (list): The pin masks knocked down by each ball in order
+    :return (tuple): The 21 rolls and the 21 pin leaves of the game
+    """
+    engine = GameEngine()
+    leaves = [UNBOWLED_LEAVE] * ROLL_LIST_LENGTH
+
+    for mask in balls:
+        slot = 2 * engine.getFrame() + engine.getBall()
+        leaves[slot] = engine.bowlMask(mask).leave
+
+    return engine.getScoreSheet().getRollList(), leaves
+
+def main():
+    path = os.path.join(tempfile.gettempdir(), "example_games.bwl")
+    perfectGame = [0b1111111111] * 12
+    splitGame = [0b0110111111, 0b1001000000] * 10 + [0b1111111111]
+
+    with GameRecordWriter(path, includeLeaves=True) as writer:
+        for balls in (perfectGame, splitGame):
+            rolls, leaves = recordGame(balls)
+            writer.writeGame(rolls, leaves)
+
+    with GameRecordReader(path) as reader:
+        for index in range(len(reader)):
+            scoreSheet = reader.getScoreSheet(index)
+            print(f"Game {index + 1}: {scoreSheet.calculateScore()}, first leave {reader.getLeaves(index)[0]:#05x}")
+
+    os.remove(path)
+
+    return
+
+if __name__ == "__main__":
+    main()
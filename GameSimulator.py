@@ -0,0 +1,277 @@
+# Date: 10/18/26
+# Description: This file simulates many games at once for bowler
+#   projections. A BowlerModel gives the chance of every first ball leave
+#   over the 1024 pin rack masks, the chance of converting every leave with
+#   the second ball and the chance of knocking down each pin when the
+#   conversion is missed. Games are drawn with NumPy a frame at a time for
+#   the whole batch, laid out as the 21 rolls of ScoreSheet.getRollList and
+#   scored with BatchScoring. Every chunk of games has its own seed spawned
+#   from one SeedSequence, so results are the same with or without a
+#   process pool. The main function gives a demonstration.
+import argparse
+import math
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+import BatchScoring
+from PinRackClass import PIN_MASK_COUNT, FULL_RACK_MASK, EMPTY_RACK_MASK, PIN_SCORE_TABLE
+
+FRAME_UPPER_BOUND = 10
+PIN_UPPER_BOUND = 10
+MARK_SCORE = 10
+ROLL_LIST_LENGTH = 21
+TENTH_FRAME_ROLL_INDEX = 18
+UNBOWLED_VALUE = -1
+
+# games drawn from each spawned seed, fixed so results do not depend on the pool size
+CHUNK_GAME_COUNT = 100000
+DEFAULT_SEED = 300
+DEFAULT_GAME_COUNT = 1000000
+
+# pins standing for every mask, and the highest numbered pin of every mask
+STANDING_COUNTS = MARK_SCORE - np.array(PIN_SCORE_TABLE, dtype=np.int8)
+HIGHEST_PINS = np.array([1 << (mask.bit_length() - 1) if mask else 0
+                         for mask in range(PIN_MASK_COUNT)], dtype=np.int16)
+PIN_BITS = 1 << np.arange(PIN_UPPER_BOUND, dtype=np.int16)
+
+class BowlerModel:
+    def __init__(self, firstBallLeaves, conversionRates, pinProbability):
+        """
+        Constructor:
+        Checks and keeps the chances that describe one bowler
+        :param firstBallLeaves (array): 1024 chances, entry mask is the
+            chance the first ball leaves those pins standing, entry 0 is a strike
+        :param conversionRates (array): 1024 chances, entry mask is the
+            chance the second ball knocks down all of those pins
+        :param pinProbability (float): The chance the second ball knocks
+            down each standing pin when the conversion is missed
+        """
+        firstBallLeaves = np.asarray(firstBallLeaves, dtype=np.float64)
+        conversionRates = np.asarray(conversionRates, dtype=np.float64)
+        if firstBallLeaves.shape != (PIN_MASK_COUNT,) or conversionRates.shape != (PIN_MASK_COUNT,):
+            raise ValueError(f"leave and conversion chances need {PIN_MASK_COUNT} entries")
+        if (firstBallLeaves < 0).any() or not math.isclose(firstBallLeaves.sum(), 1.0):
+            raise ValueError("first ball leave chances must be positive and add up to 1")
+        if (conversionRates < 0).any() or (conversionRates > 1).any() or not 0 <= pinProbability <= 1:
+            raise ValueError("conversion and pin chances must be between 0 and 1")
+
+        self.firstBallLeaves = firstBallLeaves / firstBallLeaves.sum()
+        self.cumulativeLeaves = np.cumsum(self.firstBallLeaves)
+        self.cumulativeLeaves[-1] = 1.0
+        self.conversionRates = conversionRates
+        self.pinProbability = pinProbability
+
+    def getFirstBallLeaves(self):
+        """
+        Getter for the chance of every first ball leave
+        :return (array): 1024 chances indexed by the mask left standing
+        """
+        return self.firstBallLeaves
+
+    def getConversionRates(self):
+        """
+        Getter for the chance of converting every leave
+        :return (array): 1024 chances indexed by the mask standing
+        """
+        return self.conversionRates
+
+    def getPinProbability(self):
+        """
+        Getter for the chance of knocking down each pin on a missed conversion
+        :return (float): The chance for one pin
+        """
+        return self.pinProbability
+
+    def getStrikeRate(self):
+        """
+        Returns the chance of a strike on a full rack
+        :return (float): The strike chance
+        """
+        return float(self.firstBallLeaves[EMPTY_RACK_MASK])
+
+    def drawFirstBalls(self, generator, count):
+        """
+        Draws the leaves of first balls bowled at a full rack
+        :param generator (Generator): The NumPy random generator
+        :param count (int): The amount of balls
+        :return (array): The masks left standing
+        """
+        leaves = np.searchsorted(self.cumulativeLeaves, generator.random(count), side="right")
+
+        return np.minimum(leaves, FULL_RACK_MASK).astype(np.int16)
+
+    def drawSecondBalls(self, generator, standing):
+        """
+        Draws the leaves of balls bowled at pins left by an earlier ball,
+            a missed conversion always leaves at least one pin standing
+        :param generator (Generator): The NumPy random generator
+        :param standing (array): The masks standing before each ball
+        :return (array): The masks left standing
+        """
+        converted = generator.random(standing.shape[0]) < self.conversionRates[standing]
+        knocked = (generator.random((standing.shape[0], PIN_UPPER_BOUND)) < self.pinProbability) @ PIN_BITS
+        leaves = standing & ~knocked.astype(np.int16)
+
+        # a miss that happened to knock down every pin keeps the highest pin up
+        leaves = np.where(leaves == EMPTY_RACK_MASK, HIGHEST_PINS[standing], leaves)
+
+        return np.where(converted, EMPTY_RACK_MASK, leaves).astype(np.int16)
+
+def buildBowlerModel(strikeRate, pinProbability, singlePinRate):
+    """
+    Builds a simple model from three numbers: first balls that are not
+        strikes leave each pin on its own with the same chance, and leaves
+        get harder to convert the more pins are standing
+    :param strikeRate (float): The chance of a strike
+    :param pinProbability (float): The chance of knocking down each pin
+        with a first ball that is not a strike, or a missed conversion
+    :param singlePinRate (float): The chance of converting a single pin,
+        a leave of n pins is converted with this chance to the power n
+    :return (BowlerModel): The model
+    """
+    standingCounts = STANDING_COUNTS.astype(np.float64)
+    leaves = (1 - pinProbability) ** standingCounts * pinProbability ** (PIN_UPPER_BOUND - standingCounts)
+    leaves[EMPTY_RACK_MASK] = 0.0
+    leaves *= (1 - strikeRate) / leaves.sum()
+    leaves[EMPTY_RACK_MASK] = strikeRate
+
+    conversionRates = singlePinRate ** standingCounts
+
+    return BowlerModel(leaves, conversionRates, pinProbability)
+
+def rollsBetween(before, after):
+    """
+    Returns the pins knocked down between two masks
+    :param before (array): The masks standing before the balls
+    :param after (array): The masks standing after the balls
+    :return (array): The pin counts
+    """
+    return STANDING_COUNTS[before] - STANDING_COUNTS[after]
+
+def simulateRolls(model, count, generator):
+    """
+    Draws a batch of complete games
+    :param model (BowlerModel): The bowler bowling the games
+    :param count (int): The amount of games
+    :param generator (Generator): The NumPy random generator
+    :return (array): An (N x 21) int8 array of rolls, -1 is not bowled
+    """
+    rolls = np.full((count, ROLL_LIST_LENGTH), UNBOWLED_VALUE, dtype=np.int8)
+    fullRack = np.full(count, FULL_RACK_MASK, dtype=np.int16)
+
+    for frame in range(FRAME_UPPER_BOUND - 1):
+        firstLeaves = model.drawFirstBalls(generator, count)
+        rolls[:, 2 * frame] = rollsBetween(fullRack, firstLeaves)
+
+        # only the games without a strike bowl a second ball
+        spareChances = np.flatnonzero(firstLeaves != EMPTY_RACK_MASK)
+        secondLeaves = model.drawSecondBalls(generator, firstLeaves[spareChances])
+        rolls[spareChances, 2 * frame + 1] = rollsBetween(firstLeaves[spareChances], secondLeaves)
+
+    # tenth frame: the rack is reset after every strike or spare
+    firstLeaves = model.drawFirstBalls(generator, count)
+    rolls[:, TENTH_FRAME_ROLL_INDEX] = rollsBetween(fullRack, firstLeaves)
+
+    secondRacks = np.where(firstLeaves == EMPTY_RACK_MASK, FULL_RACK_MASK, firstLeaves)
+    secondLeaves = drawLeaves(model, generator, secondRacks)
+    rolls[:, TENTH_FRAME_ROLL_INDEX + 1] = rollsBetween(secondRacks, secondLeaves)
+
+    third = np.flatnonzero((firstLeaves == EMPTY_RACK_MASK) | (secondLeaves == EMPTY_RACK_MASK))
+    thirdRacks = np.where(secondLeaves[third] == EMPTY_RACK_MASK, FULL_RACK_MASK, secondLeaves[third])
+    thirdLeaves = drawLeaves(model, generator, thirdRacks)
+    rolls[third, TENTH_FRAME_ROLL_INDEX + 2] = rollsBetween(thirdRacks, thirdLeaves)
+
+    return rolls
+
+def drawLeaves(model, generator, racks):
+    """
+    Draws one ball for each rack, a first ball at full racks
+        and a second ball at racks with pins already down
+    :param model (BowlerModel): The bowler bowling the balls
+    :param generator (Generator): The NumPy random generator
+    :param racks (array): The masks standing before each ball
+    :return (array): The masks left standing
+    """
+    leaves = np.empty_like(racks)
+    full = racks == FULL_RACK_MASK
+    leaves[full] = model.drawFirstBalls(generator, int(full.sum()))
+    leaves[~full] = model.drawSecondBalls(generator, racks[~full])
+
+    return leaves
+
+def simulateChunk(task):
+    """
+    Draws and scores one chunk of games, run inside the worker processes
+    :param task (tuple): The bowler model, the amount of games and the
+        SeedSequence of the chunk
+    :return (tuple): The (N x 21) rolls and the N total scores
+    """
+    model, count, seedSequence = task
+    rolls = simulateRolls(model, count, np.random.default_rng(seedSequence))
+    cumulativeScores, totals = BatchScoring.scoreGames(rolls)
+
+    return rolls, totals
+
+def simulateGames(model, gameCount, seed=DEFAULT_SEED, processes=None):
+    """
+    Draws and scores games for one bowler
+    :param model (BowlerModel): The bowler bowling the games
+    :param gameCount (int): The amount of games
+    :param seed (int): The seed every chunk's random generator is spawned from
+    :param processes (int): The amount of worker processes, None or 1 runs
+        in this process, 0 uses one per CPU
+    :return (tuple): An (N x 21) int8 array of rolls and N total scores
+    """
+    chunkCounts = [min(CHUNK_GAME_COUNT, gameCount - start) for start in range(0, gameCount, CHUNK_GAME_COUNT)]
+    seedSequences = np.random.SeedSequence(seed).spawn(len(chunkCounts))
+    tasks = [(model, count, seedSequence) for count, seedSequence in zip(chunkCounts, seedSequences)]
+
+    if processes is None or processes == 1 or len(tasks) < 2:
+        results = [simulateChunk(task) for task in tasks]
+    else:
+        with Pool(processes or None) as pool:
+            results = pool.map(simulateChunk, tasks)
+
+    if not results:
+        return np.empty((0, ROLL_LIST_LENGTH), dtype=np.int8), np.empty(0, dtype=np.int16)
+
+    return (np.concatenate([rolls for rolls, totals in results]),
+            np.concatenate([totals for rolls, totals in results]))
+
+def main(argv=None):
+    """
+    Command line entry point: simulates games for a simple bowler model
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Monte Carlo bowling game simulator")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAME_COUNT, help="games to simulate")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes, 0 for one per CPU")
+    parser.add_argument("--strike-rate", type=float, default=0.45, help="chance of a strike")
+    parser.add_argument("--pin-rate", type=float, default=0.8,
+                        help="chance of knocking down each pin on a non-strike")
+    parser.add_argument("--single-pin-rate", type=float, default=0.9,
+                        help="chance of converting a single pin leave")
+    args = parser.parse_args(argv)
+
+    model = buildBowlerModel(args.strike_rate, args.pin_rate, args.single_pin_rate)
+
+    start = time.perf_counter()
+    rolls, totals = simulateGames(model, args.games, args.seed, args.processes)
+    elapsed = time.perf_counter() - start
+
+    strikes = (rolls[:, 0:TENTH_FRAME_ROLL_INDEX:2] == MARK_SCORE).mean()
+    print(f"Games: {len(totals):,} in {elapsed:.2f} s ({len(totals) / elapsed:,.0f} games/s)")
+    print(f"Average: {totals.mean():.1f}, Standard deviation: {totals.std():.1f}, "
+          f"High: {totals.max()}, Low: {totals.min()}")
+    print(f"Strikes in frames 1-9: {strikes:.1%}, "
+          f"Percentiles 10/50/90: {' / '.join(str(int(p)) for p in np.percentile(totals, [10, 50, 90]))}")
+
+    return
+
+if __name__ == "__main__":
+    main()
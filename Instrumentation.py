@@ -0,0 +1,318 @@
+# Date: 10/18/26
+# Description: This file holds optional counters and latency histograms
+#   for the hot paths of the bowling score system. Instrumentation is only
+#   turned on when BOWLING_METRICS names a file to write the metrics to at
+#   exit, as JSON or, for a .prom or .txt file, Prometheus text. When it is
+#   off the decorators hand back the function they were given, so nothing
+#   is added to any call. BOWLING_PROFILE names a file for cProfile stats
+#   of every call of the functions marked with the profiled decorator,
+#   written at exit.
+import atexit
+import bisect
+import cProfile
+import functools
+import json
+import os
+import time
+
+METRICS_PATH_VARIABLE = "BOWLING_METRICS"
+PROFILE_PATH_VARIABLE = "BOWLING_PROFILE"
+PROMETHEUS_EXTENSIONS = (".prom", ".txt")
+METRIC_PREFIX = "bowling_"
+
+# latency bucket upper bounds in seconds, from 1 us to 1 s
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+class LatencyHistogram:
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        """
+        Constructor:
+        Creates an empty histogram
+        :param bounds (tuple): The upper bound of each bucket in seconds,
+            slower observations fall into a final unbounded bucket
+        """
+        self.bounds = bounds
+        self.bucketCounts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds):
+        """
+        Adds one latency to the histogram
+        :param seconds (float): The latency
+        :return: None
+        """
+        self.bucketCounts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+        return
+
+    def getCount(self):
+        """
+        Getter for the amount of latencies observed
+        :return (int): The amount of latencies
+        """
+        return self.count
+
+    def getTotal(self):
+        """
+        Getter for the sum of every latency observed
+        :return (float): The sum in seconds
+        """
+        return self.total
+
+    def getBucketCounts(self):
+        """
+        Getter for the amount of latencies in each bucket
+        :return (list): The count of each bucket, the last one is unbounded
+        """
+        return self.bucketCounts
+
+    def getCumulativeCounts(self):
+        """
+        Returns the amount of latencies at or under each bucket bound
+        :return (list): (bound, count) pairs, the last bound is infinity
+        """
+        counts = []
+        running = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.bucketCounts):
+            running += count
+            counts.append((bound, running))
+
+        return counts
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        Constructor:
+        Creates a registry with no counters or histograms
+        """
+        self.counters = {}
+        self.histograms = {}
+
+    def increment(self, name, amount=1):
+        """
+        Adds to a counter, creating it the first time it is used
+        :param name (str): The name of the counter
+        :param amount (int): The amount to add
+        :return: None
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+        return
+
+    def observe(self, name, seconds):
+        """
+        Adds a latency to a histogram, creating it the first time it is used
+        :param name (str): The name of the histogram
+        :param seconds (float): The latency
+        :return: None
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.histograms[name] = histogram
+        histogram.observe(seconds)
+
+        return
+
+    def getCounter(self, name):
+        """
+        Getter for the value of a counter
+        :param name (str): The name of the counter
+        :return (int): The value, 0 if it was never incremented
+        """
+        return self.counters.get(name, 0)
+
+    def getHistogram(self, name):
+        """
+        Getter for a histogram
+        :param name (str): The name of the histogram
+        :return (LatencyHistogram): The histogram, or None if nothing was observed
+        """
+        return self.histograms.get(name)
+
+    def toDictionary(self):
+        """
+        Returns every metric in a form that can be written as JSON
+        :return (dict): The counters and histograms
+        """
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: {
+                    "count": histogram.getCount(),
+                    "sumSeconds": histogram.getTotal(),
+                    "buckets": [["+Inf" if bound == float("inf") else bound, count]
+                                for bound, count in histogram.getCumulativeCounts()],
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def toPrometheus(self):
+        """
+        Formats every metric in the Prometheus text format
+        :return (str): The metrics, one sample per line
+        """
+        lines = []
+
+        for name, value in self.counters.items():
+            metric = f"{METRIC_PREFIX}{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for name, histogram in self.histograms.items():
+            metric = f"{METRIC_PREFIX}{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram.getCumulativeCounts():
+                label = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{le="{label}"}} {count}')
+            lines.append(f"{metric}_sum {histogram.getTotal()!r}")
+            lines.append(f"{metric}_count {histogram.getCount()}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """
+        Writes every metric to a file, as Prometheus text for a .prom
+            or .txt file and as JSON otherwise
+        :param path (str): The path of the file
+        :return: None
+        """
+        with open(path, "w") as file:
+            if path.endswith(PROMETHEUS_EXTENSIONS):
+                file.write(self.toPrometheus())
+            else:
+                json.dump(self.toDictionary(), file, indent=2)
+                file.write("\n")
+
+        return
+
+REGISTRY = MetricsRegistry()
+METRICS_PATH = os.environ.get(METRICS_PATH_VARIABLE)
+PROFILE_PATH = os.environ.get(PROFILE_PATH_VARIABLE)
+PROFILER = cProfile.Profile() if PROFILE_PATH else None
+profileDepth = 0
+
+def isEnabled():
+    """
+    Returns whether counters and histograms are being recorded
+    :return (boolean): True if BOWLING_METRICS was set when this module was imported
+    """
+    return bool(METRICS_PATH)
+
+def counted(name):
+    """
+    Decorator that counts the calls of a function,
+        or leaves the function alone when instrumentation is off
+    :param name (str): The name of the counter
+    :return (function): The decorator
+    """
+    def decorate(function):
+        if not isEnabled():
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            REGISTRY.increment(name)
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+def timed(name):
+    """
+    Decorator that records the latency of every call of a function in a
+        histogram, or leaves the function alone when instrumentation is off
+    :param name (str): The name of the histogram
+    :return (function): The decorator
+    """
+    def decorate(function):
+        if not isEnabled():
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+def profiled(function):
+    """
+    Decorator that runs a function under one shared cProfile profile,
+        written to BOWLING_PROFILE at exit so every call is kept, or
+        leaves the function alone when it is not set
+    :param function (function): The function to profile
+    :return (function): The profiled function
+    """
+    if not PROFILE_PATH:
+        return function
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        global profileDepth
+
+        # a profiled function called from another is already being profiled
+        if profileDepth:
+            return function(*args, **kwargs)
+
+        profileDepth += 1
+        try:
+            return PROFILER.runcall(function, *args, **kwargs)
+        finally:
+            profileDepth -= 1
+
+    return wrapper
+
+def dumpProfile(path=None):
+    """
+    Writes the cProfile stats of every profiled call so far
+    :param path (str): The path of the file, BOWLING_PROFILE if None
+    :return: None
+    """
+    path = path or PROFILE_PATH
+    if path and PROFILER is not None:
+        PROFILER.dump_stats(path)
+
+    return
+
+def dumpMetrics(path=None):
+    """
+    Writes the metrics recorded so far
+    :param path (str): The path of the file, BOWLING_METRICS if None
+    :return: None
+    """
+    path = path or METRICS_PATH
+    if path:
+        REGISTRY.dump(path)
+
+    return
+
+if isEnabled():
+    atexit.register(dumpMetrics)
+if PROFILE_PATH:
+    atexit.register(dumpProfile)
+
+def main():
+    registry = MetricsRegistry()
+    for microseconds in (3, 7, 40, 40, 900, 12000):
+        registry.observe("example_render", microseconds / 1e6)
+    registry.increment("example_balls", 21)
+
+    print(registry.toPrometheus(), end="")
+    print(f"Instrumentation is {'on' if isEnabled() else 'off'}, set {METRICS_PATH_VARIABLE} to turn it on")
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# Date: 10/18/26
+# Description: This file runs one asyncio server that scores the games of
+#   many lanes at once. Lane clients connect over a local TCP socket and
+#   send one command per line, each answered with one line:
+#       BALL <lane> <pins>         pins knocked down as a count
+#       PINS <lane> <pin string>   pins knocked down as a pin string, - for none
+#       MASK <lane> <mask>         pins knocked down as a 10-bit mask
+#       STATE <lane>               the current state of a lane with a game
+#       NEW <lane> [bowler]        start a new game on the lane, an
+#                                  unfinished game is taken off the leaderboard
+#   Replies are "OK <lane> <frame> <ball> <complete> <standing> <leave> <score>"
+#   or "ERR <message>". Every game is ranked on the server's leaderboard
+#   under its bowler, or the lane name if no bowler was given. The main
+#   function starts the server, or runs a local demonstration with
+#   stand-in lane clients.
+import argparse
+import asyncio
+import socket
+import time
+
+from GameEngineClass import GameEngine
+from LeaderboardClass import Leaderboard
+from PinStringParser import parsePinString
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8700
+ENCODING = "ascii"
+NO_PINS_STRING = "-"
+DEMO_LANE_COUNT = 48
+DEMO_GAME_COUNT = 20
+COMMANDS = ("BALL", "PINS", "MASK", "STATE", "NEW")
+
+class LaneServer:
+    def __init__(self):
+        """
+        Constructor:
+        Creates a server with no lanes, a lane's game is
+            started the first time a command names it
+        """
+        self.engines = {}
+        self.leaderboard = Leaderboard()
+        self.server = None
+        self.commandCount = 0
+
+    def getEngine(self, lane):
+        """
+        Returns the game engine of a lane, starting a game if it has none
+        :param lane (str): The name of the lane
+        :return (GameEngine): The lane's game engine
+        """
+        engine = self.engines.get(lane)
+
+        if engine is None:
+            engine = GameEngine(lane, self.leaderboard)
+            self.engines[lane] = engine
+
+        return engine
+
+    def getLeaderboard(self):
+        """
+        Getter for the leaderboard of every game on the server
+        :return (Leaderboard): The leaderboard
+        """
+        return self.leaderboard
+
+    def getLaneCount(self):
+        """
+        Getter for the amount of lanes with a game
+        :return (int): The amount of lanes
+        """
+        return len(self.engines)
+
+    def getCommandCount(self):
+        """
+        Getter for the amount of commands answered
+        :return (int): The amount of commands
+        """
+        return self.commandCount
+
+    def handleCommand(self, line):
+        """
+        Carries out one command line and builds its reply
+        :param line (str): The command without its line break
+        :return (str): The reply without its line break
+        """
+        self.commandCount += 1
+        parts = line.split()
+        if len(parts) < 2:
+            return "ERR expected a command and a lane"
+
+        command = parts[0].upper()
+        lane = parts[1]
+        if command not in COMMANDS:
+            return f"ERR unknown command {command}"
+
+        try:
+            if command == "NEW":
+                if len(parts) > 3:
+                    return "ERR NEW needs a lane and at most one bowler"
+                # a game left unfinished would stay ranked as a contender
+                oldEngine = self.engines.get(lane)
+                if oldEngine is not None and not oldEngine.getCompleteGame():
+                    self.leaderboard.abandonGame(oldEngine.getGameKey())
+                engine = GameEngine(parts[2] if len(parts) == 3 else lane, self.leaderboard)
+                self.engines[lane] = engine
+                state = engine.getState()
+            elif command == "STATE":
+                # reading a state never starts a game
+                if lane not in self.engines:
+                    return f"ERR unknown lane {lane}"
+                state = self.engines[lane].getState()
+            elif len(parts) != 3:
+                return f"ERR {command} needs a lane and one value"
+            elif command == "BALL":
+                state = self.getEngine(lane).bowl(int(parts[2]))
+            elif command == "MASK":
+                state = self.getEngine(lane).bowlMask(int(parts[2]))
+            else:
+                pinString = "" if parts[2] == NO_PINS_STRING else parts[2]
+                state = self.getEngine(lane).bowlMask(parsePinString(pinString))
+        except ValueError as error:
+            return f"ERR {error}"
+
+        return (f"OK {lane} {state.frame} {state.ball} {int(state.complete)} "
+                f"{state.pinsStanding} {state.leave} {state.score}")
+
+    async def handleClient(self, reader, writer):
+        """
+        Answers the commands of one connected lane client until it disconnects
+        :param reader (StreamReader): The stream the commands arrive on
+        :param writer (StreamWriter): The stream the replies are written to
+        :return: None
+        """
+        clientSocket = writer.get_extra_info("socket")
+        if clientSocket is not None:
+            clientSocket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the rest of an overlong line cannot be told apart
+                    # from the next command, so the client is dropped
+                    writer.write(b"ERR line too long\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                reply = self.handleCommand(line.decode(ENCODING, "replace").strip())
+                writer.write((reply + "\n").encode(ENCODING, "replace"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+        return
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Starts listening for lane clients
+        :param host (str): The address to listen on
+        :param port (int): The port to listen on, 0 picks a free port
+        :return (int): The port the server is listening on
+        """
+        self.server = await asyncio.start_server(self.handleClient, host, port)
+
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Stops listening and closes the server
+        :return: None
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+        return
+
+class LaneClient:
+    def __init__(self, lane):
+        """
+        Constructor:
+        A stand-in for the client that runs on a lane
+        :param lane (str): The name of the lane
+        """
+        self.lane = lane
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Connects to a lane server
+        :param host (str): The address of the server
+        :param port (int): The port of the server
+        :return: None
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        return
+
+    async def send(self, command, value=None):
+        """
+        Sends a command for this client's lane and waits for the reply
+        :param command (str): The command, such as BALL or STATE
+        :param value: The value of the command, if it takes one
+        :return (list): The words of the reply
+        """
+        line = f"{command} {self.lane}" if value is None else f"{command} {self.lane} {value}"
+        self.writer.write((line + "\n").encode(ENCODING))
+        await self.writer.drain()
+        reply = await self.reader.readline()
+
+        return reply.decode(ENCODING).split()
+
+    async def bowl(self, pinsDowned):
+        """
+        Sends a ball as a pin count
+        :param pinsDowned (int): The pins knocked down by the ball
+        :return (list): The words of the reply
+        """
+        return await self.send("BALL", pinsDowned)
+
+    async def close(self):
+        """
+        Disconnects from the server
+        :return: None
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+        return
+
+async def runDemo(laneCount=DEMO_LANE_COUNT, gameCount=DEMO_GAME_COUNT):
+    """
+    Starts a server on a free local port and has a stand-in client
+        on every lane bowl games of strikes and spares at the same time.
+        The clients share the server's event loop, so with many lanes the
+        latency includes the time spent running the other clients
+    :param laneCount (int): The amount of lanes
+    :param gameCount (int): The games bowled on each lane
+    :return (list): The seconds taken by every ball, from send to reply
+    """
+    server = LaneServer()
+    port = await server.start(DEFAULT_HOST, 0)
+    latencies = []
+
+    async def playLane(laneNumber):
+        client = LaneClient(f"lane{laneNumber}")
+        await client.connect(DEFAULT_HOST, port)
+        for game in range(gameCount):
+            await client.send("NEW")
+            reply = ["OK", "", "", "0"]
+            ball = 0
+            while reply[0] == "OK" and reply[3] == "0":
+                # alternate strikes with 9 / spares
+                pins = 10 if ball % 3 == 0 else (9 if ball % 3 == 1 else 1)
+                start = time.perf_counter()
+                reply = await client.bowl(pins)
+                latencies.append(time.perf_counter() - start)
+                ball += 1
+        await client.close()
+
+    await asyncio.gather(*[playLane(laneNumber) for laneNumber in range(laneCount)])
+    await server.stop()
+
+    return latencies
+
+def main(argv=None):
+    """
+    Command line entry point: runs the lane server, or the local demonstration
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Multi-lane bowling scoring server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--demo", action="store_true",
+                        help="run stand-in lane clients against a local server and report latency")
+    parser.add_argument("--lanes", type=int, default=DEMO_LANE_COUNT,
+                        help="lanes used by the demonstration")
+    args = parser.parse_args(argv)
+
+    if args.demo:
+        latencies = sorted(asyncio.run(runDemo(args.lanes)))
+        print(f"Lanes: {args.lanes}, Balls: {len(latencies)}")
+        print(f"Median latency: {latencies[len(latencies) // 2] * 1e6:.0f} us")
+        print(f"99th percentile: {latencies[len(latencies) * 99 // 100] * 1e6:.0f} us")
+    else:
+        async def serve():
+            server = LaneServer()
+            await server.start(args.host, args.port)
+            print(f"Scoring lanes on {args.host}:{args.port}")
+            await server.server.serve_forever()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+
+    return
+
+if __name__ == "__main__":
+    main()
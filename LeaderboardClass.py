@@ -0,0 +1,268 @@
+# Date: 10/18/26
+# Description: This file contains the center's live leaderboard. Games are
+#   ranked by score, bowlers by series, and games still being bowled by
+#   their max possible score so contenders can be shown. Each ranking is a
+#   heap with an index of current values: an update pushes a new heap entry
+#   in O(log n) and the old entry is dropped when a read finds it out of
+#   date. GameEngine updates the board after every ball. The main function
+#   gives a demonstration.
+import heapq
+import itertools
+
+# stale heap entries are cleared out once they outnumber live ones by this much
+COMPACT_FACTOR = 2
+COMPACT_MINIMUM = 64
+DEFAULT_TOP_COUNT = 5
+PERFECT_GAME_SCORE = 300
+
+class RankedIndex:
+    def __init__(self):
+        """
+        Constructor:
+        Creates an empty ranking
+        """
+        self.values = {}
+        self.heap = []  # (-value, order, key), the lowest order wins ties
+        self.counter = itertools.count()
+
+    def __len__(self):
+        """
+        Returns the amount of keys ranked
+        :return (int): The amount of keys
+        """
+        return len(self.values)
+
+    def __contains__(self, key):
+        """
+        Returns whether a key is ranked
+        :param key: The key
+        :return (boolean): True if the key has a value
+        """
+        return key in self.values
+
+    def getValue(self, key):
+        """
+        Getter for the current value of a key
+        :param key: The key
+        :return (int): The value, None if the key is not ranked
+        """
+        return self.values.get(key)
+
+    def setValue(self, key, value):
+        """
+        Ranks a key by a new value
+        :param key: The key, any hashable value
+        :param value (int): The value the key is ranked by
+        :return: None
+        """
+        if self.values.get(key) == value:
+            return
+
+        self.values[key] = value
+        heapq.heappush(self.heap, (-value, next(self.counter), key))
+        self.compact()
+
+        return
+
+    def remove(self, key):
+        """
+        Stops ranking a key, its heap entries are dropped later
+        :param key: The key
+        :return: None
+        """
+        self.values.pop(key, None)
+        self.compact()
+
+        return
+
+    def getTop(self, count):
+        """
+        Returns the highest ranked keys
+        :param count (int): The most keys to return
+        :return (list): (key, value) pairs, highest value first
+        """
+        top = []
+        entries = []
+        seen = set()
+
+        while self.heap and len(top) < count:
+            entry = heapq.heappop(self.heap)
+            negatedValue, order, key = entry
+            # an entry is current if its key still has this value, a key
+            # that went back to an old value can have two such entries
+            if self.values.get(key) == -negatedValue and key not in seen:
+                seen.add(key)
+                top.append((key, -negatedValue))
+                entries.append(entry)
+
+        for entry in entries:
+            heapq.heappush(self.heap, entry)
+
+        return top
+
+    def compact(self):
+        """
+        Rebuilds the heap from the current values once stale entries pile up
+        :return: None
+        """
+        if len(self.heap) > max(COMPACT_MINIMUM, COMPACT_FACTOR * len(self.values)):
+            self.heap = [(-value, next(self.counter), key) for key, value in self.values.items()]
+            heapq.heapify(self.heap)
+
+        return
+
+class Leaderboard:
+    def __init__(self):
+        """
+        Constructor:
+        Creates an empty leaderboard
+        """
+        self.games = RankedIndex()
+        self.series = RankedIndex()
+        self.contenders = RankedIndex()
+        self.gameScores = {}
+        self.bowlerGames = {}
+
+    def startGame(self, bowler):
+        """
+        Adds a new game for a bowler with a score of 0
+        :param bowler (str): The name of the bowler
+        :return (tuple): The key of the game, the bowler and the game number
+        """
+        games = self.bowlerGames.setdefault(bowler, [])
+        gameKey = (bowler, games[-1][1] + 1 if games else 1)
+        games.append(gameKey)
+        self.gameScores[gameKey] = 0
+        self.games.setValue(gameKey, 0)
+        self.contenders.setValue(gameKey, PERFECT_GAME_SCORE)
+        if bowler not in self.series:
+            self.series.setValue(bowler, 0)
+
+        return gameKey
+
+    def updateGame(self, gameKey, score, maxPossibleScore, complete):
+        """
+        Updates the rankings of a game after a ball
+        :param gameKey (tuple): The key from startGame
+        :param score (int): The running score of the game
+        :param maxPossibleScore (int): The highest score the game can still reach
+        :param complete (boolean): True if the game is finished
+        :return: None
+        """
+        bowler = gameKey[0]
+        change = score - self.gameScores[gameKey]
+        self.gameScores[gameKey] = score
+
+        self.games.setValue(gameKey, score)
+        self.series.setValue(bowler, self.series.getValue(bowler) + change)
+        if complete:
+            self.contenders.remove(gameKey)
+        else:
+            self.contenders.setValue(gameKey, maxPossibleScore)
+
+        return
+
+    def abandonGame(self, gameKey):
+        """
+        Takes a game that will not be finished off the leaderboard, its
+            score no longer counts toward the bowler's series
+        :param gameKey (tuple): The key from startGame
+        :return: None
+        """
+        bowler = gameKey[0]
+        score = self.gameScores.pop(gameKey)
+
+        self.games.remove(gameKey)
+        self.contenders.remove(gameKey)
+        games = self.bowlerGames[bowler]
+        games.remove(gameKey)
+        if games:
+            self.series.setValue(bowler, self.series.getValue(bowler) - score)
+        else:
+            del self.bowlerGames[bowler]
+            self.series.remove(bowler)
+
+        return
+
+    def recordScoreSheet(self, gameKey, scoreSheet):
+        """
+        Updates the rankings of a game from its score sheet
+        :param gameKey (tuple): The key from startGame
+        :param scoreSheet (ScoreSheet): The score sheet of the game
+        :return: None
+        """
+        self.updateGame(gameKey, scoreSheet.getRunningScore(),
+                        scoreSheet.getMaxPossibleScore(), scoreSheet.getCompleteGame())
+
+        return
+
+    def getHighGames(self, count=DEFAULT_TOP_COUNT):
+        """
+        Returns the highest game scores of the night
+        :param count (int): The most games to return
+        :return (list): ((bowler, game number), score) pairs, best first
+        """
+        return self.games.getTop(count)
+
+    def getHighSeries(self, count=DEFAULT_TOP_COUNT):
+        """
+        Returns the highest series of the night
+        :param count (int): The most bowlers to return
+        :return (list): (bowler, series) pairs, best first
+        """
+        return self.series.getTop(count)
+
+    def getContenders(self, count=DEFAULT_TOP_COUNT):
+        """
+        Returns the games still being bowled that can reach the highest scores
+        :param count (int): The most games to return
+        :return (list): ((bowler, game number), max possible score) pairs, best first
+        """
+        return self.contenders.getTop(count)
+
+    def getGameScore(self, gameKey):
+        """
+        Getter for the current score of a game
+        :param gameKey (tuple): The key from startGame
+        :return (int): The running score
+        """
+        return self.gameScores[gameKey]
+
+    def getSeries(self, bowler):
+        """
+        Getter for a bowler's series
+        :param bowler (str): The name of the bowler
+        :return (int): The sum of the bowler's games, None if they have none
+        """
+        return self.series.getValue(bowler)
+
+    def getBowlerGames(self, bowler):
+        """
+        Getter for the games of a bowler
+        :param bowler (str): The name of the bowler
+        :return (list): The keys of the bowler's games in the order started
+        """
+        return list(self.bowlerGames.get(bowler, []))
+
+def main():
+    from GameEngineClass import GameEngine
+
+    leaderboard = Leaderboard()
+    lanes = {"Aidan": [10] * 12, "Sam": [9, 1] * 10 + [9], "Lee": [10, 10, 7, 2] + [0] * 14}
+    engines = {bowler: GameEngine(bowler, leaderboard) for bowler in lanes}
+
+    # bowl the lanes one ball at a time, and show the board halfway
+    for ball in range(max(len(balls) for balls in lanes.values())):
+        for bowler, balls in lanes.items():
+            if ball < len(balls):
+                engines[bowler].bowl(balls[ball])
+        if ball == 5:
+            print(f"Contenders after 6 balls: {leaderboard.getContenders(3)}")
+
+    print(f"High games: {leaderboard.getHighGames(3)}")
+    print(f"High series: {leaderboard.getHighSeries(3)}")
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+# Date: 10/18/26
+# Description: This file builds the end of night league report. Games are
+#   read one line at a time as "bowler,rolls" and scored as they stream
+#   in. Only running totals are kept for each bowler: the series, a
+#   Welford mean and variance of game scores, the high game and counts of
+#   strike, spare and open frames, plus a heap of the league's top games.
+#   The report is written after the single pass. The main function is the
+#   command line entry point.
+import argparse
+import heapq
+import math
+import sys
+
+import GameIngest
+
+FRAME_UPPER_BOUND = 10
+TENTH_FRAME_INDEX = 9
+NAME_SEPARATOR = ","
+DEFAULT_TOP_COUNT = 5
+PERCENT = 100
+
+class BowlerStats:
+    def __init__(self, name):
+        """
+        Constructor:
+        Creates the running totals of a bowler with no games
+        :param name (str): The name of the bowler
+        """
+        self.name = name
+        self.gameCount = 0
+        self.series = 0
+        self.mean = 0.0
+        self.squareDistance = 0.0
+        self.highGame = None
+        self.lowGame = None
+        self.strikeCount = 0
+        self.spareCount = 0
+        self.openCount = 0
+
+    def addGame(self, totalScore, strikes, spares, opens):
+        """
+        Adds one game to the running totals
+        :param totalScore (int): The score of the game
+        :param strikes (int): The frames of the game that were strikes
+        :param spares (int): The frames of the game that were spares
+        :param opens (int): The frames of the game that were open
+        :return: None
+        """
+        self.gameCount += 1
+        self.series += totalScore
+
+        # Welford's update keeps the variance without storing the games
+        delta = totalScore - self.mean
+        self.mean += delta / self.gameCount
+        self.squareDistance += delta * (totalScore - self.mean)
+
+        if self.highGame is None or totalScore > self.highGame:
+            self.highGame = totalScore
+        if self.lowGame is None or totalScore < self.lowGame:
+            self.lowGame = totalScore
+
+        self.strikeCount += strikes
+        self.spareCount += spares
+        self.openCount += opens
+
+        return
+
+    def getName(self):
+        """
+        Getter for the name of the bowler
+        :return (str): The name
+        """
+        return self.name
+
+    def getGameCount(self):
+        """
+        Getter for the amount of games bowled
+        :return (int): The amount of games
+        """
+        return self.gameCount
+
+    def getSeries(self):
+        """
+        Getter for the sum of every game bowled
+        :return (int): The series total
+        """
+        return self.series
+
+    def getAverage(self):
+        """
+        Getter for the average game score
+        :return (float): The average, 0 with no games
+        """
+        return self.mean
+
+    def getStandardDeviation(self):
+        """
+        Returns the standard deviation of the game scores
+        :return (float): The population standard deviation, 0 with no games
+        """
+        return math.sqrt(self.squareDistance / self.gameCount) if self.gameCount else 0.0
+
+    def getHighGame(self):
+        """
+        Getter for the highest game score
+        :return (int): The high game, None with no games
+        """
+        return self.highGame
+
+    def getLowGame(self):
+        """
+        Getter for the lowest game score
+        :return (int): The low game, None with no games
+        """
+        return self.lowGame
+
+    def getFramePercentages(self):
+        """
+        Returns the share of frames that were strikes, spares and open
+        :return (tuple): The strike, spare and open percentages
+        """
+        frames = self.strikeCount + self.spareCount + self.openCount
+        if frames == 0:
+            return 0.0, 0.0, 0.0
+
+        return (PERCENT * self.strikeCount / frames, PERCENT * self.spareCount / frames,
+                PERCENT * self.openCount / frames)
+
+class LeagueReport:
+    def __init__(self, topCount=DEFAULT_TOP_COUNT):
+        """
+        Constructor:
+        Creates an empty report
+        :param topCount (int): The amount of top games and series to keep
+        """
+        self.topCount = topCount
+        self.bowlers = {}
+        self.topGames = []  # min-heap of (score, -order, bowler) holding the best games
+        self.gameCount = 0
+
+    def addGame(self, bowler, scoreSheet):
+        """
+        Adds a complete game to the report
+        :param bowler (str): The name of the bowler
+        :param scoreSheet (ScoreSheet): The score sheet of the game
+        :return: None
+        """
+        stats = self.bowlers.get(bowler)
+        if stats is None:
+            stats = BowlerStats(bowler)
+            self.bowlers[bowler] = stats
+
+        totalScore = scoreSheet.getRunningScore()
+        stats.addGame(totalScore, *countFrameTypes(scoreSheet))
+        self.gameCount += 1
+
+        # earlier games win ties, so the order is stored negated
+        entry = (totalScore, -self.gameCount, bowler)
+        if len(self.topGames) < self.topCount:
+            heapq.heappush(self.topGames, entry)
+        elif entry > self.topGames[0]:
+            heapq.heapreplace(self.topGames, entry)
+
+        return
+
+    def getGameCount(self):
+        """
+        Getter for the amount of games in the report
+        :return (int): The amount of games
+        """
+        return self.gameCount
+
+    def getBowlerStats(self, bowler):
+        """
+        Getter for the running totals of a bowler
+        :param bowler (str): The name of the bowler
+        :return (BowlerStats): The totals, None if the bowler has no games
+        """
+        return self.bowlers.get(bowler)
+
+    def getBowlers(self):
+        """
+        Returns every bowler's totals ordered by name
+        :return (list): The BowlerStats of each bowler
+        """
+        return [self.bowlers[name] for name in sorted(self.bowlers)]
+
+    def getTopGames(self):
+        """
+        Returns the highest games of the night, best first
+        :return (list): (bowler, score) pairs
+        """
+        return [(bowler, score) for score, order, bowler in sorted(self.topGames, reverse=True)]
+
+    def getTopSeries(self):
+        """
+        Returns the highest series of the night, best first
+        :return (list): (bowler, series) pairs
+        """
+        best = heapq.nlargest(self.topCount, self.bowlers.values(), key=BowlerStats.getSeries)
+
+        return [(stats.getName(), stats.getSeries()) for stats in best]
+
+    def formatText(self):
+        """
+        Formats the report as a table of bowlers and the league leaders
+        :return (str): The report
+        """
+        lines = [f"{'Bowler':<20}{'Games':>6}{'Series':>8}{'Avg':>8}{'SD':>7}{'High':>6}"
+                 f"{'Strike%':>9}{'Spare%':>8}{'Open%':>7}"]
+        for stats in self.getBowlers():
+            strikes, spares, opens = stats.getFramePercentages()
+            lines.append(f"{stats.getName():<20}{stats.getGameCount():>6}{stats.getSeries():>8}"
+                         f"{stats.getAverage():>8.1f}{stats.getStandardDeviation():>7.1f}"
+                         f"{stats.getHighGame():>6}{strikes:>9.1f}{spares:>8.1f}{opens:>7.1f}")
+
+        lines.append("")
+        lines.append("High games: " + ", ".join(f"{bowler} {score}" for bowler, score in self.getTopGames()))
+        lines.append("High series: " + ", ".join(f"{bowler} {series}" for bowler, series in self.getTopSeries()))
+        lines.append(f"Games: {self.gameCount}, Bowlers: {len(self.bowlers)}")
+
+        return "\n".join(lines) + "\n"
+
+    def formatCsv(self):
+        """
+        Formats the bowler table as CSV
+        :return (str): The report, one line per bowler after a header
+        """
+        lines = ["bowler,games,series,average,standardDeviation,highGame,lowGame,"
+                 "strikePercent,sparePercent,openPercent"]
+        for stats in self.getBowlers():
+            strikes, spares, opens = stats.getFramePercentages()
+            lines.append(f"{stats.getName()},{stats.getGameCount()},{stats.getSeries()},"
+                         f"{stats.getAverage():.2f},{stats.getStandardDeviation():.2f},"
+                         f"{stats.getHighGame()},{stats.getLowGame()},"
+                         f"{strikes:.2f},{spares:.2f},{opens:.2f}")
+
+        return "\n".join(lines) + "\n"
+
+def countFrameTypes(scoreSheet):
+    """
+    Counts the strike, spare and open frames of a game with the
+        Frame.getStrike and getSpare flags. The tenth frame counts its
+        first ball: a strike, else a spare, else open
+    :param scoreSheet (ScoreSheet): The score sheet of the game
+    :return (tuple): The amount of strike, spare and open frames
+    """
+    strikes = 0
+    spares = 0
+
+    for i in range(TENTH_FRAME_INDEX):
+        frame = scoreSheet.getNthFrame(i)
+        if frame.getStrike():
+            strikes += 1
+        elif frame.getSpare():
+            spares += 1
+
+    tenthFrame = scoreSheet.getNthFrame(TENTH_FRAME_INDEX)
+    if tenthFrame.getFirstStrike():
+        strikes += 1
+    elif tenthFrame.getSpare():
+        spares += 1
+
+    return strikes, spares, FRAME_UPPER_BOUND - strikes - spares
+
+def parseBowlerLine(line):
+    """
+    Splits a report line into the bowler and the balls of the game
+    :param line (str): A line such as "Aidan,X,9,/,..."
+    :return (tuple): The bowler name and the pins knocked down by each ball
+    """
+    bowler, separator, rolls = line.partition(NAME_SEPARATOR)
+    if not separator or not bowler.strip():
+        raise ValueError("expected a bowler name before the rolls")
+
+    return bowler.strip(), GameIngest.parseGameLine(rolls)
+
+def readLeagueGames(lines, report, skipInvalid=False):
+    """
+    Scores every game in the input and adds it to the report. Blank
+        lines and lines starting with # are ignored
+    :param lines (iterable): An open file or any other iterable of lines
+    :param report (LeagueReport): The report the games are added to
+    :param skipInvalid (boolean): True to skip lines that are not
+        complete games instead of raising an error
+    :return (int): The amount of lines skipped
+    """
+    skipped = 0
+    lineNumber = 0
+
+    for line in lines:
+        lineNumber += 1
+        line = line.strip()
+        if line == "" or line.startswith(GameIngest.COMMENT_PREFIX):
+            continue
+
+        try:
+            bowler, balls = parseBowlerLine(line)
+            scoreSheet = GameIngest.scoreBalls(balls)
+            if not scoreSheet.getCompleteGame():
+                raise ValueError("the game is not complete")
+        except ValueError as error:
+            if skipInvalid:
+                skipped += 1
+                continue
+            raise ValueError(f"Line {lineNumber}: {error}") from None
+
+        report.addGame(bowler, scoreSheet)
+
+    return skipped
+
+def main(argv=None):
+    """
+    Command line entry point: builds the league report from game files
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="League night report from bowler,rolls game lines")
+    parser.add_argument("paths", nargs="+", help="game files, - for standard input")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="skip lines that are not complete games")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_COUNT,
+                        help="amount of high games and series to list")
+    parser.add_argument("--csv", action="store_true", help="write the bowler table as CSV")
+    args = parser.parse_args(argv)
+
+    report = LeagueReport(args.top)
+    skipped = 0
+    for path in args.paths:
+        if path == GameIngest.STDIN_PATH:
+            skipped += readLeagueGames(sys.stdin, report, args.skip_invalid)
+        else:
+            with open(path, newline="") as gameFile:
+                skipped += readLeagueGames(gameFile, report, args.skip_invalid)
+
+    sys.stdout.write(report.formatCsv() if args.csv else report.formatText())
+    if skipped:
+        print(f"Skipped {skipped} invalid lines", file=sys.stderr)
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# Date: 10/18/26
+# Description: This file keeps pin leave statistics for coaches. Every ball
+#   bowled at a full rack adds its leave to a 1024 bucket histogram indexed
+#   by the mask of pins left standing, and every ball bowled at a leave
+#   counts as a conversion attempt for that leave. Questions about a group
+#   of leaves, such as every leave with the 10 pin standing, are answered
+#   from superset and subset sums over the buckets. The sums are built the
+#   first time they are needed after new balls are recorded. The main
+#   function gives a demonstration.
+from array import array
+
+from PinRackClass import PIN_MASK_COUNT, PIN_UPPER_BOUND, EMPTY_RACK_MASK
+
+ALL_BOWLERS = None
+ROLL_LIST_LENGTH = 21
+TENTH_FRAME_ROLL_INDEX = 18
+UNBOWLED_LEAVE = 0xFFFF
+COUNT_TYPECODE = "Q"
+
+class LeaveHistogram:
+    def __init__(self):
+        """
+        Constructor:
+        Creates empty leave, attempt and conversion buckets
+        """
+        self.leaveCounts = array(COUNT_TYPECODE, bytes(8 * PIN_MASK_COUNT))
+        self.attemptCounts = array(COUNT_TYPECODE, bytes(8 * PIN_MASK_COUNT))
+        self.conversionCounts = array(COUNT_TYPECODE, bytes(8 * PIN_MASK_COUNT))
+        self.firstBallCount = 0
+        self.sums = None
+
+    def recordFirstBall(self, leave):
+        """
+        Records a ball bowled at a full rack
+        :param leave (int): The mask of pins left standing
+        :return: None
+        """
+        self.leaveCounts[leave] += 1
+        self.firstBallCount += 1
+        self.sums = None
+
+        return
+
+    def recordAttempt(self, standing, leave):
+        """
+        Records a ball bowled at a leave
+        :param standing (int): The mask of pins standing before the ball
+        :param leave (int): The mask of pins left standing after the ball
+        :return: None
+        """
+        self.attemptCounts[standing] += 1
+        if leave == EMPTY_RACK_MASK:
+            self.conversionCounts[standing] += 1
+        self.sums = None
+
+        return
+
+    def getFirstBallCount(self):
+        """
+        Getter for the amount of balls bowled at a full rack
+        :return (int): The amount of first balls
+        """
+        return self.firstBallCount
+
+    def getLeaveCount(self, leave):
+        """
+        Getter for how often a first ball left exactly these pins
+        :param leave (int): The mask of pins left standing, 0 is a strike
+        :return (int): The amount of first balls
+        """
+        return self.leaveCounts[leave]
+
+    def getAttemptCount(self, leave):
+        """
+        Getter for how often a ball was bowled at exactly these pins
+        :param leave (int): The mask of pins standing
+        :return (int): The amount of attempts
+        """
+        return self.attemptCounts[leave]
+
+    def getConversionCount(self, leave):
+        """
+        Getter for how often exactly these pins were all knocked down
+        :param leave (int): The mask of pins standing
+        :return (int): The amount of conversions
+        """
+        return self.conversionCounts[leave]
+
+    def getConversionRate(self, leave):
+        """
+        Returns the share of attempts at exactly these pins that were converted
+        :param leave (int): The mask of pins standing
+        :return (float): The conversion rate, None if there were no attempts
+        """
+        attempts = self.attemptCounts[leave]
+
+        return self.conversionCounts[leave] / attempts if attempts else None
+
+    def getSums(self):
+        """
+        Returns the superset and subset sums of every bucket, building them
+            with one pass per pin if balls were recorded since the last build
+        :return (dict): For "leaves", "attempts" and "conversions", the
+            superset sums and the subset sums, each a list indexed by mask
+        """
+        if self.sums is None:
+            self.sums = {name: (buildSupersetSums(counts), buildSubsetSums(counts))
+                         for name, counts in (("leaves", self.leaveCounts),
+                                              ("attempts", self.attemptCounts),
+                                              ("conversions", self.conversionCounts))}
+
+        return self.sums
+
+    def getLeavesContaining(self, pins):
+        """
+        Returns how often a first ball left at least these pins standing
+        :param pins (int): A mask of pins, such as 0b1000000000 for the 10 pin
+        :return (int): The amount of first balls
+        """
+        return self.getSums()["leaves"][0][pins]
+
+    def getLeavesWithin(self, pins):
+        """
+        Returns how often a first ball left no pins outside of these
+        :param pins (int): A mask of pins
+        :return (int): The amount of first balls, including strikes
+        """
+        return self.getSums()["leaves"][1][pins]
+
+    def getConversionRateContaining(self, pins):
+        """
+        Returns the conversion rate of every leave with these pins standing
+        :param pins (int): A mask of pins
+        :return (float): The conversion rate, None if there were no attempts
+        """
+        sums = self.getSums()
+        attempts = sums["attempts"][0][pins]
+
+        return sums["conversions"][0][pins] / attempts if attempts else None
+
+    def getConversionRateWithin(self, pins):
+        """
+        Returns the conversion rate of every leave with no pins outside of these
+        :param pins (int): A mask of pins
+        :return (float): The conversion rate, None if there were no attempts
+        """
+        sums = self.getSums()
+        attempts = sums["attempts"][1][pins]
+
+        return sums["conversions"][1][pins] / attempts if attempts else None
+
+    def merge(self, other):
+        """
+        Adds the buckets of another histogram to these buckets
+        :param other (LeaveHistogram): The histogram to merge in
+        :return: None
+        """
+        for mask in range(PIN_MASK_COUNT):
+            self.leaveCounts[mask] += other.leaveCounts[mask]
+            self.attemptCounts[mask] += other.attemptCounts[mask]
+            self.conversionCounts[mask] += other.conversionCounts[mask]
+        self.firstBallCount += other.firstBallCount
+        self.sums = None
+
+        return
+
+class LeaveStats:
+    def __init__(self):
+        """
+        Constructor:
+        Creates a histogram for all bowlers together and none for any bowler
+        """
+        self.histograms = {ALL_BOWLERS: LeaveHistogram()}
+
+    def getHistogram(self, bowler=ALL_BOWLERS):
+        """
+        Getter for the leave histogram of a bowler
+        :param bowler (str): The name of the bowler, None for all bowlers
+        :return (LeaveHistogram): The histogram, None if the bowler has no balls
+        """
+        return self.histograms.get(bowler)
+
+    def getBowlers(self):
+        """
+        Returns the names of the bowlers with recorded balls
+        :return (list): The names in the order first recorded
+        """
+        return [bowler for bowler in self.histograms if bowler is not ALL_BOWLERS]
+
+    def recordBall(self, bowler, standing, leave, freshRack):
+        """
+        Records one ball for a bowler and for all bowlers
+        :param bowler (str): The name of the bowler, or None
+        :param standing (int): The mask of pins standing before the ball
+        :param leave (int): The mask of pins left standing after the ball
+        :param freshRack (boolean): True if the ball was bowled at a newly
+            set rack, False if it was bowled at the leave of an earlier ball
+        :return: None
+        """
+        histogram = self.histograms.get(bowler)
+        if histogram is None:
+            histogram = LeaveHistogram()
+            self.histograms[bowler] = histogram
+
+        # balls without a bowler only count toward all bowlers
+        targets = (histogram,) if bowler is ALL_BOWLERS else (histogram, self.histograms[ALL_BOWLERS])
+        for target in targets:
+            if freshRack:
+                target.recordFirstBall(leave)
+            else:
+                target.recordAttempt(standing, leave)
+
+        return
+
+    def recordGameLeaves(self, bowler, leaves):
+        """
+        Records a game from the pin leave of each of its 21 roll slots, as
+            stored by GameRecordFile, where 0xFFFF marks a ball not bowled
+        :param bowler (str): The name of the bowler
+        :param leaves (list): The 21 masks left standing after each roll
+        :return: None
+        """
+        fullRack = PIN_MASK_COUNT - 1
+
+        for slot in range(0, TENTH_FRAME_ROLL_INDEX, 2):
+            if leaves[slot] == UNBOWLED_LEAVE:
+                break
+            self.recordBall(bowler, fullRack, leaves[slot], True)
+            if leaves[slot + 1] != UNBOWLED_LEAVE:
+                self.recordBall(bowler, leaves[slot], leaves[slot + 1], False)
+
+        # the tenth frame sets a new rack after every strike or spare
+        standing = fullRack
+        for slot in range(TENTH_FRAME_ROLL_INDEX, ROLL_LIST_LENGTH):
+            if leaves[slot] == UNBOWLED_LEAVE:
+                break
+            self.recordBall(bowler, standing, leaves[slot], standing == fullRack)
+            standing = fullRack if leaves[slot] == EMPTY_RACK_MASK else leaves[slot]
+
+        return
+
+def buildSupersetSums(counts):
+    """
+    Sums every bucket into each of its subsets, so entry mask holds the
+        total of every bucket that has all of the pins in mask
+    :param counts (array): 1024 bucket counts indexed by mask
+    :return (list): The superset sums indexed by mask
+    """
+    sums = list(counts)
+    for pin in range(PIN_UPPER_BOUND):
+        bit = 1 << pin
+        for mask in range(PIN_MASK_COUNT):
+            if not mask & bit:
+                sums[mask] += sums[mask | bit]
+
+    return sums
+
+def buildSubsetSums(counts):
+    """
+    Sums every bucket into each of its supersets, so entry mask holds the
+        total of every bucket with no pins outside of mask
+    :param counts (array): 1024 bucket counts indexed by mask
+    :return (list): The subset sums indexed by mask
+    """
+    sums = list(counts)
+    for pin in range(PIN_UPPER_BOUND):
+        bit = 1 << pin
+        for mask in range(PIN_MASK_COUNT):
+            if mask & bit:
+                sums[mask] += sums[mask ^ bit]
+
+    return sums
+
+def main():
+    from GameEngineClass import GameEngine
+
+    stats = LeaveStats()
+    sevenTenSplit = 0b1001000000
+    tenPin = 0b1000000000
+
+    # a bowler who leaves the 7-10 and picks it up once, then leaves the 10 pin
+    games = [[0b0110111111, 0b1001000000] + [0b0110111111, 0] * 8 + [0b1111111111] * 3,
+             [0b0111111111, 0b1000000000] * 10 + [0b1111111111]]
+    for balls in games:
+        engine = GameEngine("Aidan", leaveStats=stats)
+        for mask in balls:
+            engine.bowlMask(mask)
+
+    histogram = stats.getHistogram("Aidan")
+    print(f"First balls: {histogram.getFirstBallCount()}, 7-10 splits: {histogram.getLeaveCount(sevenTenSplit)}, "
+          f"converted {histogram.getConversionRate(sevenTenSplit):.0%}")
+    print(f"Leaves with the 10 pin: {histogram.getLeavesContaining(tenPin)}, "
+          f"converted {histogram.getConversionRateContaining(tenPin):.0%}")
+
+    return
+
+if __name__ == "__main__":
+    main()
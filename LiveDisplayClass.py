@@ -0,0 +1,216 @@
+# Date: 10/18/26
+# Description: This file contains a class that keeps a live score sheet
+#   and pin rack on the terminal for lane displays. The last screen drawn
+#   is kept, and each new one is written as only the cells that changed,
+#   using ANSI cursor moves, so a ball costs a few bytes instead of a whole
+#   score sheet. Screens that arrive faster than the frame rate cap are
+#   held back until the next draw. The main function gives a demonstration.
+import select
+import sys
+import time
+
+from GameEngineClass import GameEngine
+from PinRackClass import getRackRender
+
+DEFAULT_FRAME_RATE = 30
+
+# ANSI control sequences, rows and columns start at 1
+ESCAPE = "\x1b["
+CLEAR_SCREEN = ESCAPE + "2J"
+CLEAR_LINE_END = ESCAPE + "K"
+CLEAR_SCREEN_END = ESCAPE + "J"
+
+# unchanged cells shorter than a cursor move are rewritten instead of skipped
+MERGE_GAP = 6
+
+class LiveDisplay:
+    def __init__(self, stream=None, maxFrameRate=DEFAULT_FRAME_RATE, clock=time.monotonic):
+        """
+        Constructor:
+        Creates a display that has not drawn anything yet
+        :param stream (file): Where the display is written, sys.stdout if None
+        :param maxFrameRate (float): The most screens drawn each second, 0 for no cap
+        :param clock (function): Returns the current time in seconds
+        """
+        self.stream = stream
+        self.minInterval = 1.0 / maxFrameRate if maxFrameRate else 0.0
+        self.clock = clock
+        self.screenLines = None
+        self.pendingLines = None
+        self.lastDrawTime = None
+        self.bytesWritten = 0
+        self.drawCount = 0
+
+    def getBytesWritten(self):
+        """
+        Getter for the amount of characters written to the terminal
+        :return (int): The characters written
+        """
+        return self.bytesWritten
+
+    def getDrawCount(self):
+        """
+        Getter for the amount of screens drawn
+        :return (int): The screens drawn
+        """
+        return self.drawCount
+
+    def getPending(self):
+        """
+        Getter for whether a screen is being held back by the frame rate cap
+        :return (boolean): True if a screen is waiting to be drawn
+        """
+        return self.pendingLines is not None
+
+    def update(self, screen, force=False):
+        """
+        Shows a new screen, or holds it back if the last one was drawn too recently
+        :param screen (str): The whole screen, one line per row
+        :param force (boolean): True to draw even if the frame rate cap is reached
+        :return (boolean): True if the screen was drawn
+        """
+        self.pendingLines = screen.rstrip("\n").split("\n")
+
+        now = self.clock()
+        if not force and self.lastDrawTime is not None and now - self.lastDrawTime < self.minInterval:
+            return False
+
+        self.flush()
+
+        return True
+
+    def flush(self):
+        """
+        Draws the screen held back by the frame rate cap, if there is one
+        :return: None
+        """
+        if self.pendingLines is None:
+            return
+
+        if self.screenLines is None:
+            output = CLEAR_SCREEN + moveCursor(1, 1) + "\n".join(self.pendingLines)
+        else:
+            output = buildScreenDiff(self.screenLines, self.pendingLines)
+
+        # leave the cursor under the display, clearing any old prompt text
+        output += moveCursor(len(self.pendingLines) + 1, 1) + CLEAR_SCREEN_END
+
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+
+        self.bytesWritten += len(output)
+        self.drawCount += 1
+        self.screenLines = self.pendingLines
+        self.pendingLines = None
+        self.lastDrawTime = self.clock()
+
+        return
+
+    def reset(self):
+        """
+        Forgets the screen on the terminal so the next one is drawn in full
+        :return: None
+        """
+        self.screenLines = None
+        self.lastDrawTime = None
+
+        return
+
+def moveCursor(row, column):
+    """
+    Builds the ANSI sequence that moves the cursor
+    :param row (int): The row, starting at 1
+    :param column (int): The column, starting at 1
+    :return (str): The control sequence
+    """
+    return f"{ESCAPE}{row};{column}H"
+
+def buildScreenDiff(oldLines, newLines):
+    """
+    Builds the output that turns one screen into another on the terminal,
+        writing only the runs of cells that changed
+    :param oldLines (list): The lines on the terminal
+    :param newLines (list): The lines to show
+    :return (str): Cursor moves and text
+    """
+    output = []
+
+    for row in range(max(len(oldLines), len(newLines))):
+        old = oldLines[row] if row < len(oldLines) else ""
+        new = newLines[row] if row < len(newLines) else ""
+        if old == new:
+            continue
+
+        # collect the changed runs of this line, joining runs with short gaps
+        runs = []
+        for column in range(min(len(old), len(new))):
+            if old[column] != new[column]:
+                if runs and column - runs[-1][1] <= MERGE_GAP:
+                    runs[-1][1] = column + 1
+                else:
+                    runs.append([column, column + 1])
+        if len(new) > len(old):
+            if runs and len(old) - runs[-1][1] <= MERGE_GAP:
+                runs[-1][1] = len(new)
+            else:
+                runs.append([len(old), len(new)])
+
+        for start, stop in runs:
+            output.append(moveCursor(row + 1, start + 1) + new[start:stop])
+
+        if len(new) < len(old):
+            output.append(moveCursor(row + 1, len(new) + 1) + CLEAR_LINE_END)
+
+    return "".join(output)
+
+def inputWaiting(stream):
+    """
+    Checks whether more input has already arrived, such as pasted or
+        piped balls, without waiting for it
+    :param stream (file): The input stream
+    :return (boolean): True if input is ready to read, False if it is
+        not or the stream cannot be checked
+    """
+    try:
+        ready = select.select([stream], [], [], 0)[0]
+    except (OSError, ValueError):
+        return False
+
+    return bool(ready)
+
+def renderLaneScreen(scoreSheet, leave):
+    """
+    Builds the screen of a lane display: the score sheet, the
+        running and max possible scores, and the last leave
+    :param scoreSheet (ScoreSheet): The score sheet of the game
+    :param leave (int): The mask of pins the last ball left standing
+    :return (str): The screen, one line per row
+    """
+    return (scoreSheet.renderScoreSheet()
+            + f"Score: {scoreSheet.getRunningScore():<4}Max possible: {scoreSheet.getMaxPossibleScore():<4}\n"
+            + getRackRender(leave) + "\n")
+
+def main():
+    # bowl the example game on a live display, then compare with full redraws
+    display = LiveDisplay(maxFrameRate=20)
+    engine = GameEngine()
+    balls = [10, 9, 0, 5, 5, 10, 0, 0, 2, 4, 10, 9, 1, 10, 10, 9, 1]
+    fullRedrawBytes = 0
+
+    display.update(renderLaneScreen(engine.getScoreSheet(), engine.getState().leave))
+    for pins in balls:
+        state = engine.bowl(pins)
+        screen = renderLaneScreen(engine.getScoreSheet(), state.leave)
+        fullRedrawBytes += len(screen)
+        display.update(screen)
+        time.sleep(0.1)
+    display.flush()
+
+    print(f"Balls: {len(balls)}, characters written: {display.getBytesWritten()} "
+          f"(full redraws would write {fullRedrawBytes})")
+
+    return
+
+if __name__ == "__main__":
+    main()
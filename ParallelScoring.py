@@ -0,0 +1,282 @@
+# Date: 10/18/26
+# Description: This file scores large game files with a pool of worker
+#   processes. The file is split into byte ranges that end on line breaks,
+#   each worker scores its range with the GameIngest reader, and the
+#   results are merged back together in the order of the input file.
+import argparse
+import math
+import os
+import sys
+from array import array
+from multiprocessing import Pool
+
+import GameIngest
+
+ENCODING = "utf-8"
+CHUNKS_PER_PROCESS = 4
+MIN_CHUNK_BYTES = 1 << 20
+
+class ScoringStats:
+    def __init__(self):
+        """
+        Constructor:
+        Keeps running sums of game scores so that the stats
+            from separate chunks can be merged together
+        """
+        self.gameCount = 0
+        self.incompleteCount = 0
+        self.scoreSum = 0
+        self.squareSum = 0
+        self.highGame = None
+        self.lowGame = None
+
+    def addGame(self, totalScore, complete=True):
+        """
+        Adds the total score of one game to the stats, a game that is
+            not complete is only counted, as in GameIngest --summary
+        :param totalScore (int): The total score of the game
+        :param complete (boolean): Whether the game has been fully bowled
+        :return: None
+        """
+        if not complete:
+            self.incompleteCount += 1
+            return
+
+        self.gameCount += 1
+        self.scoreSum += totalScore
+        self.squareSum += totalScore * totalScore
+        if self.highGame is None or totalScore > self.highGame:
+            self.highGame = totalScore
+        if self.lowGame is None or totalScore < self.lowGame:
+            self.lowGame = totalScore
+
+        return
+
+    def merge(self, other):
+        """
+        Adds the stats of another chunk to these stats
+        :param other (ScoringStats): The stats to merge in
+        :return: None
+        """
+        self.gameCount += other.gameCount
+        self.incompleteCount += other.incompleteCount
+        self.scoreSum += other.scoreSum
+        self.squareSum += other.squareSum
+        if other.highGame is not None and (self.highGame is None or other.highGame > self.highGame):
+            self.highGame = other.highGame
+        if other.lowGame is not None and (self.lowGame is None or other.lowGame < self.lowGame):
+            self.lowGame = other.lowGame
+
+        return
+
+    def getGameCount(self):
+        """
+        Getter for the amount of complete games scored
+        :return (int): The amount of games
+        """
+        return self.gameCount
+
+    def getIncompleteCount(self):
+        """
+        Getter for the amount of games that were not complete
+        :return (int): The amount of games
+        """
+        return self.incompleteCount
+
+    def getAverage(self):
+        """
+        Getter for the average game score
+        :return (float): The average score, 0 if no games were scored
+        """
+        if self.gameCount == 0:
+            return 0.0
+
+        return self.scoreSum / self.gameCount
+
+    def getStandardDeviation(self):
+        """
+        Getter for the population standard deviation of the game scores
+        :return (float): The standard deviation, 0 if no games were scored
+        """
+        if self.gameCount == 0:
+            return 0.0
+
+        variance = self.squareSum / self.gameCount - self.getAverage() ** 2
+
+        return math.sqrt(max(variance, 0.0))
+
+    def getHighGame(self):
+        """
+        Getter for the highest game score
+        :return (int): The high game, None if no games were scored
+        """
+        return self.highGame
+
+    def getLowGame(self):
+        """
+        Getter for the lowest game score
+        :return (int): The low game, None if no games were scored
+        """
+        return self.lowGame
+
+def splitByteRanges(path, chunkCount):
+    """
+    Splits a file into byte ranges that each start at the beginning of a line
+    :param path (str): The path of the file
+    :param chunkCount (int): The amount of ranges wanted
+    :return (list): (start, end) byte offsets covering the whole file in order
+    """
+    fileSize = os.path.getsize(path)
+    boundaries = [0]
+
+    with open(path, "rb") as gameFile:
+        for i in range(1, chunkCount):
+            # move each split point forward to just past a line break
+            gameFile.seek(max(fileSize * i // chunkCount, boundaries[-1]))
+            if gameFile.tell() > 0:
+                gameFile.seek(gameFile.tell() - 1)
+                gameFile.readline()
+            if gameFile.tell() < fileSize:
+                boundaries.append(gameFile.tell())
+
+    boundaries.append(fileSize)
+
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)
+            if boundaries[i] < boundaries[i + 1]]
+
+def readByteRange(path, start, end):
+    """
+    Generator for the lines of a file inside a byte range
+    :param path (str): The path of the file
+    :param start (int): The offset of the first byte of the range
+    :param end (int): The offset just past the last byte of the range
+    :return (generator): Each line in the range as a string
+    """
+    with open(path, "rb") as gameFile:
+        gameFile.seek(start)
+        position = start
+        while position < end:
+            line = gameFile.readline()
+            if line == b"":
+                break
+            position += len(line)
+            yield line.decode(ENCODING)
+
+    return
+
+def scoreByteRange(task):
+    """
+    Worker function: scores the games inside one byte range
+    :param task (tuple): The path, start offset, end offset
+        and whether invalid lines are skipped
+    :return (tuple): The amount of lines read, the line numbers, total
+        scores and completion (1 or 0) of the games in the range as
+        arrays, and their ScoringStats
+    """
+    path, start, end, skipInvalid = task
+    lineNumbers = array("L")
+    totals = array("H")
+    completes = array("B")
+    stats = ScoringStats()
+    lineCount = 0
+
+    def countLines(lines):
+        nonlocal lineCount
+        for line in lines:
+            lineCount += 1
+            yield line
+
+    try:
+        for game in GameIngest.readGames(countLines(readByteRange(path, start, end)), skipInvalid):
+            lineNumbers.append(game.lineNumber)
+            totals.append(game.totalScore)
+            completes.append(game.complete)
+            stats.addGame(game.totalScore, game.complete)
+    except ValueError as error:
+        # workers only know line numbers relative to their own range
+        raise ValueError(f"Range starting at byte {start}: {error}") from None
+
+    return lineCount, lineNumbers, totals, completes, stats
+
+def scoreFileChunks(path, processes=None, skipInvalid=False):
+    """
+    Generator that scores a file in parallel and yields the
+        results of each chunk in the order of the file
+    :param path (str): The path of the file
+    :param processes (int): The amount of worker processes, one per core if None
+    :param skipInvalid (boolean): True to skip lines that are not valid games
+    :return (generator): For every chunk, the file line numbers, total
+        scores and completion of its games as arrays, and the chunk's ScoringStats
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    # several chunks per process keeps every core busy until the end
+    chunkCount = max(1, min(processes * CHUNKS_PER_PROCESS,
+                            os.path.getsize(path) // MIN_CHUNK_BYTES))
+    tasks = [(path, start, end, skipInvalid) for start, end in splitByteRanges(path, chunkCount)]
+
+    lineOffset = 0
+    with Pool(processes) as pool:
+        for lineCount, lineNumbers, totals, completes, stats in pool.imap(scoreByteRange, tasks):
+            yield array("L", [lineNumber + lineOffset for lineNumber in lineNumbers]), totals, completes, stats
+            lineOffset += lineCount
+
+    return
+
+def scoreFileParallel(path, processes=None, skipInvalid=False):
+    """
+    Scores every game of a file in parallel
+    :param path (str): The path of the file
+    :param processes (int): The amount of worker processes, one per core if None
+    :param skipInvalid (boolean): True to skip lines that are not valid games
+    :return (tuple): The total score and completion of every game in
+        file order as arrays, and the ScoringStats of the whole file
+    """
+    totals = array("H")
+    completes = array("B")
+    stats = ScoringStats()
+
+    for lineNumbers, chunkTotals, chunkCompletes, chunkStats in scoreFileChunks(path, processes, skipInvalid):
+        totals.extend(chunkTotals)
+        completes.extend(chunkCompletes)
+        stats.merge(chunkStats)
+
+    return totals, completes, stats
+
+def main(argv=None):
+    """
+    Command line entry point: scores a game file with a process pool and
+        writes the line number, total and completion of each game
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Score a large bowling game file with a process pool")
+    parser.add_argument("path", help="game file with one game per line")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes, defaults to one per core")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="skip lines that are not valid games")
+    parser.add_argument("--summary", action="store_true",
+                        help="only print the merged statistics")
+    args = parser.parse_args(argv)
+
+    stats = ScoringStats()
+    for lineNumbers, totals, completes, chunkStats in scoreFileChunks(args.path, args.processes,
+                                                                      args.skip_invalid):
+        stats.merge(chunkStats)
+        if not args.summary:
+            sys.stdout.write("".join(f"{lineNumbers[i]},{totals[i]},{completes[i]}\n"
+                                     for i in range(len(totals))))
+
+    # incomplete games are left out of the statistics, as in GameIngest --summary
+    print(f"Games: {stats.getGameCount()}, Average: {stats.getAverage():.2f}, "
+          f"Std Dev: {stats.getStandardDeviation():.2f}, "
+          f"High: {stats.getHighGame()}, Low: {stats.getLowGame()}, "
+          f"Incomplete: {stats.getIncompleteCount()}",
+          file=sys.stderr if not args.summary else sys.stdout)
+
+    return
+
+if __name__ == "__main__":
+    main()
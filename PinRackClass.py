@@ -2,6 +2,10 @@
 # Date: 7/26/24
 # Description: This file contains a class that represents a pin rack
 #   in bowling. The main function gives a demonstration of the class.
+import json
+import os
+
+import Instrumentation
 
 PIN_LOWER_BOUND = 1
 PIN_UPPER_BOUND = 10
@@ -12,10 +16,26 @@ PIN_DOWN_VALUE = False
 # creates a list from 1-10 that are integers used to refer to each pin
 PIN_LABELS = [x for x in range(PIN_LOWER_BOUND, PIN_UPPER_BOUND + 1)]
 
+# bitmask values: bit (pin - 1) is set while that pin is standing
+PIN_MASK_COUNT = 1 << PIN_UPPER_BOUND
+FULL_RACK_MASK = PIN_MASK_COUNT - 1
+EMPTY_RACK_MASK = 0
+
+# precomputed tables indexed by the standing pin mask
+PIN_SCORE_TABLE = tuple(PIN_UPPER_BOUND - bin(mask).count("1")
+                        for mask in range(PIN_MASK_COUNT))
+ALL_DOWNED_TABLE = tuple(mask == EMPTY_RACK_MASK for mask in range(PIN_MASK_COUNT))
+
 ERROR_INVALID_ENTRY = "Error: Invalid entry"
 SHOT_SCORE_PROMPT_LINE_ONE = "Enter the pins knocked down for the first bowl"
 SHOT_SCORE_PROMPT_LINE_TWO = "(use pin #'s and X for pin 10, do not include spaces): "
 
+# environment variable naming a saved rack diagram table to load
+RACK_TABLE_PATH_VARIABLE = "BOWLING_RACK_TABLE"
+
+# diagrams for all 1024 pin masks, built on first use
+rackDiagramTable = None
+
 class PinRack:
     def __init__(self):
         """
@@ -57,6 +77,7 @@ class PinRack:
 
         return value
 
+    @Instrumentation.counted("pin_updates")
     def setPin(self, key, value):
         """
         Sets the value of a pin to a user-specified value
@@ -69,6 +90,18 @@ class PinRack:
 
         return
 
+    def setPinsDown(self, mask):
+        """
+        Knocks down every pin in a mask, pins already down stay down
+        :param mask (int): A mask with bit (pin - 1) set for each pin knocked down
+        :return: None
+        """
+        for pin in self.pinDictionary:
+            if mask >> (pin - 1) & 1:
+                self.pinDictionary[pin] = PIN_DOWN_VALUE
+
+        return
+
     def checkAllDowned(self):
         """
         Checks if all pins have been knocked down
@@ -95,6 +128,19 @@ class PinRack:
 
         return score
 
+    def getPinMask(self):
+        """
+        Returns the pins that are standing as a 10-bit integer
+        :return (int): A mask with bit (pin - 1) set for each standing pin
+        """
+        mask = EMPTY_RACK_MASK
+
+        for pin in self.pinDictionary:
+            if self.pinDictionary[pin] == DEFAULT_PIN_VALUE:
+                mask |= 1 << (pin - 1)
+
+        return mask
+
     def resetPins(self):
         """
         Function sets all values in the pin
@@ -111,41 +157,181 @@ class PinRack:
         Returns a string representation of the pin rack
         :return: a string representation of the pin rack
         """
-        result = ""
+        return getRackRender(self.getPinMask())
+
+class CompactPinRack(PinRack):
+    def __init__(self):
+        """
+        Constructor:
+        Creates a representation of a bowling pin rack using a 10-bit
+            integer, bit (pin - 1) is set while that pin is standing
+        """
+        self.pinMask = FULL_RACK_MASK
+
+    def getPin(self, key):
+        """
+        Returns the boolean value stored for a user-given pin
+        :param key: The label of the pin
+        :return: Returns the boolean value stored for a specific pin
+        """
+        if key in PIN_LABELS:
+            value = bool(self.pinMask >> (key - 1) & 1)
+        else:
+            value = None
+
+        return value
+
+    @Instrumentation.counted("pin_updates")
+    def setPin(self, key, value):
+        """
+        Sets the value of a pin to a user-specified value
+        :param key: The label of the pin
+        :param value: The value stored for the pin
+        :return: None
+        """
+        if key in PIN_LABELS:
+            if value == DEFAULT_PIN_VALUE:
+                self.pinMask |= 1 << (key - 1)
+            else:
+                self.pinMask &= ~(1 << (key - 1))
 
-        pinsList = PIN_LABELS.copy()
+        return
 
-        # loop through list and replace values with X if not standing
-        for pin in PIN_LABELS:
-            key = pinsList[pin - 1]
-            if not self.pinDictionary[key]:
-                pinsList[pin - 1] = "X"
+    def setPinMask(self, mask):
+        """
+        Sets every pin at once from a 10-bit integer
+        :param mask (int): A mask with bit (pin - 1) set for each standing pin
+        :return: None
+        """
+        self.pinMask = mask & FULL_RACK_MASK
 
-        pinsLeft = PIN_UPPER_BOUND
+        return
 
-        for row in range(PIN_DISPLAY_EDGE_LENGTH, 0, -1):
+    def getPinMask(self):
+        """
+        Returns the pins that are standing as a 10-bit integer
+        :return (int): A mask with bit (pin - 1) set for each standing pin
+        """
+        return self.pinMask
 
-            result += " "
+    def setPinsDown(self, mask):
+        """
+        Knocks down every pin in a mask, pins already down stay down
+        :param mask (int): A mask with bit (pin - 1) set for each pin knocked down
+        :return: None
+        """
+        self.pinMask &= ~mask
+
+        return
+
+    def checkAllDowned(self):
+        """
+        Checks if all pins have been knocked down
+        :return (bool): True if all pins are down, False otherwise
+        """
+        return ALL_DOWNED_TABLE[self.pinMask]
 
-            # assign spaces to the absolute value of rows minus length of triangle
-            if row - 4 < 0:
-                spaceCount = (row - 4) * -1
+    def getPinScore(self):
+        """
+        Looks up the amount of downed pins for the current mask
+        :return (int): score for the shot
+        """
+        return PIN_SCORE_TABLE[self.pinMask]
+
+    def resetPins(self):
+        """
+        Function sets every pin back to standing
+        :return: None
+        """
+        self.pinMask = FULL_RACK_MASK
+
+        return
+
+def renderPinMask(mask):
+    """
+    Builds the rack diagram for a mask of standing pins
+    :param mask (int): A mask with bit (pin - 1) set for each standing pin
+    :return (str): The rack diagram, downed pins are shown as X
+    """
+    result = ""
+    pinsLeft = PIN_UPPER_BOUND
+
+    for row in range(PIN_DISPLAY_EDGE_LENGTH, 0, -1):
+        result += " " * (PIN_DISPLAY_EDGE_LENGTH - row + 1)
+
+        # print the pins for each row
+        for pin in range(pinsLeft - row + 1, pinsLeft + 1):
+            if mask >> (pin - 1) & 1:
+                result += str(pin) + " "
             else:
-                spaceCount = row - 4
+                result += "X "
+        pinsLeft -= row
+
+        result += "\n"
+
+    return result
+
+def buildRackDiagramTable():
+    """
+    Builds the rack diagram for every possible mask of standing pins
+    :return (tuple): The diagrams indexed by pin mask
+    """
+    return tuple(renderPinMask(mask) for mask in range(PIN_MASK_COUNT))
+
+def getRackDiagramTable():
+    """
+    Returns the table of rack diagrams, loading it from the file named by
+        BOWLING_RACK_TABLE or building it the first time it is needed
+    :return (tuple): The diagrams indexed by pin mask
+    """
+    global rackDiagramTable
+
+    if rackDiagramTable is None:
+        path = os.environ.get(RACK_TABLE_PATH_VARIABLE)
+        if path and os.path.exists(path):
+            loadRackDiagramTable(path)
+        else:
+            rackDiagramTable = buildRackDiagramTable()
+
+    return rackDiagramTable
+
+def saveRackDiagramTable(path):
+    """
+    Writes the table of rack diagrams to a JSON file
+    :param path (str): The path of the file to write
+    :return: None
+    """
+    with open(path, "w") as tableFile:
+        json.dump(list(getRackDiagramTable()), tableFile)
 
-            # print the spaces for each row
-            for space in range(spaceCount):
-                result += " "
+    return
+
+def loadRackDiagramTable(path):
+    """
+    Replaces the table of rack diagrams with one saved by saveRackDiagramTable
+    :param path (str): The path of the saved table
+    :return: None
+    """
+    global rackDiagramTable
+
+    with open(path) as tableFile:
+        table = json.load(tableFile)
 
-            # print the pins for each row
-            for pin in range(pinsLeft - row, pinsLeft):
-                result += str(pinsList[pin]) + " "
-                pinsLeft -= 1
+    if len(table) != PIN_MASK_COUNT or not all(isinstance(diagram, str) for diagram in table):
+        raise ValueError(f"{path} is not a table of {PIN_MASK_COUNT} rack diagrams")
 
-            # print empty line for the new row
-            result += "\n"
+    rackDiagramTable = tuple(table)
+
+    return
 
-        return result
+@Instrumentation.timed("rack_renders")
+def getRackRender(mask):
+    """
+    Returns the rack diagram for a mask of standing pins
+    :param mask (int): A mask with bit (pin - 1) set for each standing pin
+    :return (str): The rack diagram
+    """
+    return getRackDiagramTable()[mask]
 
 def main():
     rack = PinRack()
@@ -0,0 +1,148 @@
+# Date: 10/18/26
+# Description: This file turns pin strings such as "1247X", the pin
+#   numbers knocked down by a ball with X for pin 10, into pin masks.
+#   Each character is looked up in a 256 entry table of pin bits, and
+#   batches of strings are looked up together with NumPy. The main
+#   function gives a demonstration.
+import numpy as np
+
+import Instrumentation
+
+PIN_LOWER_BOUND = 1
+PIN_UPPER_BOUND = 10
+PIN_TEN_LABEL = "X"
+INVALID_PIN = -1
+ENCODING = "latin-1"
+
+def buildPinCharacterTable():
+    """
+    Builds the table that maps each byte value to the bit of its pin
+    :return (tuple): 256 entries, bit (pin - 1) for a pin label,
+        -1 for any byte that is not a pin label
+    """
+    table = [INVALID_PIN] * 256
+
+    for pin in range(PIN_LOWER_BOUND, PIN_UPPER_BOUND):
+        table[ord(str(pin))] = 1 << (pin - 1)
+    table[ord(PIN_TEN_LABEL)] = 1 << (PIN_UPPER_BOUND - 1)
+
+    return tuple(table)
+
+PIN_CHARACTER_TABLE = buildPinCharacterTable()
+
+class PinStringError(ValueError):
+    def __init__(self, pinString, position, stringIndex=None):
+        """
+        Constructor:
+        :param pinString (str): The pin string that could not be parsed
+        :param position (int): The index of the invalid character
+        :param stringIndex (int): The index of the string in its batch,
+            None when a single string was parsed
+        """
+        self.pinString = pinString
+        self.position = position
+        self.stringIndex = stringIndex
+
+        message = f"invalid pin {pinString[position]!r} at position {position + 1} of {pinString!r}"
+        if stringIndex is not None:
+            message = f"string {stringIndex + 1}: " + message
+        ValueError.__init__(self, message)
+
+@Instrumentation.timed("pin_string_parses")
+def parsePinString(pinString):
+    """
+    Converts one pin string into a mask of the pins knocked down,
+        an empty string means no pins were knocked down
+    :param pinString (str): Pin numbers 1-9 and X for pin 10, without spaces
+    :return (int): A mask with bit (pin - 1) set for each pin knocked down
+    """
+    mask = 0
+
+    for character in pinString.encode(ENCODING, "replace"):
+        bit = PIN_CHARACTER_TABLE[character]
+        if bit == INVALID_PIN:
+            break
+        mask |= bit
+    else:
+        return mask
+
+    raise PinStringError(pinString, findInvalidPosition(pinString))
+
+def parsePinStrings(pinStrings):
+    """
+    Converts a batch of pin strings into pin masks with NumPy. The strings
+        are joined into one byte buffer, every byte is looked up in the
+        character table at once, and each string's pin bits are combined
+        with a bitwise or over its slice of the buffer
+    :param pinStrings (iterable): The pin strings to parse
+    :return (list): The mask of the pins knocked down for each string
+    """
+    pinStrings = list(pinStrings)
+    if not pinStrings:
+        return []
+
+    # latin-1 with replacement keeps one byte per character
+    buffer = np.frombuffer("".join(pinStrings).encode(ENCODING, "replace"), dtype=np.uint8)
+    lengths = np.fromiter((len(pinString) for pinString in pinStrings), dtype=np.int64, count=len(pinStrings))
+    starts = np.cumsum(lengths) - lengths
+
+    bits = np.array(PIN_CHARACTER_TABLE, dtype=np.int16)[buffer]
+    invalid = np.flatnonzero(bits == INVALID_PIN)
+    if invalid.size:
+        stringIndex = int(np.searchsorted(starts, invalid[0], side="right")) - 1
+        # an empty string shares its start with the next string
+        while lengths[stringIndex] == 0:
+            stringIndex += 1
+        raise PinStringError(pinStrings[stringIndex], int(invalid[0] - starts[stringIndex]), stringIndex)
+
+    # reduceat needs increasing starts, so empty strings are left at 0
+    masks = np.zeros(len(pinStrings), dtype=np.int16)
+    nonEmpty = lengths > 0
+    if buffer.size:
+        masks[nonEmpty] = np.bitwise_or.reduceat(bits, starts[nonEmpty])
+
+    return masks.tolist()
+
+def findInvalidPosition(pinString):
+    """
+    Finds the first character of a pin string that is not a pin label
+    :param pinString (str): The pin string
+    :return (int): The index of the invalid character
+    """
+    for position in range(len(pinString)):
+        character = pinString[position]
+        if ord(character) > 255 or PIN_CHARACTER_TABLE[ord(character)] == INVALID_PIN:
+            return position
+
+    return len(pinString)
+
+def maskToPinString(mask):
+    """
+    Converts a pin mask back into a pin string
+    :param mask (int): A mask with bit (pin - 1) set for each pin
+    :return (str): The pin numbers in order, X for pin 10
+    """
+    result = ""
+
+    for pin in range(PIN_LOWER_BOUND, PIN_UPPER_BOUND + 1):
+        if mask >> (pin - 1) & 1:
+            if pin == PIN_UPPER_BOUND:
+                result += PIN_TEN_LABEL
+            else:
+                result += str(pin)
+
+    return result
+
+def main():
+    print(parsePinStrings(["1247X", "", "123456789X", "7X"]))
+    print(maskToPinString(parsePinString("X7")))
+
+    try:
+        parsePinStrings(["12", "3 5"])
+    except PinStringError as error:
+        print(error)
+
+    return
+
+if __name__ == "__main__":
+    main()
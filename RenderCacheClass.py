@@ -0,0 +1,114 @@
+# Date: 10/18/26
+# Description: This file contains a class that remembers rendered text
+#   keyed by a fingerprint of the state it was rendered from. The least
+#   recently used entry is dropped once the cache is full. The main
+#   function gives a demonstration of the class.
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 1024
+
+class RenderCache:
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE):
+        """
+        Constructor:
+        :param maxSize (int): The most renders kept before the
+            least recently used one is dropped
+        """
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Looks up a render and marks it as recently used
+        :param key: The state fingerprint the render was stored with
+        :return (str): The render, or None if it is not in the cache
+        """
+        render = self.entries.get(key)
+
+        if render is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return render
+
+    def put(self, key, render):
+        """
+        Stores a render, dropping the least recently used
+            render if the cache is full
+        :param key: The state fingerprint of the render
+        :param render (str): The rendered text
+        :return: None
+        """
+        self.entries[key] = render
+        self.entries.move_to_end(key)
+
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+        return
+
+    def clear(self):
+        """
+        Removes every render and resets the counters
+        :return: None
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+        return
+
+    def getHits(self):
+        """
+        Getter for the amount of lookups that found a render
+        :return (int): The amount of cache hits
+        """
+        return self.hits
+
+    def getMisses(self):
+        """
+        Getter for the amount of lookups that did not find a render
+        :return (int): The amount of cache misses
+        """
+        return self.misses
+
+    def getSize(self):
+        """
+        Getter for the amount of renders stored
+        :return (int): The amount of renders in the cache
+        """
+        return len(self.entries)
+
+    def getMaxSize(self):
+        """
+        Getter for the most renders the cache keeps
+        :return (int): The maximum size of the cache
+        """
+        return self.maxSize
+
+    def __str__(self):
+        """
+        Returns a summary of the cache counters
+        :return: a string summary of the cache
+        """
+        return (f"RenderCache(size={len(self.entries)}/{self.maxSize}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+def main():
+    cache = RenderCache(2)
+
+    cache.put(1, "one")
+    cache.put(2, "two")
+    print(cache.get(1))
+    cache.put(3, "three")  # drops 2, the least recently used
+    print(cache.get(2))
+    print(cache)
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Date: 10/18/26
+# Description: This file works out the exact distribution of final scores
+#   over every way a game can be bowled. A memoized dynamic program walks
+#   the scoring states of ScoringTable, so each state's distribution of
+#   points still to come is built once from the states after it. Balls can
+#   be counted equally or weighted by the chance of each pin count. The
+#   main function gives a demonstration.
+import math
+import time
+
+import ScoringTable
+
+MAX_SCORE = 300
+MARK_SCORE = ScoringTable.MARK_SCORE
+PIN_VALUE_COUNT = ScoringTable.PIN_VALUE_COUNT
+
+# every sequence of balls that makes a complete game
+TOTAL_GAME_COUNT = 5726805883325784576
+
+def buildBinomialWeights(pinProbability):
+    """
+    Builds pin count weights for a bowler who knocks down
+        each standing pin on its own with the same chance
+    :param pinProbability (float): The chance of knocking down any one pin
+    :return (list): Entry [standing][pins] is the chance of knocking down
+        that many of the standing pins
+    """
+    weights = []
+    for standing in range(PIN_VALUE_COUNT):
+        weights.append([math.comb(standing, pins) * pinProbability ** pins
+                        * (1 - pinProbability) ** (standing - pins)
+                        for pins in range(standing + 1)])
+
+    return weights
+
+def getRemainingDistribution(state, weights=None, memo=None):
+    """
+    Returns the distribution of the points still to be scored from a state
+    :param state (int): A ScoringTable state number
+    :param weights (list): Entry [standing][pins] weights knocking down that
+        many pins with that many standing, every ball counts once if None
+    :param memo (dict): The distributions already built for these weights
+    :return (list): Entry n is the weight of the games that score n more points
+    """
+    if memo is None:
+        memo = {}
+
+    distribution = memo.get(state)
+    if distribution is not None:
+        return distribution
+
+    if state == ScoringTable.DONE_STATE_NUMBER:
+        distribution = [1]
+    else:
+        standing = ScoringTable.SCORING_STATES[state][2]
+        distribution = []
+        for pins in range(standing + 1):
+            weight = 1 if weights is None else weights[standing][pins]
+            if not weight:
+                continue
+            nextState, points = ScoringTable.stepState(state, pins)
+            following = getRemainingDistribution(nextState, weights, memo)
+
+            # shift the following distribution by the points of this ball
+            if len(distribution) < points + len(following):
+                distribution.extend([0] * (points + len(following) - len(distribution)))
+            for score, count in enumerate(following, points):
+                if count:
+                    distribution[score] += weight * count
+
+    memo[state] = distribution
+
+    return distribution
+
+def getScoreDistribution(weights=None):
+    """
+    Returns the distribution of final scores over every complete game
+    :param weights (list): Entry [standing][pins] weights knocking down that
+        many pins with that many standing, every ball counts once if None
+    :return (list): Entry n, from 0-300, is the amount of ball sequences
+        that score n, or their chance when weighted by probabilities
+    """
+    distribution = getRemainingDistribution(ScoringTable.START_STATE_NUMBER, weights)
+
+    return distribution + [0] * (MAX_SCORE + 1 - len(distribution))
+
+def getGameDistribution(balls, weights=None):
+    """
+    Returns the distribution of final scores for a game in progress
+    :param balls (list): The pins knocked down by each ball bowled so far
+    :param weights (list): Entry [standing][pins] weights knocking down that
+        many pins with that many standing, every ball counts once if None
+    :return (list): Entry n, from 0-300, is the amount of ways to finish
+        the game with a score of n, or their chance when weighted
+    """
+    state = ScoringTable.START_STATE_NUMBER
+    score = 0
+    for pins in balls:
+        state, points = ScoringTable.stepState(state, pins)
+        score += points
+
+    distribution = [0] * score + getRemainingDistribution(state, weights)
+
+    return distribution + [0] * (MAX_SCORE + 1 - len(distribution))
+
+def main():
+    start = time.perf_counter()
+    counts = getScoreDistribution()
+    countTime = time.perf_counter() - start
+
+    gameCount = sum(counts)
+    mostCommon = max(range(MAX_SCORE + 1), key=counts.__getitem__)
+    print(f"Complete games: {gameCount:,} ({'matches' if gameCount == TOTAL_GAME_COUNT else 'does not match'} "
+          f"the known total), built in {countTime * 1000:.0f} ms")
+    print(f"Most common score: {mostCommon}, perfect games: {counts[MAX_SCORE]}")
+
+    start = time.perf_counter()
+    chances = getScoreDistribution(buildBinomialWeights(0.85))
+    average = sum(score * chance for score, chance in enumerate(chances))
+    print(f"Bowler hitting each pin 85% of the time: average {average:.1f}, "
+          f"chance of 200 or more {sum(chances[200:]):.2%}, "
+          f"built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    remaining = getGameDistribution([10, 10, 10, 10, 10, 10, 10, 10, 10])
+    print(f"Ways to finish nine strikes with 300: {remaining[MAX_SCORE]} of {sum(remaining)}")
+
+    return
+
+if __name__ == "__main__":
+    main()
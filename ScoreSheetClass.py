@@ -4,6 +4,9 @@
 #   class that keeps track of the score for each
 #   frame as well as the total and max possible score
 import FrameClass
+import Instrumentation
+import ScoringTable
+from RenderCacheClass import RenderCache
 
 FRAME_UPPER_BOUND = 10
 BORDER_LENGTH = 52
@@ -13,29 +16,160 @@ NINTH_FRAME_INDEX = 8
 TENTH_FRAME_INDEX = 9
 IN_PROGRESS_MESSAGE = "Game in progress..."
 
+# roll list values: two slots for each of frames 1-9 and three for the tenth
+ROLL_LIST_LENGTH = 21
+TENTH_FRAME_ROLL_INDEX = 18
+UNBOWLED_VALUE = -1
+STRIKE_BONUS_BALLS = 2
+SPARE_BONUS_BALLS = 1
+
+# display lines that never change, built once
+OUTER_BORDER_LINE = "+" + "=" * BORDER_LENGTH + "+\n"
+INNER_BORDER_LINE = "+" + "-" * BORDER_LENGTH + "+\n"
+FRAME_LINE = "+ Frame:" + "".join(f"| {i} " for i in range(1, FRAME_UPPER_BOUND + 1)) + " |  +\n"
+
+# rolls shown as symbols: 0 as -, -1 (not bowled) as a blank
+ROLL_SYMBOLS = {0: "-", -1: " ", "X": "X", "/": "/"}
+ROLL_SYMBOLS.update({pins: str(pins) for pins in range(1, 11)})
+
+# fingerprints pack each roll plus one into four bits
+ROLL_FINGERPRINT_BITS = 4
+SCORE_SHEET_CACHE_SIZE = 4096
+SCORE_SHEET_RENDER_CACHE = RenderCache(SCORE_SHEET_CACHE_SIZE)
+
 class ScoreSheet:
-    def __init__(self):
+    def __init__(self, rolls=None):
         """
-        Constructor
+        Constructor:
+        The rolls are kept in a buffer laid out like getRollList, and
+            Frame objects are only created when getNthFrame asks for them.
+            Wrapped rolls are checked and scored the first time a frame
+            or a score is read
+        :param rolls (list): The 21 rolls of a game to wrap, -1 is not
+            bowled, or None for an empty score sheet
         """
-        self.frameList = []
+        # frames are created from the roll buffer the first time they are used
+        self.frameList = [None] * FRAME_UPPER_BOUND
         self.totalScore = []
 
-        # append nine standard frames
-        for i in range(FRAME_UPPER_BOUND - 1):
-            self.frameList.append(FrameClass.Frame())
-
-        # append tenth frame
-        self.frameList.append(FrameClass.TenthFrame())
-
         self.completeGame = False
 
+        # incremental scoring state updated by addBowl
+        self.currentFrame = 0
+        self.currentBall = 0
+        self.pinsStanding = MARK_SCORE
+        self.runningScore = 0
+        self.scoringState = ScoringTable.START_STATE_NUMBER
+
+        if rolls is None:
+            self.rollBuffer = [UNBOWLED_VALUE] * ROLL_LIST_LENGTH
+            self.frameScores = [0] * FRAME_UPPER_BOUND
+            self.pendingBonuses = []
+            self.cumulativeScores = [0] * FRAME_UPPER_BOUND
+        else:
+            # plain ints, so rows of NumPy int8 rolls index the tables safely
+            self.rollBuffer = [int(roll) for roll in rolls]
+            if len(self.rollBuffer) != ROLL_LIST_LENGTH:
+                raise ValueError(f"a game needs {ROLL_LIST_LENGTH} rolls, got {len(self.rollBuffer)}")
+            # None until the rolls are scored by loadRollState
+            self.frameScores = None
+            self.pendingBonuses = None
+            self.cumulativeScores = None
+
     def getNthFrame(self, n):
         """
         Returns the frame at the index value of n in (0-9)
         :param n: the index value of the frame: Starting from 0-9
         """
-        return self.frameList[n]
+        frame = self.frameList[n]
+
+        if frame is None:
+            frame = self.buildFrame(n)
+            self.frameList[n] = frame
+
+        return frame
+
+    def buildFrame(self, n):
+        """
+        Creates the frame at index n from the roll buffer, setting its
+            bowls the same way addBowl would have
+        :param n: the index value of the frame: Starting from 0-9
+        :return (Frame): The frame, a TenthFrame for index 9
+        """
+        self.checkScored()
+
+        start = 2 * n
+
+        if n < TENTH_FRAME_INDEX:
+            frame = FrameClass.Frame()
+        else:
+            frame = FrameClass.TenthFrame()
+            if self.rollBuffer[start + 2] != UNBOWLED_VALUE:
+                frame.setThirdBowl(self.rollBuffer[start + 2])
+
+        if self.rollBuffer[start] != UNBOWLED_VALUE:
+            frame.setFirstBowl(self.rollBuffer[start])
+        if self.rollBuffer[start + 1] != UNBOWLED_VALUE:
+            frame.setSecondBowl(self.rollBuffer[start + 1])
+        frame.setFrameScore(self.frameScores[n])
+
+        return frame
+
+    def checkScored(self):
+        """
+        Scores wrapped rolls if nothing has been read from them yet
+        :return: None
+        """
+        if self.frameScores is None:
+            self.loadRollState()
+
+        return
+
+    def loadRollState(self):
+        """
+        Fills the frame scores and the incremental scoring state from
+            the wrapped rolls without creating any frames
+        :return: None
+        """
+        rolls = self.rollBuffer
+        state, runningScore = ScoringTable.walkRollList(rolls)
+
+        self.frameScores = scoreRollList(rolls)
+        self.cumulativeScores = [0] * FRAME_UPPER_BOUND
+        self.pendingBonuses = []
+        self.scoringState = state
+        self.runningScore = runningScore
+
+        if state == ScoringTable.DONE_STATE_NUMBER:
+            self.completeGame = True
+            self.currentFrame = TENTH_FRAME_INDEX
+            self.currentBall = 0
+            self.pinsStanding = 0
+        else:
+            self.currentFrame, self.currentBall, self.pinsStanding = ScoringTable.SCORING_STATES[state][:3]
+
+        # frames that have started hold a cumulative score
+        lastStarted = self.currentFrame if self.currentBall > 0 or self.completeGame else self.currentFrame - 1
+        total = 0
+        for i in range(lastStarted + 1):
+            total += self.frameScores[i]
+            self.cumulativeScores[i] = total
+
+        # only the last three frames started can still be waiting on bonus balls
+        for i in range(max(lastStarted - 2, 0), min(lastStarted + 1, TENTH_FRAME_INDEX)):
+            firstBowl = rolls[2 * i]
+            secondBowl = rolls[2 * i + 1]
+            if firstBowl == MARK_SCORE:
+                needed = STRIKE_BONUS_BALLS
+            elif secondBowl != UNBOWLED_VALUE and firstBowl + secondBowl == MARK_SCORE:
+                needed = SPARE_BONUS_BALLS
+            else:
+                continue
+            remaining = needed - sum(1 for roll in rolls[2 * i + 2:] if roll != UNBOWLED_VALUE)
+            if remaining > 0:
+                self.pendingBonuses.append([i, remaining])
+
+        return
 
     def getTotalScore(self):
         """
@@ -49,8 +183,86 @@ class ScoreSheet:
         Getter for whether the game has been fully bowled
         :return (boolean): True if the game is finished, False otherwise
         """
+        self.checkScored()
+
         return self.completeGame
 
+    def getRunningScore(self):
+        """
+        Getter for the score of every ball entered through addBowl,
+            including the bonuses that have been earned so far
+        :return (int): The running total for the game
+        """
+        self.checkScored()
+
+        return self.runningScore
+
+    def getCumulativeScore(self, n):
+        """
+        Getter for the running total at the end of the frame at index n
+        :param n: the index value of the frame: Starting from 0-9
+        :return (int): The cumulative score through frame n
+        """
+        self.checkScored()
+
+        return self.cumulativeScores[n]
+
+    def getCurrentFrame(self):
+        """
+        Getter for the index of the frame the next ball belongs to
+        :return (int): The frame index from 0-9
+        """
+        self.checkScored()
+
+        return self.currentFrame
+
+    def getCurrentBall(self):
+        """
+        Getter for the index of the next ball inside the current frame
+        :return (int): 0 for the first ball, 1 for the second, 2 for the third
+        """
+        self.checkScored()
+
+        return self.currentBall
+
+    def getPinsStanding(self):
+        """
+        Getter for the amount of pins standing for the next ball
+        :return (int): The pins standing from 0-10
+        """
+        self.checkScored()
+
+        return self.pinsStanding
+
+    def getScoringState(self):
+        """
+        Getter for the ScoringTable state number of the balls entered through addBowl
+        :return (int): The state number
+        """
+        self.checkScored()
+
+        return self.scoringState
+
+    def getMaxPossibleScore(self):
+        """
+        Returns the highest final score the game can still reach
+        :return (int): The maximum possible score
+        """
+        self.checkScored()
+
+        return ScoringTable.getMaxPossibleScore(self.scoringState, self.runningScore)
+
+    def getRollsNeeded(self, target):
+        """
+        Returns the fewest balls after which the game can beat a target score
+        :param target (int): The score to beat
+        :return (int): The amount of balls, 0 if the target is already
+            beaten, or None if the game can no longer beat it
+        """
+        self.checkScored()
+
+        return ScoringTable.getRollsNeeded(self.scoringState, self.runningScore, target)
+
     def setCompleteGame(self, other):
         """
         Setter for whether the game has been fully bowled
@@ -58,6 +270,8 @@ class ScoreSheet:
             whether the game has been fully bowled
         :return: None
         """
+        self.checkScored()
+
         self.completeGame = other
 
         return
@@ -73,49 +287,52 @@ class ScoreSheet:
 
         return
 
+    @Instrumentation.timed("score_sheet_displays")
     def displayScoreSheet(self):
         """
-        Method displays the score sheet
+        Method displays the score sheet with a single write
         """
-        self.printOuterBorderLine()  # top border
-        self.printFrameLine()  # frame line
-        self.printInnerBorderLine()  # inner border
-        self.printScoreLine()  # score line
-        self.printInnerBorderLine()  # interior border
-        self.printTotalLine()  # total score line
-        self.printOuterBorderLine()  # bottom border
+        print(self.renderScoreSheet(), end="")
 
         return
 
+    @Instrumentation.timed("score_sheet_renders")
+    def renderScoreSheet(self):
+        """
+        Builds the whole score sheet display as one string, reusing
+            an earlier render of the same rolls from the render cache
+        :return (str): The score sheet display, one line per row
+        """
+        return renderGame(self.getRollList(), self.getCompleteGame())
+
+    def getStateFingerprint(self):
+        """
+        Packs the rolls and whether the game is complete into one integer,
+            two score sheets display the same way when their fingerprints match
+        :return (int): The fingerprint of the score sheet
+        """
+        return fingerprintRollList(self.getRollList(), self.getCompleteGame())
+
     def printOuterBorderLine(self):
         """
         Function prints the exterior top and bottom
         borders for the score sheet display
         """
-        print("+", end="")
-        for i in range(BORDER_LENGTH):
-            print("=", end="")
-        print("+")
+        print(OUTER_BORDER_LINE, end="")
 
     def printInnerBorderLine(self):
         """
         Function prints interior
         borders for the score sheet display
         """
-        print("+", end="")
-        for i in range(BORDER_LENGTH):
-            print("-", end="")
-        print("+")
+        print(INNER_BORDER_LINE, end="")
 
     def printFrameLine(self):
         """
         Prints the line that lists the
         frames at the top of the score sheet
         """
-        print("+ Frame:", end="")
-        for i in range(1, FRAME_UPPER_BOUND + 1):
-            print(f"| {i} ", end="")
-        print(" |  +")
+        print(FRAME_LINE, end="")
 
         return
 
@@ -123,145 +340,313 @@ class ScoreSheet:
         """
         Prints the line that list the scores of each frame
         """
-        print("+ Score:", end="")
-        for i in range(FRAME_UPPER_BOUND - 1):
-            firstBowl = self.getNthFrame(i).getFirstBowl()
-            secondBowl = self.getNthFrame(i).getSecondBowl()
-
-            # format strike
-            if firstBowl == 10:
-                firstBowl = "X"
-            elif firstBowl + secondBowl == 10:
-                secondBowl = "/"
-
-            # format 0 to -
-            if firstBowl == 0:
-                firstBowl = "-"
-            if secondBowl == 0:
-                secondBowl = "-"
-
-            # format -1 to " "
-            if firstBowl == -1:
-                firstBowl = " "
-            if secondBowl == -1:
-                secondBowl = " "
-
-            print(f"|{firstBowl} {secondBowl}", end="")
-
-        tFirstBowl = self.getNthFrame(FRAME_UPPER_BOUND - 1).getFirstBowl()
-        tSecondBowl = self.getNthFrame(FRAME_UPPER_BOUND - 1).getSecondBowl()
-        tThirdBowl = self.getNthFrame(FRAME_UPPER_BOUND - 1).getThirdBowl()
-
-        # format strikes
-        if tFirstBowl == 10:
-            tFirstBowl = "X"
-        elif tFirstBowl + tSecondBowl == 10:
-            tSecondBowl = "/"
-        if tSecondBowl == 10:
-            tSecondBowl = "X"
-        elif tSecondBowl != "/" and tSecondBowl + tThirdBowl == 10:
-            tThirdBowl = "/"
-        if tThirdBowl == 10:
-            tThirdBowl = "X"
-
-        # format 0 to -
-        if tFirstBowl == 0:
-            tFirstBowl = "-"
-        if tSecondBowl == 0:
-            tSecondBowl = "-"
-        if tThirdBowl == 0:
-            tThirdBowl = "-"
-
-        # format -1 to " "
-        if tFirstBowl == -1:
-            tFirstBowl = " "
-        if tSecondBowl == -1:
-            tSecondBowl = " "
-        if tThirdBowl == -1:
-            tThirdBowl = " "
-
-
-        print(f"|{tFirstBowl} {tSecondBowl} {tThirdBowl}|  +")
+        print(formatScoreLine(self.getRollList()), end="")
 
         return
 
     def printTotalLine(self):
-        # figure out how to print only at the end
         if self.getCompleteGame():
-            print(f"+ Total Score: {self.calculateScore() : <38}+")
+            print(formatTotalLine(self.calculateScore()), end="")
+        else:
+            print(formatTotalLine(None), end="")
+
+    def getRollList(self):
+        """
+        Returns the game as a list of 21 rolls, two for each standard
+            frame and three for the tenth, -1 is not bowled. Frames that
+            have been created are read in case they were changed directly
+        :return (list): The rolls of the game in frame order
+        """
+        rolls = self.rollBuffer.copy()
+
+        for i in range(FRAME_UPPER_BOUND):
+            frame = self.frameList[i]
+            if frame is not None:
+                rolls[2 * i] = frame.getFirstBowl()
+                rolls[2 * i + 1] = frame.getSecondBowl()
+                if i == TENTH_FRAME_INDEX:
+                    rolls[2 * i + 2] = frame.getThirdBowl()
+
+        return rolls
+
+    @Instrumentation.counted("balls_processed")
+    @Instrumentation.timed("balls_processed")
+    def addBowl(self, pinsDowned):
+        """
+        Records the next ball of the game and updates only the frames
+            it affects: the frame being bowled and any strike or spare
+            still waiting on bonus balls. Balls must all be entered
+            through this method for the running totals to be valid
+        :param pinsDowned (int): The pins knocked down by the ball
+        :return (boolean): True if the ball was recorded, False if the
+            value is invalid or the game is already complete
+        """
+        self.checkScored()
+
+        if (self.completeGame or not isinstance(pinsDowned, int)
+                or not 0 <= pinsDowned <= self.pinsStanding):
+            return False
+
+        self.scoringState = ScoringTable.stepState(self.scoringState, pinsDowned)[0]
+
+        # pay out strike and spare bonuses waiting on this ball
+        for bonus in self.pendingBonuses:
+            self.frameScores[bonus[0]] += pinsDowned
+            bonusFrame = self.frameList[bonus[0]]
+            if bonusFrame is not None:
+                bonusFrame.setFrameScore(self.frameScores[bonus[0]])
+            self.addCumulativeScore(bonus[0], pinsDowned)
+            bonus[1] -= 1
+        self.pendingBonuses = [bonus for bonus in self.pendingBonuses if bonus[1] > 0]
+
+        frameIndex = self.currentFrame
+        self.rollBuffer[2 * frameIndex + self.currentBall] = pinsDowned
+        self.frameScores[frameIndex] += pinsDowned
+
+        if self.currentBall == 0 and frameIndex > 0:
+            self.cumulativeScores[frameIndex] = self.cumulativeScores[frameIndex - 1]
+        self.addCumulativeScore(frameIndex, pinsDowned)
+
+        # keep a frame that has already been created up to date
+        frame = self.frameList[frameIndex]
+        if frame is not None:
+            if self.currentBall == 0:
+                frame.setFirstBowl(pinsDowned)
+            elif self.currentBall == 1:
+                frame.setSecondBowl(pinsDowned)
+            else:
+                frame.setThirdBowl(pinsDowned)
+            frame.setFrameScore(self.frameScores[frameIndex])
+
+        if frameIndex < TENTH_FRAME_INDEX:
+            self.advanceStandardFrame(pinsDowned)
         else:
-            print(f"+ Total Score: {IN_PROGRESS_MESSAGE:38}+")
+            self.advanceTenthFrame(pinsDowned)
+
+        return True
+
+    def addCumulativeScore(self, frameIndex, value):
+        """
+        Adds pins to the cumulative score of a frame and every
+            frame after it that has started to be bowled
+        :param frameIndex (int): The index of the frame earning the pins
+        :param value (int): The pins to add
+        :return: None
+        """
+        for i in range(frameIndex, self.currentFrame + 1):
+            self.cumulativeScores[i] += value
+        self.runningScore += value
+
+        return
+
+    def advanceStandardFrame(self, pinsDowned):
+        """
+        Moves the incremental state past a ball in frames 1-9
+        :param pinsDowned (int): The pins knocked down by the ball
+        :return: None
+        """
+        if self.currentBall == 0 and pinsDowned == MARK_SCORE:
+            self.pendingBonuses.append([self.currentFrame, STRIKE_BONUS_BALLS])
+        elif self.currentBall == 0:
+            self.currentBall = 1
+            self.pinsStanding = MARK_SCORE - pinsDowned
+            return
+        elif self.rollBuffer[2 * self.currentFrame] + pinsDowned == MARK_SCORE:
+            self.pendingBonuses.append([self.currentFrame, SPARE_BONUS_BALLS])
+
+        self.currentFrame += 1
+        self.currentBall = 0
+        self.pinsStanding = MARK_SCORE
+
+        return
+
+    def advanceTenthFrame(self, pinsDowned):
+        """
+        Moves the incremental state past a ball in the tenth frame,
+            which resets the rack after every strike or spare
+        :param pinsDowned (int): The pins knocked down by the ball
+        :return: None
+        """
+        self.pinsStanding -= pinsDowned
+        if self.pinsStanding == 0:
+            self.pinsStanding = MARK_SCORE
+
+        if self.currentBall == 0:
+            self.currentBall = 1
+        elif self.currentBall == 1 and (self.rollBuffer[TENTH_FRAME_ROLL_INDEX] == MARK_SCORE
+                                        or self.rollBuffer[TENTH_FRAME_ROLL_INDEX] + pinsDowned == MARK_SCORE):
+            self.currentBall = 2
+        else:
+            self.currentBall = 0
+            self.pinsStanding = 0
+            self.setCompleteGame(True)
+
+        return
 
     def calculateScore(self):
         """
-        Function calculates a total score for
-        a game given a complete frame list
+        Function calculates a total score for the game from
+            the roll buffer, without creating any frames
         :return (int): The total score for the game
         """
+        self.checkScored()
+
         totalScore = 0
 
-        # loop updates frame scores for spares and strikes
-        for i in range(len(self.frameList)):
-
-            # frames 1 - 7
-            if i < EIGHTH_FRAME_INDEX:
-                if self.frameList[i].getStrike():  # strike bowled
-                    if self.frameList[i + 1].getStrike():  # strike in next frame
-                        self.frameList[i].setFrameScore((MARK_SCORE
-                            + self.frameList[i + 1].getFrameScore()
-                            + self.frameList[i + 2].getFrameScore()))
-
-                    else:  # next frame is open
-                        self.frameList[i].setFrameScore((MARK_SCORE +
-                            self.frameList[i + 1].getFrameScore()))
-
-                elif self.frameList[i].getSpare():  # spare bowled
-                    self.frameList[i].setFrameScore((MARK_SCORE +
-                        self.frameList[i + 1].getFrameScore()))
-
-            # eighth frame
-            if i == EIGHTH_FRAME_INDEX:
-                if self.frameList[i].getStrike():  # strike bowled
-                    if self.frameList[i + 1].getStrike():
-                        self.frameList[i].setFrameScore((MARK_SCORE +
-                            self.frameList[i + 1].getFrameScore() +
-                            self.frameList[i + 2].getFirstBowl()))
-                    else:
-                        self.frameList[i].setFrameScore((MARK_SCORE +
-                            self.frameList[i + 1].getFrameScore()))
-
-                elif self.frameList[i].getSpare():  # spare bowled
-                    self.frameList[i].frameScore = MARK_SCORE + self.frameList[i + 1].getFirstBowl()
-
-            # ninth frame
-            if i == NINTH_FRAME_INDEX:
-                if self.frameList[i].getStrike():  # strike bowled
-                    self.frameList[i].setFrameScore((MARK_SCORE +
-                        self.frameList[i + 1].getFirstBowl() +
-                        self.frameList[i + 1].getSecondBowl()))
-                elif self.frameList[i].getSpare():  # spare bowled
-                    self.frameList[i].setFrameScore((MARK_SCORE +
-                        self.frameList[i + 1].getFirstBowl()))
-
-            # tenth frame
-            if i == TENTH_FRAME_INDEX:
-                if self.frameList[i].getFirstStrike():
-                    self.frameList[i].setFrameScore((MARK_SCORE +
-                        self.frameList[i].getSecondBowl() +
-                        self.frameList[i].getThirdBowl()))
-
-                elif self.frameList[i].getSpare():
-                    self.frameList[i].setFrameScore((MARK_SCORE
-                        + self.frameList[i].getThirdBowl()))
-
-        # calculate final score
-        for i in range(len(self.frameList)):
-            totalScore += self.frameList[i].getFrameScore()
+        # the buffer's frame scores are kept current by addBowl, only
+        # frames that were created can have been changed directly
+        if any(frame is not None for frame in self.frameList):
+            self.frameScores = scoreRollList(self.getRollList())
+
+        # update frame scores for spares and strikes
+        for i in range(FRAME_UPPER_BOUND):
+            if self.frameList[i] is not None:
+                self.frameList[i].setFrameScore(self.frameScores[i])
+            totalScore += self.frameScores[i]
 
         self.setTotalScore(totalScore)  # update total score variable
 
         return totalScore
 
+@Instrumentation.timed("score_recalculations")
+def scoreRollList(rolls):
+    """
+    Scores a game laid out as 21 rolls, two for each standard frame
+        and three for the tenth, where -1 marks a ball not bowled
+    :param rolls (list): The rolls of the game in frame order
+    :return (list): The score earned in each of the ten frames
+    """
+    # collect the balls actually bowled and where each frame starts
+    balls = []
+    frameStarts = []
+    for i in range(ROLL_LIST_LENGTH):
+        if i % 2 == 0 and i <= TENTH_FRAME_ROLL_INDEX:
+            frameStarts.append(len(balls))
+        if rolls[i] != UNBOWLED_VALUE:
+            balls.append(rolls[i])
+    balls.extend([0, 0, 0])  # unbowled bonus balls count as zero
+
+    frameScores = []
+    for i in range(FRAME_UPPER_BOUND - 1):
+        firstBowl = max(rolls[2 * i], 0)
+        secondBowl = max(rolls[2 * i + 1], 0)
+        nextBall = frameStarts[i + 1]
+
+        if firstBowl == MARK_SCORE:  # strike bowled
+            frameScores.append(MARK_SCORE + balls[nextBall] + balls[nextBall + 1])
+        elif (rolls[2 * i + 1] != UNBOWLED_VALUE
+                and firstBowl + secondBowl == MARK_SCORE):  # spare bowled
+            frameScores.append(MARK_SCORE + balls[nextBall])
+        else:
+            frameScores.append(firstBowl + secondBowl)
+
+    # tenth frame keeps every pin knocked down in it
+    frameScores.append(sum(max(roll, 0) for roll in rolls[TENTH_FRAME_ROLL_INDEX:]))
+
+    return frameScores
+
+def fingerprintRollList(rolls, completeGame):
+    """
+    Packs a game laid out as 21 rolls into one integer
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :param completeGame (boolean): Whether the game has been fully bowled
+    :return (int): The fingerprint, four bits per roll and one for completion
+    """
+    fingerprint = int(completeGame)
+
+    for roll in rolls:
+        fingerprint = (fingerprint << ROLL_FINGERPRINT_BITS) | (roll + 1)
+
+    return fingerprint
+
+def formatScoreLine(rolls):
+    """
+    Formats the line that lists the rolls of each frame
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :return (str): The score line of the display
+    """
+    result = "+ Score:"
+    for i in range(FRAME_UPPER_BOUND - 1):
+        firstBowl = rolls[2 * i]
+        secondBowl = rolls[2 * i + 1]
+
+        # format strike
+        if firstBowl == 10:
+            firstBowl = "X"
+        elif firstBowl + secondBowl == 10:
+            secondBowl = "/"
+
+        result += "|" + ROLL_SYMBOLS.get(firstBowl, firstBowl) + " " + ROLL_SYMBOLS.get(secondBowl, secondBowl)
+
+    tFirstBowl = rolls[TENTH_FRAME_ROLL_INDEX]
+    tSecondBowl = rolls[TENTH_FRAME_ROLL_INDEX + 1]
+    tThirdBowl = rolls[TENTH_FRAME_ROLL_INDEX + 2]
+
+    # format strikes
+    if tFirstBowl == 10:
+        tFirstBowl = "X"
+    elif tFirstBowl + tSecondBowl == 10:
+        tSecondBowl = "/"
+    if tSecondBowl == 10:
+        tSecondBowl = "X"
+    elif tSecondBowl != "/" and tSecondBowl + tThirdBowl == 10:
+        tThirdBowl = "/"
+    if tThirdBowl == 10:
+        tThirdBowl = "X"
+
+    result += ("|" + ROLL_SYMBOLS.get(tFirstBowl, tFirstBowl)
+               + " " + ROLL_SYMBOLS.get(tSecondBowl, tSecondBowl)
+               + " " + ROLL_SYMBOLS.get(tThirdBowl, tThirdBowl) + "|  +\n")
+
+    return result
+
+def formatTotalLine(totalScore):
+    """
+    Formats the total score line of the display
+    :param totalScore (int): The total score, None while the game is in progress
+    :return (str): The total score line of the display
+    """
+    if totalScore is None:
+        return f"+ Total Score: {IN_PROGRESS_MESSAGE:38}+\n"
+
+    return f"+ Total Score: {totalScore : <38}+\n"
+
+def renderRollList(rolls, totalScore=None):
+    """
+    Builds the score sheet display for a game laid out as 21 rolls
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :param totalScore (int): The total score, None while the game is in progress
+    :return (str): The score sheet display, one line per row
+    """
+    return "".join([OUTER_BORDER_LINE,  # top border
+                    FRAME_LINE,  # frame line
+                    INNER_BORDER_LINE,  # inner border
+                    formatScoreLine(rolls),  # score line
+                    INNER_BORDER_LINE,  # interior border
+                    formatTotalLine(totalScore),  # total score line
+                    OUTER_BORDER_LINE])  # bottom border
+
+def renderGame(rolls, completeGame):
+    """
+    Returns the score sheet display for a game laid out as 21 rolls,
+        reusing an earlier render of the same rolls from the render cache
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :param completeGame (boolean): True to show the total score
+    :return (str): The score sheet display, one line per row
+    """
+    fingerprint = fingerprintRollList(rolls, completeGame)
+    render = SCORE_SHEET_RENDER_CACHE.get(fingerprint)
+
+    if render is None:
+        if completeGame:
+            totalScore = sum(scoreRollList(rolls))
+        else:
+            totalScore = None
+        render = renderRollList(rolls, totalScore)
+        SCORE_SHEET_RENDER_CACHE.put(fingerprint, render)
+
+    return render
+
 def main():
     scoreSheet = ScoreSheet()
 
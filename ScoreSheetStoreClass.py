@@ -0,0 +1,377 @@
+# Date: 10/18/26
+# Description: This file contains classes that keep many games in
+#   contiguous typed arrays instead of a ScoreSheet of frame objects per
+#   game. A view over one stored game reads like a ScoreSheet so existing
+#   code can use it. The main function gives a demonstration of the classes.
+from array import array
+
+import numpy as np
+
+import BatchScoring
+import ScoreSheetClass
+import ScoringTable
+from ScoreSheetClass import (FRAME_UPPER_BOUND, MARK_SCORE, ROLL_LIST_LENGTH,
+                             TENTH_FRAME_INDEX, TENTH_FRAME_ROLL_INDEX, UNBOWLED_VALUE)
+
+# flag bits kept for each game
+STRIKE_FLAG_SHIFT = 0
+SPARE_FLAG_SHIFT = FRAME_UPPER_BOUND
+COMPLETE_FLAG = 1 << (2 * FRAME_UPPER_BOUND)
+
+class ScoreSheetStore:
+    def __init__(self):
+        """
+        Constructor:
+        Creates an empty store. Each game takes 21 int8 rolls,
+            10 int16 cumulative frame scores and one 32-bit flag word
+            holding a strike and a spare bit per frame and a complete bit
+        """
+        self.rolls = array("b")
+        self.cumulativeScores = array("h")
+        self.flags = array("I")
+
+    def __len__(self):
+        """
+        Returns the amount of games in the store
+        :return (int): The amount of games
+        """
+        return len(self.flags)
+
+    def addRollList(self, rolls):
+        """
+        Adds a game laid out as 21 rolls, -1 is not bowled, whether the
+            game is complete is worked out from the rolls
+        :param rolls (list): The 21 rolls of the game
+        :return (int): The index of the game in the store
+        """
+        completeGame = checkRollList(rolls)
+
+        # build every column's values before touching the store so a bad game adds nothing
+        cumulativeScores = array("h")
+        cumulativeScore = 0
+        for score in ScoreSheetClass.scoreRollList(rolls):
+            cumulativeScore += score
+            cumulativeScores.append(cumulativeScore)
+        gameRolls = array("b", rolls)
+        flags = buildFlags(rolls, completeGame)
+
+        self.cumulativeScores.extend(cumulativeScores)
+        self.rolls.extend(gameRolls)
+        self.flags.append(flags)
+
+        return len(self.flags) - 1
+
+    def addScoreSheet(self, scoreSheet):
+        """
+        Copies a ScoreSheet into the store
+        :param scoreSheet (ScoreSheet): The score sheet to copy
+        :return (int): The index of the game in the store
+        """
+        return self.addRollList(scoreSheet.getRollList())
+
+    def addRollArray(self, rolls):
+        """
+        Adds a batch of games from an (N x 21) NumPy array, scoring
+            them all at once with BatchScoring. Every game is checked
+            first and whether it is complete is worked out from its rolls
+        :param rolls (array): An (N x 21) integer array of rolls
+        :return: None
+        """
+        rolls = np.asarray(rolls)
+        if rolls.ndim != 2 or rolls.shape[1] != ROLL_LIST_LENGTH:
+            raise ValueError(f"rolls must have shape (N, {ROLL_LIST_LENGTH}), got {rolls.shape}")
+        completeGames = np.fromiter((checkRollList(gameRolls) for gameRolls in rolls.tolist()),
+                                    dtype=bool, count=len(rolls))
+
+        rolls = np.ascontiguousarray(rolls, dtype=np.int8)
+        cumulativeScores, totals = BatchScoring.scoreGames(rolls)
+        pins = np.maximum(rolls, 0).astype(np.int16)
+
+        # strike and spare bits for all ten frames, the tenth from its first two balls as in buildFlags
+        firstBowls = pins[:, 0:TENTH_FRAME_ROLL_INDEX + 1:2]
+        secondBowls = pins[:, 1:TENTH_FRAME_ROLL_INDEX + 2:2]
+        secondBowled = rolls[:, 1:TENTH_FRAME_ROLL_INDEX + 2:2] != UNBOWLED_VALUE
+        strikes = firstBowls == MARK_SCORE
+        spares = ~strikes & secondBowled & (firstBowls + secondBowls == MARK_SCORE)
+        frameBits = np.uint32(1) << np.arange(FRAME_UPPER_BOUND, dtype=np.uint32)
+        flags = ((strikes * frameBits).sum(axis=1, dtype=np.uint32) << STRIKE_FLAG_SHIFT
+                 | (spares * frameBits).sum(axis=1, dtype=np.uint32) << SPARE_FLAG_SHIFT)
+        flags |= completeGames * np.uint32(COMPLETE_FLAG)
+
+        self.rolls.frombytes(rolls.tobytes())
+        self.cumulativeScores.frombytes(cumulativeScores.astype(np.int16).tobytes())
+        self.flags.frombytes(flags.astype(np.uint32).tobytes())
+
+        return
+
+    def getGame(self, index):
+        """
+        Returns a view of one stored game that reads like a ScoreSheet
+        :param index (int): The index of the game
+        :return (ScoreSheetView): The view of the game
+        """
+        if not -len(self.flags) <= index < len(self.flags):
+            raise IndexError("game index out of range")
+
+        return ScoreSheetView(self, index % len(self.flags))
+
+    def getTotalScore(self, index):
+        """
+        Getter for the total score of one stored game
+        :param index (int): The index of the game
+        :return (int): The total score
+        """
+        return self.cumulativeScores[index * FRAME_UPPER_BOUND + FRAME_UPPER_BOUND - 1]
+
+    def getFlags(self, index):
+        """
+        Getter for the flag word of one stored game
+        :param index (int): The index of the game
+        :return (int): Strike bits 0-9, spare bits 10-19 and the complete bit
+        """
+        return self.flags[index]
+
+    def asNumpy(self):
+        """
+        Returns NumPy views of the stored arrays without copying them,
+            adding games afterwards may move the arrays and invalidate the views
+        :return (tuple): The (N x 21) int8 rolls, (N x 10) int16 cumulative
+            scores and N uint32 flags
+        """
+        return (np.frombuffer(self.rolls, dtype=np.int8).reshape(-1, ROLL_LIST_LENGTH),
+                np.frombuffer(self.cumulativeScores, dtype=np.int16).reshape(-1, FRAME_UPPER_BOUND),
+                np.frombuffer(self.flags, dtype=np.uint32))
+
+    def getBytesUsed(self):
+        """
+        Getter for the bytes held by the stored arrays
+        :return (int): The size of the arrays in bytes
+        """
+        return (len(self.rolls) * self.rolls.itemsize
+                + len(self.cumulativeScores) * self.cumulativeScores.itemsize
+                + len(self.flags) * self.flags.itemsize)
+
+class ScoreSheetView:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        """
+        Constructor:
+        :param store (ScoreSheetStore): The store the game is kept in
+        :param index (int): The index of the game in the store
+        """
+        self.store = store
+        self.index = index
+
+    def getRollList(self):
+        """
+        Returns the 21 rolls of the game, -1 is not bowled
+        :return (list): The rolls of the game in frame order
+        """
+        start = self.index * ROLL_LIST_LENGTH
+
+        return self.store.rolls[start:start + ROLL_LIST_LENGTH].tolist()
+
+    def getNthFrame(self, n):
+        """
+        Returns a view of the frame at the index value of n in (0-9)
+        :param n: the index value of the frame: Starting from 0-9
+        :return (FrameView): The view of the frame
+        """
+        if not 0 <= n < FRAME_UPPER_BOUND:
+            raise IndexError("frame index out of range")
+
+        return FrameView(self.store, self.index, n)
+
+    def getCumulativeScore(self, n):
+        """
+        Getter for the running total at the end of the frame at index n
+        :param n: the index value of the frame: Starting from 0-9
+        :return (int): The cumulative score through frame n
+        """
+        return self.store.cumulativeScores[self.index * FRAME_UPPER_BOUND + n]
+
+    def getTotalScore(self):
+        """
+        Gets the integer value of the total score
+        :return (int): The total score represented as an integer
+        """
+        return self.store.getTotalScore(self.index)
+
+    def getCompleteGame(self):
+        """
+        Getter for whether the game has been fully bowled
+        :return (boolean): True if the game is finished, False otherwise
+        """
+        return bool(self.store.flags[self.index] & COMPLETE_FLAG)
+
+    def calculateScore(self):
+        """
+        Returns the total score, which was calculated when the game was stored
+        :return (int): The total score for the game
+        """
+        return self.store.getTotalScore(self.index)
+
+    def renderScoreSheet(self):
+        """
+        Builds the whole score sheet display as one string
+        :return (str): The score sheet display, one line per row
+        """
+        return ScoreSheetClass.renderGame(self.getRollList(), self.getCompleteGame())
+
+    def displayScoreSheet(self):
+        """
+        Method displays the score sheet with a single write
+        """
+        print(self.renderScoreSheet(), end="")
+
+        return
+
+class FrameView:
+    __slots__ = ("store", "index", "frame")
+
+    def __init__(self, store, index, frame):
+        """
+        Constructor:
+        :param store (ScoreSheetStore): The store the game is kept in
+        :param index (int): The index of the game in the store
+        :param frame (int): The index of the frame in the game, 0-9
+        """
+        self.store = store
+        self.index = index
+        self.frame = frame
+
+    def getRoll(self, ball):
+        """
+        Returns one roll of the frame
+        :param ball (int): The index of the ball in the frame, 0-2
+        :return (int): The pins knocked down, -1 if not bowled
+        """
+        return self.store.rolls[self.index * ROLL_LIST_LENGTH + 2 * self.frame + ball]
+
+    def getBowled(self):
+        """
+        Getter for whether the frame has begun to be bowled
+        :return: True if the frame has begun to be bowled, False otherwise
+        """
+        return self.getRoll(0) != UNBOWLED_VALUE
+
+    def getFirstBowl(self):
+        """
+        Getter for the value of the first bowl
+        :return: The pins knocked down in the first bowl
+        """
+        return self.getRoll(0)
+
+    def getSecondBowl(self):
+        """
+        Getter for the value of the second bowl
+        :return: The pins knocked down in the second bowl
+        """
+        return self.getRoll(1)
+
+    def getThirdBowl(self):
+        """
+        Getter for the value of the third bowl, only the tenth frame has one
+        :return: The pins knocked down in the third bowl
+        """
+        if self.frame != TENTH_FRAME_INDEX:
+            raise AttributeError("only the tenth frame has a third bowl")
+
+        return self.getRoll(2)
+
+    def getFrameScore(self):
+        """
+        Getter for the score of the frame including its bonus
+        :return: The score earned in the frame
+        """
+        position = self.index * FRAME_UPPER_BOUND + self.frame
+        previous = self.store.cumulativeScores[position - 1] if self.frame > 0 else 0
+
+        return self.store.cumulativeScores[position] - previous
+
+    def getStrike(self):
+        """
+        Getter for if a strike was bowled in a frame
+        :return: True if a strike was bowled, false otherwise
+        """
+        return bool(self.store.flags[self.index] >> (STRIKE_FLAG_SHIFT + self.frame) & 1)
+
+    def getSpare(self):
+        """
+        Getter for if a spare was bowled in a frame
+        :return: True if a spare was bowled, false otherwise
+        """
+        return bool(self.store.flags[self.index] >> (SPARE_FLAG_SHIFT + self.frame) & 1)
+
+    def getFirstStrike(self):
+        """
+        Getter for if the first bowl was a strike
+        :return: True if a strike was bowled the first bowl, and False otherwise
+        """
+        return self.getRoll(0) == MARK_SCORE
+
+    def getSecondStrike(self):
+        """
+        Getter for if the second bowl was a strike
+        :return: True if a strike was bowled the second bowl, and False otherwise
+        """
+        return self.getRoll(1) == MARK_SCORE
+
+    def getThirdStrike(self):
+        """
+        Getter for if the third bowl was a strike
+        :return: True if a strike was bowled the third bowl, and False otherwise
+        """
+        return self.getThirdBowl() == MARK_SCORE
+
+def checkRollList(rolls):
+    """
+    Checks that 21 rolls are a legal game, bowled or partly bowled
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :return (boolean): True if the game has been fully bowled, False otherwise
+    """
+    if len(rolls) != ROLL_LIST_LENGTH:
+        raise ValueError(f"a game needs {ROLL_LIST_LENGTH} rolls, got {len(rolls)}")
+
+    state = ScoringTable.walkRollList(rolls)[0]
+
+    return state == ScoringTable.DONE_STATE_NUMBER
+
+def buildFlags(rolls, completeGame):
+    """
+    Builds the flag word of a game laid out as 21 rolls
+    :param rolls (list): The 21 rolls of the game
+    :param completeGame (boolean): Whether the game has been fully bowled
+    :return (int): Strike bits 0-9, spare bits 10-19 and the complete bit
+    """
+    flags = COMPLETE_FLAG if completeGame else 0
+
+    for frame in range(FRAME_UPPER_BOUND):
+        firstBowl = rolls[2 * frame]
+        secondBowl = rolls[2 * frame + 1]
+        if firstBowl == MARK_SCORE:
+            flags |= 1 << (STRIKE_FLAG_SHIFT + frame)
+        elif secondBowl != UNBOWLED_VALUE and firstBowl + secondBowl == MARK_SCORE:
+            flags |= 1 << (SPARE_FLAG_SHIFT + frame)
+
+    return flags
+
+def main():
+    store = ScoreSheetStore()
+
+    store.addRollList([10, -1, 9, 0, 5, 5, 10, -1, 0, 0, 2, 4, 10, -1, 9, 1, 10, -1, 10, 9, 1])
+    store.addRollList([10, -1] * 9 + [10, 10, 10])
+
+    for index in range(len(store)):
+        game = store.getGame(index)
+        game.displayScoreSheet()
+        print(f"Frame 3 score: {game.getNthFrame(2).getFrameScore()}, "
+              f"spare: {game.getNthFrame(2).getSpare()}")
+
+    print(f"{store.getBytesUsed() / len(store):.0f} bytes per game")
+
+    return
+
+if __name__ == "__main__":
+    main()
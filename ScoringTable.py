@@ -0,0 +1,330 @@
+# Date: 10/18/26
+# Description: This file scores games with a precomputed transition table.
+#   The scoring state is the frame, the ball in the frame, the pins
+#   standing, the strike and spare bonuses waiting on the next two balls
+#   and, in the tenth frame, whether a mark has reset the rack. Every
+#   (state, pins) pair is looked up once to get the next state and how
+#   many times the ball counts, so scoring a game is a loop of lookups.
+#   A second table holds the most points each state can still earn in a
+#   given amount of balls. The main function checks the tables against
+#   ScoreSheet scoring.
+import argparse
+import bisect
+import time
+
+TENTH_FRAME_INDEX = 9
+MARK_SCORE = 10
+PIN_VALUE_COUNT = MARK_SCORE + 1
+UNBOWLED_VALUE = -1
+MAX_GAME_BALLS = 21
+
+# table entries pack the next state above two bits of multiplier
+MULTIPLIER_BITS = 2
+MULTIPLIER_MASK = (1 << MULTIPLIER_BITS) - 1
+INVALID_TRANSITION = -1
+
+# (frame, ball, standing, bonus on this ball, bonus on the next ball, tenth frame mark)
+START_STATE = (0, 0, MARK_SCORE, 0, 0, 0)
+
+def nextScoringState(state, pins):
+    """
+    Works out what one ball does to the scoring state
+    :param state (tuple): The scoring state before the ball
+    :param pins (int): The pins knocked down by the ball
+    :return (tuple): The state after the ball, or None when the game is
+        over, and how many times the ball's pins count toward the score
+    """
+    frame, ball, standing, bonus, nextBonus, mark = state
+    multiplier = 1 + bonus
+
+    if frame < TENTH_FRAME_INDEX:
+        if ball == 0 and pins == MARK_SCORE:  # strike
+            return (frame + 1, 0, MARK_SCORE, nextBonus + 1, 1, 0), multiplier
+        if ball == 0:
+            return (frame, 1, MARK_SCORE - pins, nextBonus, 0, 0), multiplier
+        if pins == standing:  # spare
+            return (frame + 1, 0, MARK_SCORE, nextBonus + 1, 0, 0), multiplier
+        return (frame + 1, 0, MARK_SCORE, nextBonus, 0, 0), multiplier
+
+    # tenth frame: the rack is reset after every mark
+    if ball == 0:
+        if pins == MARK_SCORE:
+            return (frame, 1, MARK_SCORE, nextBonus, 0, 1), multiplier
+        return (frame, 1, MARK_SCORE - pins, nextBonus, 0, 0), multiplier
+    if ball == 1 and (mark or pins == standing):
+        if pins == standing:
+            return (frame, 2, MARK_SCORE, 0, 0, 1), multiplier
+        return (frame, 2, standing - pins, 0, 0, 1), multiplier
+
+    return None, multiplier
+
+def buildTransitionTable():
+    """
+    Numbers every state reachable from the start of a game and builds the
+        table of transitions, the finished game is the last state number
+    :return (tuple): The list of states by number, and the flat table where
+        entry state * 11 + pins is (next state << 2) | multiplier, or -1
+        when that many pins cannot be knocked down
+    """
+    states = [START_STATE]
+    stateNumbers = {START_STATE: 0}
+    transitions = []
+
+    # states are numbered in the order they are first reached
+    index = 0
+    while index < len(states):
+        state = states[index]
+        transitions.append([])
+        for pins in range(PIN_VALUE_COUNT):
+            if pins > state[2]:
+                transitions[index].append(None)
+                continue
+            nextState, multiplier = nextScoringState(state, pins)
+            if nextState is not None and nextState not in stateNumbers:
+                stateNumbers[nextState] = len(states)
+                states.append(nextState)
+            transitions[index].append((nextState, multiplier))
+        index += 1
+
+    doneState = len(states)
+    table = []
+    for index in range(len(states)):
+        for entry in transitions[index]:
+            if entry is None:
+                table.append(INVALID_TRANSITION)
+            else:
+                nextNumber = doneState if entry[0] is None else stateNumbers[entry[0]]
+                table.append(nextNumber << MULTIPLIER_BITS | entry[1])
+    table.extend([INVALID_TRANSITION] * PIN_VALUE_COUNT)  # nothing follows a finished game
+
+    return states, tuple(table)
+
+SCORING_STATES, TRANSITION_TABLE = buildTransitionTable()
+START_STATE_NUMBER = 0
+DONE_STATE_NUMBER = len(SCORING_STATES)
+
+# the roll list slot the next ball of each state is recorded in, none once done
+STATE_ROLL_SLOTS = tuple(2 * state[0] + state[1] for state in SCORING_STATES) + (UNBOWLED_VALUE,)
+
+def scoreBalls(balls):
+    """
+    Scores a sequence of balls with the transition table, an unfinished
+        game scores like ScoreSheet.getRunningScore
+    :param balls (iterable): The pins knocked down by each ball in order
+    :return (int): The score of the game
+    """
+    table = TRANSITION_TABLE
+    state = START_STATE_NUMBER
+    score = 0
+
+    for pins in balls:
+        entry = table[state * PIN_VALUE_COUNT + pins] if 0 <= pins <= MARK_SCORE else INVALID_TRANSITION
+        if entry < 0:
+            raise ValueError(f"{pins} pins is not a valid next ball")
+        state = entry >> MULTIPLIER_BITS
+        score += pins * (entry & MULTIPLIER_MASK)
+
+    return score
+
+def scoreRollList(rolls):
+    """
+    Scores a game laid out as the 21 rolls of ScoreSheet.getRollList
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :return (int): The score of the game
+    """
+    return scoreBalls([roll for roll in rolls if roll != UNBOWLED_VALUE])
+
+def walkRollList(rolls):
+    """
+    Moves through a game laid out as the 21 rolls of ScoreSheet.getRollList,
+        checking each ball is in the slot the state before it expects
+    :param rolls (list): The 21 rolls of the game, -1 is not bowled
+    :return (tuple): The state number after the last ball and the score
+    """
+    table = TRANSITION_TABLE
+    slots = STATE_ROLL_SLOTS
+    state = START_STATE_NUMBER
+    score = 0
+
+    for slot in range(len(rolls)):
+        pins = rolls[slot]
+        if pins == UNBOWLED_VALUE:
+            continue
+        if slots[state] != slot:
+            raise ValueError(f"a ball in roll slot {slot} is not where the game expects it")
+        entry = table[state * PIN_VALUE_COUNT + pins] if 0 <= pins <= MARK_SCORE else INVALID_TRANSITION
+        if entry < 0:
+            raise ValueError(f"{pins} pins is not a valid next ball")
+        state = entry >> MULTIPLIER_BITS
+        score += pins * (entry & MULTIPLIER_MASK)
+
+    return state, score
+
+def stepState(state, pins):
+    """
+    Moves a state number forward by one ball
+    :param state (int): The state number before the ball
+    :param pins (int): The pins knocked down by the ball
+    :return (tuple): The state number after the ball and the points the ball scored
+    """
+    entry = TRANSITION_TABLE[state * PIN_VALUE_COUNT + pins] if 0 <= pins <= MARK_SCORE else INVALID_TRANSITION
+    if entry < 0:
+        raise ValueError(f"{pins} pins is not a valid next ball")
+
+    return entry >> MULTIPLIER_BITS, pins * (entry & MULTIPLIER_MASK)
+
+def buildMaxGainTable():
+    """
+    Works out the most points every state can still earn, the best ball
+        is always either a strike or knocking down every standing pin
+    :return (tuple): Entry [state][balls] is the most points that can be
+        scored in at most that many more balls, from 0 to 21
+    """
+    gains = [None] * (DONE_STATE_NUMBER + 1)
+    gains[DONE_STATE_NUMBER] = (0,) * (MAX_GAME_BALLS + 1)
+
+    def getGains(state):
+        if gains[state] is None:
+            best = [0] * (MAX_GAME_BALLS + 1)
+            for pins in range(SCORING_STATES[state][2] + 1):
+                nextState, points = stepState(state, pins)
+                nextGains = getGains(nextState)
+                for balls in range(1, MAX_GAME_BALLS + 1):
+                    best[balls] = max(best[balls], points + nextGains[balls - 1])
+            gains[state] = tuple(best)
+        return gains[state]
+
+    for state in range(DONE_STATE_NUMBER):
+        getGains(state)
+
+    return tuple(gains)
+
+MAX_GAIN_TABLE = buildMaxGainTable()
+
+def getMaxPossibleScore(state, score):
+    """
+    Returns the highest final score a game in progress can still reach
+    :param state (int): The state number of the game
+    :param score (int): The running score of the game
+    :return (int): The maximum possible final score
+    """
+    return score + MAX_GAIN_TABLE[state][MAX_GAME_BALLS]
+
+def getRollsNeeded(state, score, target):
+    """
+    Returns the fewest balls after which a game in progress can beat a target
+    :param state (int): The state number of the game
+    :param score (int): The running score of the game
+    :param target (int): The score to beat
+    :return (int): The amount of balls, 0 if the target is already beaten,
+        or None if the game can no longer beat it
+    """
+    gains = MAX_GAIN_TABLE[state]
+    # gains never drop as balls are added, so the first gain over the gap wins
+    balls = bisect.bisect_right(gains, target - score)
+
+    return balls if balls <= MAX_GAME_BALLS else None
+
+def findStatePrefixes():
+    """
+    Finds a shortest sequence of balls that reaches every state
+    :return (list): The balls leading to each state, by state number
+    """
+    prefixes = [None] * len(SCORING_STATES)
+    prefixes[START_STATE_NUMBER] = []
+    queue = [START_STATE_NUMBER]
+
+    for state in queue:
+        for pins in range(PIN_VALUE_COUNT):
+            entry = TRANSITION_TABLE[state * PIN_VALUE_COUNT + pins]
+            if entry < 0:
+                continue
+            nextState = entry >> MULTIPLIER_BITS
+            if nextState != DONE_STATE_NUMBER and prefixes[nextState] is None:
+                prefixes[nextState] = prefixes[state] + [pins]
+                queue.append(nextState)
+
+    return prefixes
+
+def verifyTransitionTable():
+    """
+    Checks every reachable (state, pins) pair of the table against
+        ScoreSheet. Each state is reached by bowling a shortest ball
+        sequence through ScoreSheet.addBowl and then every pin count from
+        0 to 10 is bowled. The table must reject the same balls addBowl
+        rejects, score each ball as ScoreSheetClass.scoreRollList does and
+        move to a state with the score sheet's frame, ball, pins standing
+        and completion. Every ball that can follow is then scored from the
+        new state and compared with scoreRollList, which checks the
+        bonuses the new state carries
+    :return (int): The amount of (state, pins) pairs checked
+    """
+    import ScoreSheetClass
+
+    checked = 0
+
+    for state, prefix in enumerate(findStatePrefixes()):
+        for pins in range(PIN_VALUE_COUNT):
+            scoreSheet = ScoreSheetClass.ScoreSheet()
+            for ball in prefix:
+                scoreSheet.addBowl(ball)
+            scoreBefore = sum(ScoreSheetClass.scoreRollList(scoreSheet.getRollList()))
+            entry = TRANSITION_TABLE[state * PIN_VALUE_COUNT + pins]
+            checked += 1
+
+            if not scoreSheet.addBowl(pins):
+                if entry != INVALID_TRANSITION:
+                    raise AssertionError(f"table accepts {pins} pins after {prefix}")
+                continue
+            if entry == INVALID_TRANSITION:
+                raise AssertionError(f"table rejects {pins} pins after {prefix}")
+
+            balls = prefix + [pins]
+            nextState = entry >> MULTIPLIER_BITS
+            rolls = scoreSheet.getRollList()
+            score = sum(ScoreSheetClass.scoreRollList(rolls))
+            if pins * (entry & MULTIPLIER_MASK) != score - scoreBefore:
+                raise AssertionError(f"table scores the last ball of {balls} wrong")
+
+            if scoreSheet.getCompleteGame():
+                if nextState != DONE_STATE_NUMBER:
+                    raise AssertionError(f"table does not finish the game after {balls}")
+                continue
+            position = (scoreSheet.getCurrentFrame(), scoreSheet.getCurrentBall(), scoreSheet.getPinsStanding())
+            if nextState == DONE_STATE_NUMBER or SCORING_STATES[nextState][:3] != position:
+                raise AssertionError(f"table is in the wrong frame, ball or rack after {balls}")
+
+            # the bonuses carried by the next state must score the following ball
+            slot = STATE_ROLL_SLOTS[nextState]
+            for nextPins in range(scoreSheet.getPinsStanding() + 1):
+                nextRolls = rolls.copy()
+                nextRolls[slot] = nextPins
+                if stepState(nextState, nextPins)[1] != sum(ScoreSheetClass.scoreRollList(nextRolls)) - score:
+                    raise AssertionError(f"table scores {nextPins} pins after {balls} wrong")
+
+    return checked
+
+def main(argv=None):
+    """
+    Main Function: prints the size of the table and
+        optionally checks the table against ScoreSheet scoring
+    """
+    parser = argparse.ArgumentParser(description="Table driven bowling scoring")
+    parser.add_argument("--verify", action="store_true",
+                        help="compare every reachable (state, pins) pair of the table "
+                             "with ScoreSheet scoring")
+    args = parser.parse_args(argv)
+
+    print(f"Scoring states: {len(SCORING_STATES)}, table entries: {len(TRANSITION_TABLE)}")
+    print(f"Perfect game: {scoreBalls([MARK_SCORE] * 12)}")
+    print(f"Most points from the start: {getMaxPossibleScore(START_STATE_NUMBER, 0)}")
+
+    if args.verify:
+        start = time.perf_counter()
+        checked = verifyTransitionTable()
+        print(f"Checked {checked} table entries against ScoreSheet in {time.perf_counter() - start:.1f} s")
+
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+# Date: 10/18/26
+# Description: This file is the benchmark suite of the bowling score
+#   system. Every benchmark runs against fixed, seeded workloads: pin rack
+#   updates, frame construction, scoring perfect, all spare, gutter and
+#   random games, score sheet rendering, pin string parsing and memory.
+#   Output that would normally go to the screen is written to os.devnull
+#   while it is timed. Results can be saved as JSON and compared with the
+#   results of an earlier run to find regressions.
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from FrameClass import Frame, TenthFrame
+from PinRackClass import PinRack
+from PinStringParser import parsePinString, parsePinStrings, maskToPinString
+from ScoreSheetClass import ScoreSheet, renderRollList, scoreRollList, SCORE_SHEET_RENDER_CACHE
+import ScoringTable
+
+REPEAT_COUNT = 5
+RENDER_LOOPS = 2000
+PARSE_STRING_COUNT = 100000
+PARSE_LOOPS = 1
+RANDOM_SEED = 300
+MEMORY_GAME_COUNT = 10000
+SCORE_LOOPS = 5000
+PIN_LOOPS = 20000
+FRAME_LOOPS = 20000
+RANDOM_GAME_COUNT = 200
+RANDOM_GAME_LOOPS = 20
+
+# results are compared with an earlier run, all of them are lower-is-better
+RESULTS_FORMAT_VERSION = 1
+TIME_UNIT = "us"
+MEMORY_UNIT = "bytes"
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# example game from ScoreSheetClass.main, entered one ball at a time
+EXAMPLE_BALLS = [10, 9, 0, 5, 5, 10, 0, 0, 2, 4, 10, 9, 1, 10, 10, 9, 1]
+
+# fixed games for the scoring benchmarks
+PERFECT_BALLS = [10] * 12
+ALL_SPARE_BALLS = [5] * 21
+GUTTER_BALLS = [0] * 20
+
+def buildScoreSheet(balls, completeGame=True):
+    """
+    Creates a score sheet with the given balls bowled
+    :param balls (list): The pins knocked down by each ball in order
+    :param completeGame (boolean): True to display the total score
+    :return (ScoreSheet): The score sheet
+    """
+    scoreSheet = ScoreSheet()
+    for pins in balls:
+        scoreSheet.addBowl(pins)
+    scoreSheet.setCompleteGame(completeGame)
+
+    return scoreSheet
+
+def printLegacyBorder(character):
+    """
+    Prints a border one character at a time like the old display did
+    :param character (str): The character the border is made of
+    :return: None
+    """
+    print("+", end="")
+    for i in range(52):
+        print(character, end="")
+    print("+")
+
+    return
+
+def legacyDisplayScoreSheet(scoreSheet):
+    """
+    The score sheet display as it was written before renderScoreSheet,
+        one print call per character or cell, kept for comparison
+    :param scoreSheet (ScoreSheet): The score sheet to display
+    :return: None
+    """
+    printLegacyBorder("=")
+
+    print("+ Frame:", end="")
+    for i in range(1, 11):
+        print(f"| {i} ", end="")
+    print(" |  +")
+
+    printLegacyBorder("-")
+
+    print("+ Score:", end="")
+    for i in range(9):
+        firstBowl = scoreSheet.getNthFrame(i).getFirstBowl()
+        secondBowl = scoreSheet.getNthFrame(i).getSecondBowl()
+        if firstBowl == 10:
+            firstBowl = "X"
+        elif firstBowl + secondBowl == 10:
+            secondBowl = "/"
+        if firstBowl == 0:
+            firstBowl = "-"
+        if secondBowl == 0:
+            secondBowl = "-"
+        if firstBowl == -1:
+            firstBowl = " "
+        if secondBowl == -1:
+            secondBowl = " "
+        print(f"|{firstBowl} {secondBowl}", end="")
+    tenthFrame = scoreSheet.getNthFrame(9)
+    print(f"|{tenthFrame.getFirstBowl()} {tenthFrame.getSecondBowl()} {tenthFrame.getThirdBowl()}|  +")
+
+    printLegacyBorder("-")
+    print(f"+ Total Score: {scoreSheet.calculateScore() : <38}+")
+    printLegacyBorder("=")
+
+    return
+
+def timeCall(function, loops):
+    """
+    Times a function with its output sent to os.devnull
+    :param function (function): The function to time, called without arguments
+    :param loops (int): The amount of calls in each timing
+    :return (float): The best time for one call in microseconds
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        best = min(timeit.repeat(function, number=loops, repeat=REPEAT_COUNT))
+
+    return best / loops * 1e6
+
+def buildRandomBalls(generator):
+    """
+    Creates the balls of a random complete game
+    :param generator (Random): The random generator
+    :return (list): The pins knocked down by each ball in order
+    """
+    scoreSheet = ScoreSheet()
+    balls = []
+
+    while not scoreSheet.getCompleteGame():
+        pins = generator.randint(0, scoreSheet.getPinsStanding())
+        scoreSheet.addBowl(pins)
+        balls.append(pins)
+
+    return balls
+
+def benchmarkPinRack():
+    """
+    Times single pin updates and pin scores on the dictionary pin rack
+    :return (dict): Microseconds per call by benchmark name
+    """
+    pinRack = PinRack()
+
+    def setPins():
+        for pin in range(1, 11):
+            pinRack.setPin(pin, False)
+
+    return {
+        "pinRack.setPin": timeCall(setPins, PIN_LOOPS) / 10,
+        "pinRack.getPinScore": timeCall(pinRack.getPinScore, PIN_LOOPS),
+    }
+
+def benchmarkFrames():
+    """
+    Times creating frames and the frames of a whole game
+    :return (dict): Microseconds per call by benchmark name
+    """
+    return {
+        "frame.construct": timeCall(Frame, FRAME_LOOPS),
+        "tenthFrame.construct": timeCall(TenthFrame, FRAME_LOOPS),
+        "scoreSheet.construct": timeCall(ScoreSheet, FRAME_LOOPS // 10),
+    }
+
+def benchmarkScoring():
+    """
+    Times ScoreSheet.calculateScore on fixed and random games. On the
+        same random games, the transition table is timed against the
+        other ways of scoring a roll list from scratch: scoreRollList
+        and wrapping the rolls in a ScoreSheet
+    :return (dict): Microseconds per game by benchmark name
+    """
+    results = {}
+    for name, balls in (("perfect", PERFECT_BALLS), ("allSpare", ALL_SPARE_BALLS), ("gutter", GUTTER_BALLS)):
+        scoreSheet = buildScoreSheet(balls)
+        results[f"calculateScore.{name}"] = timeCall(scoreSheet.calculateScore, SCORE_LOOPS)
+
+    generator = random.Random(RANDOM_SEED)
+    randomBalls = [buildRandomBalls(generator) for i in range(RANDOM_GAME_COUNT)]
+    scoreSheets = [buildScoreSheet(balls) for balls in randomBalls]
+    rollLists = [scoreSheet.getRollList() for scoreSheet in scoreSheets]
+
+    for scoreSheet, rolls in zip(scoreSheets, rollLists):
+        if ScoringTable.scoreRollList(rolls) != sum(scoreRollList(rolls)):
+            raise AssertionError("table scoring disagrees with scoreRollList")
+        # rows from GameRecordReader.asNumpy and the simulator are int8
+        if ScoreSheet(np.array(rolls, dtype=np.int8)).calculateScore() != scoreSheet.calculateScore():
+            raise AssertionError("a wrapped int8 row disagrees with calculateScore")
+
+    def calculateAll():
+        for scoreSheet in scoreSheets:
+            scoreSheet.calculateScore()
+
+    def tableRolls():
+        for rolls in rollLists:
+            ScoringTable.scoreRollList(rolls)
+
+    def tableBalls():
+        for balls in randomBalls:
+            ScoringTable.scoreBalls(balls)
+
+    def rescoreRolls():
+        for rolls in rollLists:
+            scoreRollList(rolls)
+
+    def addBowls():
+        for balls in randomBalls:
+            buildScoreSheet(balls)
+
+    def wrapRolls():
+        for rolls in rollLists:
+            ScoreSheet(rolls).calculateScore()
+
+    results["calculateScore.random"] = timeCall(calculateAll, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+    results["scoringTable.rolls.random"] = timeCall(tableRolls, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+    results["scoringTable.balls.random"] = timeCall(tableBalls, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+    results["scoreRollList.random"] = timeCall(rescoreRolls, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+    results["addBowl.random"] = timeCall(addBowls, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+    results["scoreSheet.wrapRolls.random"] = timeCall(wrapRolls, RANDOM_GAME_LOOPS) / RANDOM_GAME_COUNT
+
+    return results
+
+def benchmarkRendering():
+    """
+    Times the score sheet display: the old per-character display, one
+        uncached render and write, and displayScoreSheet with a cache hit
+    :return (dict): Microseconds per display by benchmark name
+    """
+    scoreSheet = buildScoreSheet(EXAMPLE_BALLS)
+
+    def uncachedDisplay():
+        SCORE_SHEET_RENDER_CACHE.clear()
+        scoreSheet.displayScoreSheet()
+
+    return {
+        "display.perCharacter": timeCall(lambda: legacyDisplayScoreSheet(scoreSheet), RENDER_LOOPS),
+        "display.singleWrite": timeCall(lambda: print(renderRollList(scoreSheet.getRollList(),
+                                                                     scoreSheet.calculateScore()), end=""),
+                                        RENDER_LOOPS),
+        "displayScoreSheet.uncached": timeCall(uncachedDisplay, RENDER_LOOPS),
+        "displayScoreSheet.cached": timeCall(scoreSheet.displayScoreSheet, RENDER_LOOPS),
+    }
+
+def legacyParsePinString(pinRack, pinsDownedInput):
+    """
+    The pin string parsing getPinsInput used before PinStringParser,
+        rescanning every pin read so far for each character
+    :param pinRack (PinRack): The rack the pins are knocked down on
+    :param pinsDownedInput (str): The pin string
+    :return: None
+    """
+    pinsDownList = []
+
+    for char in pinsDownedInput:
+        if char == "X":
+            pinsDownList.append(10)
+            pinRack.setPin(10, False)
+        else:
+            pinsDownList.append(int(char))
+            for pin in pinsDownList:
+                pinRack.setPin(pin, False)
+
+    return
+
+def buildPinStrings(count):
+    """
+    Creates random pin strings like the ones lane sensors send
+    :param count (int): The amount of strings to create
+    :return (list): The pin strings
+    """
+    generator = random.Random(RANDOM_SEED)
+
+    return [maskToPinString(generator.getrandbits(10)) for i in range(count)]
+
+def benchmarkPinParsing():
+    """
+    Times per-character pin parsing and the table driven parser
+    :return (dict): Microseconds per pin string by benchmark name
+    """
+    pinStrings = buildPinStrings(PARSE_STRING_COUNT)
+    pinRack = PinRack()
+
+    def legacyParse():
+        for pinString in pinStrings:
+            legacyParsePinString(pinRack, pinString)
+
+    def singleParse():
+        for pinString in pinStrings:
+            parsePinString(pinString)
+
+    return {
+        "pinString.perCharacter": timeCall(legacyParse, PARSE_LOOPS) / PARSE_STRING_COUNT,
+        "parsePinString": timeCall(singleParse, PARSE_LOOPS) / PARSE_STRING_COUNT,
+        "parsePinStrings": timeCall(lambda: parsePinStrings(pinStrings), PARSE_LOOPS) / PARSE_STRING_COUNT,
+    }
+
+class DictFrame:
+    def __init__(self):
+        """
+        Constructor:
+        A frame with the same attributes as Frame kept in a
+            per-instance __dict__, the layout before __slots__
+        """
+        self.bowled = False
+        self.firstBowl = -1
+        self.secondBowl = -1
+        self.frameScore = 0
+        self.strike = False
+        self.spare = False
+
+class DictTenthFrame(DictFrame):
+    def __init__(self):
+        """
+        Constructor:
+        A tenth frame with the attributes of TenthFrame in a __dict__
+        """
+        DictFrame.__init__(self)
+        self.thirdBowl = -1
+        self.firstStrike = False
+        self.secondStrike = False
+        self.thirdStrike = False
+
+def measureBytesPerGame(createGame):
+    """
+    Measures the memory allocated for each game
+    :param createGame (function): Creates the objects of one game
+    :return (float): The bytes allocated per game
+    """
+    tracemalloc.start()
+    games = [createGame() for i in range(MEMORY_GAME_COUNT)]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del games
+
+    return allocated / MEMORY_GAME_COUNT
+
+def benchmarkMemory():
+    """
+    Measures the memory of a game's frames with and without __slots__,
+        and of score sheets that are empty or wrap a game's rolls
+    :return (dict): Bytes per game by benchmark name
+    """
+    perfectRolls = buildScoreSheet(PERFECT_BALLS).getRollList()
+
+    return {
+        "memory.dictFrames": measureBytesPerGame(lambda: [DictFrame() for i in range(9)] + [DictTenthFrame()]),
+        "memory.slottedFrames": measureBytesPerGame(lambda: [Frame() for i in range(9)] + [TenthFrame()]),
+        "memory.scoreSheet": measureBytesPerGame(ScoreSheet),
+        "memory.scoreSheet.wrapped": measureBytesPerGame(lambda: ScoreSheet(perfectRolls)),
+    }
+
+# every benchmark group with the unit of its results
+BENCHMARKS = {
+    "pins": (benchmarkPinRack, TIME_UNIT),
+    "frames": (benchmarkFrames, TIME_UNIT),
+    "scoring": (benchmarkScoring, TIME_UNIT),
+    "rendering": (benchmarkRendering, TIME_UNIT),
+    "parsing": (benchmarkPinParsing, TIME_UNIT),
+    "memory": (benchmarkMemory, MEMORY_UNIT),
+}
+
+def runBenchmarks(groups):
+    """
+    Runs benchmark groups
+    :param groups (list): The names of the groups to run, in order
+    :return (dict): The value and unit of every result by benchmark name
+    """
+    results = {}
+    for group in groups:
+        function, unit = BENCHMARKS[group]
+        for name, value in function().items():
+            results[name] = {"value": round(value, 4), "unit": unit}
+
+    return results
+
+def saveResults(results, path):
+    """
+    Saves results as JSON along with the machine they were measured on
+    :param results (dict): The results from runBenchmarks
+    :param path (str): The path of the JSON file
+    :return: None
+    """
+    document = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+    return
+
+def loadResults(path):
+    """
+    Loads the results of an earlier run
+    :param path (str): The path of the JSON file
+    :return (dict): The results by benchmark name
+    """
+    with open(path) as file:
+        document = json.load(file)
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_FORMAT_VERSION} benchmark results file")
+
+    return document["results"]
+
+def printResults(results, previous=None, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    Prints results, and their change from an earlier run when given
+    :param results (dict): The results from runBenchmarks
+    :param previous (dict): The results of an earlier run, or None
+    :param threshold (float): The fraction slower that counts as a regression
+    :return (list): The names of the results that regressed
+    """
+    regressions = []
+
+    for name, result in results.items():
+        line = f"{name:<28}{result['value']:12.3f} {result['unit']:<6}"
+        earlier = (previous or {}).get(name)
+        if earlier is not None and earlier["unit"] == result["unit"] and earlier["value"] > 0:
+            change = result["value"] / earlier["value"] - 1
+            line += f"{change:+8.1%}"
+            if change > threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    return regressions
+
+def main(argv=None):
+    """
+    Command line entry point: runs the benchmarks, prints the results
+        and optionally saves them or compares them with an earlier run
+    :param argv (list): The command line arguments, sys.argv is used if None
+    :return (int): 1 if --fail-on-regression is given and a result regressed, otherwise 0
+    """
+    parser = argparse.ArgumentParser(description="Bowling score system benchmarks")
+    parser.add_argument("groups", nargs="*",
+                        help=f"benchmark groups to run, all of them if none are given: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="fraction slower that counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if any result regressed")
+    args = parser.parse_args(argv)
+
+    for group in args.groups:
+        if group not in BENCHMARKS:
+            parser.error(f"unknown benchmark group {group!r}")
+
+    previous = loadResults(args.compare) if args.compare else None
+    results = runBenchmarks(args.groups or list(BENCHMARKS))
+    regressions = printResults(results, previous, args.threshold)
+
+    if args.output:
+        saveResults(results, args.output)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
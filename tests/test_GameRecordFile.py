@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from GameRecordFile import GameRecordReader, GameRecordWriter, recordGame
+
+PERFECT_GAME = [0b1111111111] * 12
+
+@pytest.fixture
+def recordPath(tmp_path):
+    path = tmp_path / "games.bwl"
+    with GameRecordWriter(path, includeLeaves=True) as writer:
+        rolls, leaves = recordGame(PERFECT_GAME)
+        writer.writeGame(rolls, leaves)
+
+    return path
+
+def test_views_stay_usable_after_the_reader_closes(recordPath):
+    with GameRecordReader(recordPath) as reader:
+        rolls = reader.getRolls(0)
+        leaves = reader.getLeaves(0)
+        scoreSheet = reader.getScoreSheet(0)
+        numpyRolls, numpyLeaves = reader.asNumpy()
+        cumulativeScores, totals = reader.scoreAll()
+
+    assert reader.file.closed
+    assert rolls.tolist() == [10, -1] * 9 + [10, 10, 10]
+    assert leaves[0] == 0
+    assert scoreSheet.calculateScore() == 300
+    assert np.array_equal(numpyRolls[0], rolls.tolist())
+    assert totals.tolist() == [300]
+
+def test_exceptions_in_the_with_block_are_not_replaced(recordPath):
+    with pytest.raises(KeyError):
+        with GameRecordReader(recordPath) as reader:
+            rolls = reader.getRolls(0)
+            raise KeyError("from the with block")
+
+    assert reader.file.closed
+    assert rolls[0] == 10
+
+def test_close_unmaps_when_nothing_is_held(recordPath):
+    reader = GameRecordReader(recordPath)
+    reader.getRolls(0)
+    reader.close()
+
+    assert reader.map.closed
+    assert reader.file.closed
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from ScoreSheetStoreClass import ScoreSheetStore
+
+PERFECT_GAME = [10, -1] * 9 + [10, 10, 10]
+OPEN_FRAME_ONLY = [1, 2] + [-1] * 19
+
+def test_completion_comes_from_the_rolls():
+    store = ScoreSheetStore()
+    store.addRollList(PERFECT_GAME)
+    store.addRollList(OPEN_FRAME_ONLY)
+
+    assert store.getGame(0).getCompleteGame()
+    assert store.getGame(0).getTotalScore() == 300
+    assert not store.getGame(1).getCompleteGame()
+    assert store.getGame(1).getTotalScore() == 3
+
+@pytest.mark.parametrize("rolls", [[10] * 21, [11] + [-1] * 20, [1, -1, 2] + [-1] * 18, [1, 2]])
+def test_illegal_games_are_rejected_without_changing_the_store(rolls):
+    store = ScoreSheetStore()
+    store.addRollList(PERFECT_GAME)
+
+    with pytest.raises(ValueError):
+        store.addRollList(rolls)
+
+    assert (len(store), len(store.rolls), len(store.cumulativeScores)) == (1, 21, 10)
+
+def test_roll_array_matches_roll_list():
+    listStore = ScoreSheetStore()
+    arrayStore = ScoreSheetStore()
+    for rolls in (PERFECT_GAME, OPEN_FRAME_ONLY):
+        listStore.addRollList(rolls)
+    arrayStore.addRollArray(np.array([PERFECT_GAME, OPEN_FRAME_ONLY]))
+
+    for listColumn, arrayColumn in zip(listStore.asNumpy(), arrayStore.asNumpy()):
+        assert np.array_equal(listColumn, arrayColumn)
+
+    with pytest.raises(ValueError):
+        arrayStore.addRollArray(np.array([PERFECT_GAME, [10] * 21]))
+    assert len(arrayStore) == 2
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+import ScoreSheetClass
+import ScoringTable
+
+RANDOM_SEED = 300
+RANDOM_GAME_COUNT = 500
+
+def test_every_table_entry_matches_score_sheet():
+    checked = ScoringTable.verifyTransitionTable()
+
+    assert checked == len(ScoringTable.SCORING_STATES) * ScoringTable.PIN_VALUE_COUNT
+
+def test_verify_finds_a_wrong_entry(monkeypatch):
+    table = list(ScoringTable.TRANSITION_TABLE)
+    strike = ScoringTable.START_STATE_NUMBER * ScoringTable.PIN_VALUE_COUNT + ScoringTable.MARK_SCORE
+    table[strike] += 1  # count the first strike twice
+    monkeypatch.setattr(ScoringTable, "TRANSITION_TABLE", tuple(table))
+
+    with pytest.raises(AssertionError):
+        ScoringTable.verifyTransitionTable()
+
+def test_random_games_match_score_sheet():
+    generator = random.Random(RANDOM_SEED)
+
+    for i in range(RANDOM_GAME_COUNT):
+        scoreSheet = ScoreSheetClass.ScoreSheet()
+        balls = []
+        maxScores = []
+        while not scoreSheet.getCompleteGame():
+            balls.append(generator.randint(0, scoreSheet.getPinsStanding()))
+            scoreSheet.addBowl(balls[-1])
+            maxScores.append(scoreSheet.getMaxPossibleScore())
+
+        rolls = scoreSheet.getRollList()
+        total = sum(ScoreSheetClass.scoreRollList(rolls))
+        assert ScoringTable.scoreBalls(balls) == total
+        assert ScoringTable.walkRollList(rolls) == (ScoringTable.DONE_STATE_NUMBER, total)
+        assert min(maxScores) >= total